@@ -46,6 +46,10 @@ def main() -> None:
 
     root.mainloop()
 
+    # per-endpoint request metrics of this run, e.g. metrics/run-20250101-120000.json
+    # (compare two runs with: python metrics.py OLD.json NEW.json)
+    app.metrics.dump()
+
 # main guard
 if __name__ == "__main__":
     main()
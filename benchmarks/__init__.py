@@ -0,0 +1,2 @@
+# benchmarks/__init__.py
+# empty on purpose, lets you run `python -m benchmarks.<name>` from the project root
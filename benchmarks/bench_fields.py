@@ -0,0 +1,185 @@
+# benchmarks/bench_fields.py
+# Bytes on the wire + parse time for playlistItems.list / playlists.list pages,
+# full response vs the fields= masks YouTubeClient sends. No network, no display:
+# the pages are synthetic copies of what the API returns for part=snippet,contentDetails
+# (and snippet,contentDetails,status), and the mask is applied here the way Google does.
+# Run from the project root:
+#   python -m benchmarks.bench_fields
+import json
+import time
+from typing import Any, Dict, List
+
+from models import Playlist, PlaylistItem
+from youtube_client import (
+    PAGE_SIZE,
+    PLAYLISTS_FIELDS,
+    PLAYLIST_ITEMS_FIELDS,
+    _list_fields,
+    _split_top_level,
+)
+
+ITEMS = 5_000  # one big playlist, 100 pages
+PLAYLISTS = 200
+REPEATS = 5
+
+
+# ----------------------------------------------------------------------
+# Synthetic API responses
+# ----------------------------------------------------------------------
+
+def _thumbnails(video_id: str) -> Dict[str, Any]:
+    sizes = {"default": (120, 90), "medium": (320, 180), "high": (480, 360),
+             "standard": (640, 480), "maxres": (1280, 720)}
+    return {
+        name: {"url": f"https://i.ytimg.com/vi/{video_id}/{name}.jpg", "width": w, "height": h}
+        for name, (w, h) in sizes.items()
+    }
+
+
+def playlist_item(playlist_id: str, position: int) -> Dict[str, Any]:
+    video_id = f"v{position:010d}"
+    return {
+        "kind": "youtube#playlistItem",
+        "etag": f"etag-{playlist_id}-{position:06d}-xxxxxxxxxxxxxx",
+        "id": f"UEx{playlist_id}{position:08d}LjU2QjQ0RjZEMTA1NTdDQzY",
+        "snippet": {
+            "publishedAt": "2024-03-01T12:34:56Z",
+            "channelId": "UC_x5XG1OV2P6uZZ5FSM9Ttw",
+            "title": f"Some fairly typical video title, episode {position}",
+            "description": "A description that goes on for a while, with links and hashtags. " * 8,
+            "thumbnails": _thumbnails(video_id),
+            "channelTitle": "My Channel",
+            "playlistId": playlist_id,
+            "position": position,
+            "resourceId": {"kind": "youtube#video", "videoId": video_id},
+            "videoOwnerChannelTitle": "Uploader Channel",
+            "videoOwnerChannelId": "UCyyyyyyyyyyyyyyyyyyyyyy",
+        },
+        "contentDetails": {"videoId": video_id, "videoPublishedAt": "2023-11-11T11:11:11Z"},
+    }
+
+
+def playlist(index: int) -> Dict[str, Any]:
+    playlist_id = f"PL{index:032d}"
+    return {
+        "kind": "youtube#playlist",
+        "etag": f"etag-{playlist_id}",
+        "id": playlist_id,
+        "snippet": {
+            "publishedAt": "2022-01-01T00:00:00Z",
+            "channelId": "UC_x5XG1OV2P6uZZ5FSM9Ttw",
+            "title": f"Playlist number {index}",
+            "description": "What this playlist is about. " * 5,
+            "thumbnails": _thumbnails(f"p{index}"),
+            "channelTitle": "My Channel",
+            "localized": {"title": f"Playlist number {index}", "description": "What this playlist is about. " * 5},
+        },
+        "contentDetails": {"itemCount": 25},
+        "status": {"privacyStatus": "private"},
+    }
+
+
+def pages(items: List[Dict[str, Any]], kind: str) -> List[Dict[str, Any]]:
+    out = []
+    for start in range(0, len(items), PAGE_SIZE):
+        page = {
+            "kind": kind,
+            "etag": f"page-etag-{start}",
+            "pageInfo": {"totalResults": len(items), "resultsPerPage": PAGE_SIZE},
+            "items": items[start:start + PAGE_SIZE],
+        }
+        if start + PAGE_SIZE < len(items):
+            page["nextPageToken"] = f"CDIQAA{start + PAGE_SIZE}"
+        out.append(page)
+    return out
+
+
+# ----------------------------------------------------------------------
+# fields= projection (what the server does with the mask)
+# ----------------------------------------------------------------------
+
+def _parse_mask(fields: str) -> Dict[str, Any]:
+    """'a,b(c,d/e)' -> {'a': {}, 'b': {'c': {}, 'd': {'e': {}}}}; {} means 'whole value'."""
+    tree: Dict[str, Any] = {}
+    for part in _split_top_level(fields):
+        sub = ""
+        if part.endswith(")"):
+            part, sub = part[:-1].split("(", 1)
+        node = tree
+        for name in part.split("/"):
+            node = node.setdefault(name, {})
+        if sub:
+            node.update(_parse_mask(sub))
+    return tree
+
+
+def _project(value: Any, mask: Dict[str, Any]) -> Any:
+    if not mask:
+        return value
+    if isinstance(value, list):
+        return [_project(v, mask) for v in value]
+    if not isinstance(value, dict):
+        return value
+    return {k: _project(value[k], sub) for k, sub in mask.items() if k in value}
+
+
+def apply_fields(response: Dict[str, Any], fields: str) -> Dict[str, Any]:
+    return _project(response, _parse_mask(fields))
+
+
+# ----------------------------------------------------------------------
+# Measuring
+# ----------------------------------------------------------------------
+
+def measure(bodies: List[bytes], convert) -> tuple:
+    """(total bytes, best-of-REPEATS seconds to json-decode + convert every page)"""
+    size = sum(len(b) for b in bodies)
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        for body in bodies:
+            for item in json.loads(body).get("items", []):
+                convert(item)
+        best = min(best, time.perf_counter() - start)
+    return size, best
+
+
+def compare(label: str, full_pages: List[Dict[str, Any]], fields: str, convert) -> None:
+    mask = _list_fields(fields)
+    full = [json.dumps(p).encode("utf-8") for p in full_pages]
+    masked = [json.dumps(apply_fields(p, mask)).encode("utf-8") for p in full_pages]
+
+    # the masked response must still build the exact same records
+    for a, b in zip(full_pages, masked):
+        assert [convert(i) for i in a["items"]] == [convert(i) for i in json.loads(b)["items"]]
+
+    full_bytes, full_time = measure(full, convert)
+    masked_bytes, masked_time = measure(masked, convert)
+    print(f"{label}  ({len(full_pages)} pages)")
+    print(f"  fields={mask}")
+    print(f"  {'':<8}{'bytes':>12}{'parse ms':>12}")
+    print(f"  {'full':<8}{full_bytes:>12,}{full_time * 1000:>12.1f}")
+    print(f"  {'masked':<8}{masked_bytes:>12,}{masked_time * 1000:>12.1f}")
+    print(f"  -> {masked_bytes / full_bytes:.1%} of the bytes, {masked_time / full_time:.1%} of the parse time\n")
+
+
+def main() -> None:
+    items = [playlist_item("PLbench", i) for i in range(ITEMS)]
+    compare(
+        f"playlistItems.list, {ITEMS:,} items",
+        pages(items, "youtube#playlistItemListResponse"),
+        PLAYLIST_ITEMS_FIELDS,
+        PlaylistItem.from_resource,
+    )
+
+    playlists = [playlist(i) for i in range(PLAYLISTS)]
+    compare(
+        f"playlists.list, {PLAYLISTS:,} playlists",
+        pages(playlists, "youtube#playlistListResponse"),
+        PLAYLISTS_FIELDS,
+        Playlist.from_resource,
+    )
+
+
+if __name__ == "__main__":
+    main()
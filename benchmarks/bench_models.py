@@ -0,0 +1,150 @@
+# benchmarks/bench_models.py
+# Memory held by a 50k item library (playlists + their items + some search results)
+# as the old ad-hoc dicts vs the slotted records in models.py. No network, no display.
+# Pages are json.loads'ed one at a time and dropped, like YouTubeClient does, so only
+# what the app keeps around is counted. Run from the project root:
+#   python -m benchmarks.bench_models
+import json
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from models import Playlist, PlaylistItem, SearchResult
+from youtube_client import PAGE_SIZE
+
+PLAYLISTS = 250
+ITEMS_PER_PLAYLIST = 200  # 50,000 items
+DISTINCT_VIDEOS = 20_000  # the same video sits in a few playlists
+SEARCH_RESULTS = 1_000
+CHANNELS = 40
+
+
+# ----------------------------------------------------------------------
+# What YouTubeClient used to build (before models.py)
+# ----------------------------------------------------------------------
+
+def playlist_dict(item: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": item.get("id"),
+        "title": item.get("snippet", {}).get("title"),
+        "item_count": item.get("contentDetails", {}).get("itemCount"),
+        "privacy_status": item.get("status", {}).get("privacyStatus"),
+    }
+
+
+def playlist_item_dict(it: Dict[str, Any]) -> Dict[str, Any]:
+    snippet = it.get("snippet", {})
+    content = it.get("contentDetails", {})
+    return {
+        "playlist_item_id": it.get("id"),
+        "video_id": content.get("videoId"),
+        "title": snippet.get("title"),
+        "position": snippet.get("position"),
+    }
+
+
+def search_result_dict(item: Dict[str, Any]) -> Dict[str, Any]:
+    snippet = item.get("snippet", {})
+    return {
+        "video_id": item.get("id", {}).get("videoId"),
+        "title": snippet.get("title"),
+        "channel_title": snippet.get("channelTitle"),
+    }
+
+
+# ----------------------------------------------------------------------
+# Response bodies (already masked with fields=, as sent by the client)
+# ----------------------------------------------------------------------
+
+def _bodies(resources: List[Dict[str, Any]]) -> List[bytes]:
+    return [
+        json.dumps({"items": resources[i:i + PAGE_SIZE]}).encode("utf-8")
+        for i in range(0, len(resources), PAGE_SIZE)
+    ]
+
+
+def playlist_bodies() -> List[bytes]:
+    return _bodies([
+        {
+            "id": f"PL{p:032d}",
+            "snippet": {"title": f"Playlist {p}"},
+            "contentDetails": {"itemCount": ITEMS_PER_PLAYLIST},
+            "status": {"privacyStatus": ("private", "unlisted", "public")[p % 3]},
+        }
+        for p in range(PLAYLISTS)
+    ])
+
+
+def item_bodies(playlist_index: int) -> List[bytes]:
+    resources = []
+    for pos in range(ITEMS_PER_PLAYLIST):
+        video = (playlist_index * 97 + pos * 13) % DISTINCT_VIDEOS
+        resources.append({
+            "id": f"UExQ{playlist_index:06d}{pos:06d}LjU2QjQ0RjZEMTA1NTdDQzY",
+            "snippet": {"title": f"Video title number {video}", "position": pos},
+            "contentDetails": {"videoId": f"v{video:010d}"},
+        })
+    return _bodies(resources)
+
+
+def search_bodies() -> List[bytes]:
+    return _bodies([
+        {
+            "id": {"videoId": f"s{i:010d}"},
+            "snippet": {"title": f"Search hit {i}", "channelTitle": f"Channel {i % CHANNELS}"},
+        }
+        for i in range(SEARCH_RESULTS)
+    ])
+
+
+# ----------------------------------------------------------------------
+# Measuring
+# ----------------------------------------------------------------------
+
+def load_library(
+    playlist_conv: Callable, item_conv: Callable, search_conv: Callable,
+    bodies: Dict[str, Any],
+) -> Dict[str, Any]:
+    library = {"playlists": [], "items": {}, "search": []}
+    for body in bodies["playlists"]:
+        library["playlists"].extend(playlist_conv(r) for r in json.loads(body)["items"])
+    for index, pages in enumerate(bodies["items"]):
+        items = library["items"].setdefault(index, [])
+        for body in pages:
+            items.extend(item_conv(r) for r in json.loads(body)["items"])
+    for body in bodies["search"]:
+        library["search"].extend(search_conv(r) for r in json.loads(body)["items"])
+    return library
+
+
+def retained_bytes(*convs: Callable, bodies: Dict[str, Any]) -> int:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    library = load_library(*convs, bodies=bodies)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del library
+    return after - before
+
+
+def main() -> None:
+    bodies = {
+        "playlists": playlist_bodies(),
+        "items": [item_bodies(p) for p in range(PLAYLISTS)],
+        "search": search_bodies(),
+    }
+    total_items = PLAYLISTS * ITEMS_PER_PLAYLIST
+    print(f"{PLAYLISTS} playlists, {total_items:,} items, {SEARCH_RESULTS:,} search results\n")
+
+    as_dicts = retained_bytes(playlist_dict, playlist_item_dict, search_result_dict, bodies=bodies)
+    as_records = retained_bytes(
+        Playlist.from_resource, PlaylistItem.from_resource, SearchResult.from_resource,
+        bodies=bodies,
+    )
+    print(f"{'':<10}{'MiB':>8}{'bytes/item':>12}")
+    for label, size in (("dicts", as_dicts), ("records", as_records)):
+        print(f"{label:<10}{size / 2**20:>8.1f}{size / total_items:>12.0f}")
+    print(f"\nrecords use {as_records / as_dicts:.0%} of the dict footprint")
+
+
+if __name__ == "__main__":
+    main()
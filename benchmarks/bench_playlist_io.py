@@ -0,0 +1,134 @@
+# benchmarks/bench_playlist_io.py
+# Export / import throughput of playlist_io on a 20k row playlist, JSONL and CSV.
+# No network: a stand-in client serves pre-built, already masked JSON pages (decoded
+# one at a time like YouTubeClient does) and answers batch inserts instantly, so this
+# measures our side only - formatting, parsing, chunking - plus peak memory, which
+# should stay at about one page however big the playlist is. Run from the project root:
+#   python -m benchmarks.bench_playlist_io
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Dict, Iterator, List, Sequence
+
+from models import PlaylistItem
+from playlist_io import ItemWriter, export_to_file, import_file
+from youtube_client import BATCH_SIZE, PAGE_SIZE, QUOTA_COST
+
+ROWS = 20_000
+ALREADY_PRESENT = 0.10  # share of the file the import target already has
+PLAYLIST_ID = "PLbench"
+TARGET_ID = "PLtarget"
+
+
+class StandInClient:
+    """Just the YouTubeClient methods playlist_io calls, without HTTP."""
+
+    def __init__(self, bodies: List[bytes], present: Sequence[str] = ()) -> None:
+        self.bodies = bodies
+        self.present = set(present)
+        self.batch_calls = 0
+
+    def iter_playlist_item_pages(self, playlist_id: str) -> Iterator[List[PlaylistItem]]:
+        for body in self.bodies:
+            yield [PlaylistItem.from_resource(r) for r in json.loads(body)["items"]]
+
+    def list_playlist_items(self, playlist_id: str) -> List[PlaylistItem]:
+        return [it for page in self.iter_playlist_item_pages(playlist_id) for it in page]
+
+    def insert_playlist_items(self, playlist_id, video_ids, should_stop=None, skip_existing=False):
+        results = []
+        to_insert = []
+        for vid in video_ids:
+            if skip_existing and vid in self.present:
+                results.append({"key": vid, "ok": True, "skipped": True})
+            else:
+                self.present.add(vid)
+                to_insert.append(vid)
+                results.append({"key": vid, "ok": True})
+        self.batch_calls += -(-len(to_insert) // BATCH_SIZE)
+        return results
+
+
+def item_bodies() -> List[bytes]:
+    resources = [
+        {
+            "id": f"UExQ{pos:08d}LjU2QjQ0RjZEMTA1NTdDQzY",
+            "snippet": {"title": f"Video title, number {pos} \"quoted\"", "position": pos},
+            "contentDetails": {"videoId": f"v{pos:010d}"},
+        }
+        for pos in range(ROWS)
+    ]
+    return [
+        json.dumps({"items": resources[i:i + PAGE_SIZE]}).encode("utf-8")
+        for i in range(0, ROWS, PAGE_SIZE)
+    ]
+
+
+def measure(fn) -> Dict[str, Any]:
+    # timed without tracemalloc (it slows allocation down a lot), then run again for the peak
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {"result": result, "seconds": elapsed, "peak": peak}
+
+
+def export_in_memory(client: StandInClient, path: str) -> int:
+    # the old data path: the whole playlist as one list, then written out
+    items = client.list_playlist_items(PLAYLIST_ID)
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        ItemWriter(f, "jsonl").write_page(PLAYLIST_ID, items)
+    return len(items)
+
+
+def row(label: str, m: Dict[str, Any], rows: int) -> None:
+    print(f"{label:<28}{m['seconds'] * 1000:>9.0f}{rows / m['seconds']:>12,.0f}{m['peak'] / 2**20:>10.2f}")
+
+
+def main() -> None:
+    bodies = item_bodies()
+    print(f"{ROWS:,} rows, {len(bodies)} pages of {PAGE_SIZE}\n")
+    print(f"{'':<28}{'ms':>9}{'rows/s':>12}{'peak MiB':>10}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        m = measure(lambda: export_in_memory(StandInClient(bodies), os.path.join(tmp, "all.jsonl")))
+        row("export, whole list (old)", m, ROWS)
+
+        paths = {}
+        for fmt in ("jsonl", "csv"):
+            path = paths[fmt] = os.path.join(tmp, f"backup.{fmt}")
+            m = measure(lambda: export_to_file(StandInClient(bodies), [PLAYLIST_ID], path))
+            assert m["result"] == ROWS
+            row(f"export, streamed {fmt}", m, ROWS)
+
+        present = [f"v{pos:010d}" for pos in range(0, ROWS, int(1 / ALREADY_PRESENT))]
+        for fmt, path in paths.items():
+            def run_import():
+                nonlocal client
+                client = StandInClient([], present)
+                return import_file(client, TARGET_ID, path)
+
+            client = None
+            m = measure(run_import)
+            summary = m["result"]
+            assert summary["read"] == ROWS and summary["failed"] == 0
+            row(f"import, streamed {fmt}", m, ROWS)
+
+        size = {fmt: os.path.getsize(p) for fmt, p in paths.items()}
+
+    unit = QUOTA_COST["playlistItems.insert"]
+    print(f"\nfile size: jsonl {size['jsonl'] / 2**20:.2f} MiB, csv {size['csv'] / 2**20:.2f} MiB")
+    print(
+        f"import: {summary['inserted']:,} inserted in {client.batch_calls} batch HTTP calls "
+        f"(instead of {summary['inserted']:,} single calls), {summary['skipped']:,} already present "
+        f"skipped = {summary['skipped'] * unit:,} quota units saved"
+    )
+
+
+if __name__ == "__main__":
+    main()
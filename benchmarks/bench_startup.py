@@ -0,0 +1,87 @@
+# benchmarks/bench_startup.py
+# Cold-start time: importing ui.home (everything app.py pulls in) and the first paint
+# of HomePage, each run in a fresh interpreter. Also fails (exit 1) if one of the heavy
+# Google libraries got imported at startup again, they belong behind sign-in.
+# First paint needs a display; without one only the import time is reported.
+# Run from the project root:
+#   python -m benchmarks.bench_startup
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+RUNS = 7
+
+# must NOT be in sys.modules before the user clicks "Sign in"
+HEAVY_MODULES = (
+    "googleapiclient.discovery",
+    "google_auth_oauthlib",
+    "google.auth.transport.requests",
+    "google_auth_httplib2",
+    "httplib2",
+)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# runs in the child interpreter, prints one JSON line
+CHILD = """
+import json, sys, time
+start = time.perf_counter()
+import tkinter as tk
+import app
+from ui.home import HomePage
+imported = time.perf_counter()
+
+heavy = [m for m in %(heavy)r if m in sys.modules]
+paint = None
+try:
+    root = tk.Tk()
+except tk.TclError:
+    root = None  # no display
+if root is not None:
+    app.configure_style(root)
+    page = HomePage(master=root)
+    page.pack(fill="both", expand=True)
+    root.update()
+    paint = time.perf_counter() - start
+    page.tasks.shutdown()
+    root.destroy()
+
+print(json.dumps({"import": imported - start, "paint": paint, "heavy": heavy}))
+"""
+
+
+def run_once(workdir: str) -> dict:
+    env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    # cwd is a scratch dir so HomePage doesn't touch the real ledger / jobs files
+    out = subprocess.run(
+        [sys.executable, "-c", CHILD % {"heavy": HEAVY_MODULES}],
+        cwd=workdir, env=env, capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as workdir:
+        runs = [run_once(workdir) for _ in range(RUNS)]
+
+    imports = [r["import"] * 1000 for r in runs]
+    print(f"{RUNS} fresh interpreters")
+    print(f"  import ui.home      median {statistics.median(imports):7.1f} ms  (min {min(imports):.1f})")
+    paints = [r["paint"] * 1000 for r in runs if r["paint"] is not None]
+    if paints:
+        print(f"  first paint         median {statistics.median(paints):7.1f} ms  (min {min(paints):.1f})")
+    else:
+        print("  first paint         skipped (no display)")
+
+    heavy = sorted({m for r in runs for m in r["heavy"]})
+    if heavy:
+        print(f"\nREGRESSION: imported at startup: {', '.join(heavy)}")
+        sys.exit(1)
+    print("\nno Google client libraries imported before sign-in")
+
+
+if __name__ == "__main__":
+    main()
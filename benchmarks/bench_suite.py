@@ -0,0 +1,163 @@
+# benchmarks/bench_suite.py
+# The main client paths at 100 / 1k / 10k / 50k items against benchmarks/fake_youtube.py,
+# so no Google account and no quota needed:
+#   list_playlists, list_playlist_items (cold and revalidated with 304s),
+#   video_details (cold and cached), insert_playlist_items / delete_playlist_items
+#   (batched), VirtualTable refresh.
+# Plus two failure scenarios (transient 503s, running out of quota).
+# --latency adds a simulated network round-trip time (seconds), default 0 = only our
+# own overhead. VirtualTable needs a display, it is skipped without one.
+# Run from the project root:
+#   python -m benchmarks.bench_suite [--latency 0.05] [--sizes 100,1000]
+import argparse
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.fake_youtube import FakeYouTube, fake_client
+from models import PlaylistItem
+
+SIZES = (100, 1_000, 10_000, 50_000)
+
+# playlists in the account for list_playlists (a big account, not `size` playlists)
+PLAYLIST_COUNTS = {100: 5, 1_000: 20, 10_000: 100, 50_000: 400}
+
+
+def timed(fn: Callable[[], Any]) -> Dict[str, Any]:
+    start = time.perf_counter()
+    result = fn()
+    return {"seconds": time.perf_counter() - start, "result": result}
+
+
+def bench_size(size: int, latency: float) -> Dict[str, Dict[str, Any]]:
+    rows: Dict[str, Dict[str, Any]] = {}
+
+    def record(name: str, service: FakeYouTube, fn: Callable[[], Any]) -> Any:
+        service.reset_counters()
+        run = timed(fn)
+        rows[name] = {"seconds": run["seconds"], "requests": service.requests, "units": service.units}
+        return run["result"]
+
+    with tempfile.TemporaryDirectory() as workdir:
+        service = FakeYouTube(latency=latency)
+        for i in range(PLAYLIST_COUNTS.get(size, max(1, size // 125))):
+            service.add_playlist(f"Playlist {i}", n_items=3)
+        source = service.add_playlist("Source", n_items=size)
+        target = service.add_playlist("Target")
+        client = fake_client(service, workdir, cached=True)
+
+        record("list_playlists", service, client.list_playlists)
+        items = record("list_playlist_items", service, lambda: client.list_playlist_items(source))
+        assert len(items) == size
+        record("list_playlist_items (304s)", service, lambda: client.list_playlist_items(source))
+
+        video_ids = [it.video_id for it in items]
+        details = record("video_details", service, lambda: client.video_details(video_ids))
+        assert len(details) == size
+        record("video_details (cached)", service, lambda: client.video_details(video_ids))
+
+        results = record("insert_playlist_items", service,
+                         lambda: client.insert_playlist_items(target, video_ids))
+        assert all(r["ok"] for r in results)
+        inserted = [r["item"].playlist_item_id for r in results]
+        results = record("delete_playlist_items", service,
+                         lambda: client.delete_playlist_items(inserted))
+        assert all(r["ok"] for r in results)
+
+        rows["VirtualTable.set_rows"] = {"seconds": table_refresh(items)}
+    return rows
+
+
+_root = None
+
+
+def table_refresh(items: List[PlaylistItem]) -> Optional[float]:
+    """set_rows + first paint of the playlist table, None without a display."""
+    global _root
+    import tkinter as tk
+
+    from ui.virtual_table import VirtualTable
+
+    if _root is None:
+        try:
+            _root = tk.Tk()
+        except tk.TclError:
+            _root = False
+        else:
+            _root.geometry("1000x700")
+    if not _root:
+        return None
+
+    table = VirtualTable(
+        _root,
+        columns=("title", "video_id", "position"),
+        key=lambda item: item.playlist_item_id,
+        values=lambda item: (item.title, item.video_id, item.position),
+    )
+    table.pack(fill="both", expand=True)
+    _root.update()
+    start = time.perf_counter()
+    table.set_rows(items)
+    _root.update()
+    elapsed = time.perf_counter() - start
+    table.destroy()
+    return elapsed
+
+
+def scenarios(latency: float) -> None:
+    print("\nfailure scenarios (1,000 inserts)")
+    with tempfile.TemporaryDirectory() as workdir:
+        # 5% of sub-requests fail with 503 backendError: an insert may have happened anyway,
+        # so the target is re-listed before re-sending (extra calls, but no duplicates)
+        service = FakeYouTube(latency=latency, error_rate=0.05, seed=1)
+        target = service.add_playlist("Target")
+        client = fake_client(service, workdir)
+        results = client.insert_playlist_items(target, [f"v{i:06d}" for i in range(1_000)])
+        ok = sum(r["ok"] for r in results)
+        print(f"  5% transient 503s   ok {ok:>5,}  failed {len(results) - ok:>3}  "
+              f"HTTP calls {service.requests} (20 without errors)")
+
+    with tempfile.TemporaryDirectory() as workdir:
+        # 10,000 unit day: 200 inserts fit, the rest fail fast with quotaExceeded (not retried)
+        service = FakeYouTube(latency=latency, daily_quota=10_000)
+        target = service.add_playlist("Target")
+        client = fake_client(service, workdir)
+        run = timed(lambda: client.insert_playlist_items(target, [f"v{i:06d}" for i in range(1_000)]))
+        ok = sum(r["ok"] for r in run["result"])
+        print(f"  10k unit daily quota ok {ok:>5,}  failed {len(run['result']) - ok:>3}  "
+              f"HTTP calls {service.requests}  {run['seconds'] * 1000:.0f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Client benchmarks against the fake YouTube backend.")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds per HTTP round-trip")
+    parser.add_argument("--sizes", default=",".join(str(s) for s in SIZES),
+                        help="comma separated item counts")
+    args = parser.parse_args()
+    sizes = [int(s) for s in args.sizes.split(",")]
+
+    results = {size: bench_size(size, args.latency) for size in sizes}
+    names = list(results[sizes[0]])
+
+    print(f"fake YouTube backend, {args.latency * 1000:.0f} ms per round-trip\n")
+    print(f"{'':<28}" + "".join(f"{size:>12,}" for size in sizes) + "   items")
+    for name in names:
+        cells = []
+        for size in sizes:
+            seconds = results[size][name]["seconds"]
+            cells.append(f"{seconds * 1000:>9.1f} ms" if seconds is not None else f"{'no display':>12}")
+        print(f"{name:<28}" + "".join(cells))
+
+    print("\nHTTP round-trips / quota units")
+    print(f"{'':<28}" + "".join(f"{size:>18,}" for size in sizes))
+    for name in names:
+        if "requests" not in results[sizes[0]][name]:
+            continue
+        cells = [f"{results[s][name]['requests']:,} / {results[s][name]['units']:,}" for s in sizes]
+        print(f"{name:<28}" + "".join(f"{c:>18}" for c in cells))
+
+    scenarios(args.latency)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+# benchmarks/bench_virtual_table.py
+# Compares filling a plain ttk.Treeview with filling ui.virtual_table.VirtualTable,
+# then times the filter / sort view (RowView) per keystroke and per heading click.
+# The Treeview part needs a display (Tk window). Run from the project root:
+#   python -m benchmarks.bench_virtual_table
+import time
+import tkinter as tk
+from tkinter import ttk
+
+from ui.virtual_table import RowView, VirtualTable
+
+SIZES = (100, 1_000, 10_000, 50_000)
+COLUMNS = ("title", "video_id", "position")
+
+
+def make_rows(n: int) -> list:
+    return [
+        {
+            "playlist_item_id": f"PLI{i:08d}",
+            "video_id": f"vid{i:08d}",
+            "title": f"Some video title number {i}",
+            "position": i,
+        }
+        for i in range(n)
+    ]
+
+
+def row_values(item: dict) -> tuple:
+    return (item["title"], item["video_id"], item["position"])
+
+
+def time_treeview(root: tk.Tk, rows: list) -> float:
+    tree = ttk.Treeview(root, columns=COLUMNS, show="headings")
+    tree.pack(fill="both", expand=True)
+    root.update()
+
+    start = time.perf_counter()
+    for item in rows:
+        tree.insert("", "end", iid=item["playlist_item_id"], values=row_values(item))
+    root.update()
+    elapsed = time.perf_counter() - start
+
+    tree.destroy()
+    return elapsed
+
+
+def time_virtual(root: tk.Tk, rows: list) -> tuple:
+    table = VirtualTable(
+        root, columns=COLUMNS, key=lambda item: item["playlist_item_id"], values=row_values
+    )
+    table.pack(fill="both", expand=True)
+    root.update()
+
+    start = time.perf_counter()
+    table.set_rows(rows)
+    root.update()
+    render = time.perf_counter() - start
+
+    # scroll to the middle and the end, like dragging the scrollbar
+    start = time.perf_counter()
+    for fraction in ("0.5", "0.999"):
+        table._on_scrollbar("moveto", fraction)
+        root.update()
+    scroll = (time.perf_counter() - start) / 2
+
+    materialized = len(table.tree.get_children())
+    table.destroy()
+    return render, scroll, materialized
+
+
+def time_row_view(rows: list) -> dict:
+    """ms for: first keystroke (builds the text index), next keystrokes, first/cached sort."""
+    view = RowView(COLUMNS, row_values)
+    view.set_source(rows)
+    timings = {}
+
+    def run(name, fn) -> None:
+        start = time.perf_counter()
+        fn()
+        timings[name] = (time.perf_counter() - start) * 1000
+
+    run("first key", lambda: view.set_filter("s"))
+    # typing on: "so", "som", ... each only re-tests the previous matches
+    run("next keys", lambda: [view.set_filter("some video title number 1"[:n]) for n in range(2, 26)])
+    timings["next keys"] /= 24
+    run("clear", lambda: view.set_filter(""))
+    run("sort title", lambda: view.sort_by("title", descending=True))
+    run("sort again", lambda: (view.sort_by(None), view.sort_by("title", descending=True)))
+    return timings
+
+
+def main() -> None:
+    print(f"{'rows':>8} | {'1st key':>8} | {'next key':>8} | {'clear':>8} | {'1st sort':>8} | {'re-sort':>8}")
+    print("-" * 64)
+    for n in SIZES:
+        t = time_row_view(make_rows(n))
+        print(
+            f"{n:>8} | {t['first key']:>5.1f} ms | {t['next keys']:>5.1f} ms | {t['clear']:>5.1f} ms |"
+            f" {t['sort title']:>5.1f} ms | {t['sort again']:>5.1f} ms"
+        )
+    print()
+
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        print("no display, skipping the Treeview comparison")
+        return
+    root.geometry("1000x700")
+
+    print(f"{'rows':>8} | {'Treeview fill':>14} | {'Virtual fill':>13} | {'Virtual scroll':>14} | items in Tk")
+    print("-" * 72)
+    for n in SIZES:
+        rows = make_rows(n)
+        plain = time_treeview(root, rows)
+        render, scroll, materialized = time_virtual(root, rows)
+        print(
+            f"{n:>8} | {plain * 1000:>11.1f} ms | {render * 1000:>10.1f} ms |"
+            f" {scroll * 1000:>11.1f} ms | {materialized}"
+        )
+
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
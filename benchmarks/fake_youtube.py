@@ -0,0 +1,436 @@
+# benchmarks/fake_youtube.py
+# In-process stand-in for the discovery-built YouTube Data API service, so the real
+# YouTubeClient can be timed without a Google account or quota. Not a full emulation,
+# just what the client uses: list/insert/update/delete requests with pagination and
+# ETags (304s), batch HTTP requests, videos.list, and configurable latency and failures.
+#
+#   service = FakeYouTube(latency=0.05, daily_quota=10_000)
+#   playlist_id = service.add_playlist("Big one", n_items=10_000)
+#   client = fake_client(service, workdir)
+#   client.list_playlist_items(playlist_id)
+#   service.requests, service.units       # HTTP round-trips, quota units charged
+#
+# Responses are full resources (fields= masks are accepted but not applied).
+import hashlib
+import itertools
+import json
+import os
+import random
+import threading
+import time
+from typing import Optional, Dict, Any, Callable, List
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+from quota_ledger import QuotaLedger
+from request_policy import RetryPolicy
+from youtube_client import PAGE_SIZE, QUOTA_COST, YouTubeClient
+
+
+def http_error(
+    status: int, reason: str, message: str = "", headers: Optional[Dict[str, str]] = None
+) -> HttpError:
+    """An HttpError shaped like Google's (is_retryable / error_reasons can read it)."""
+    resp = httplib2.Response(dict(headers or {}, status=status))
+    resp.reason = reason
+    body = {
+        "error": {
+            "code": status,
+            "message": message or reason,
+            "errors": [{"reason": reason, "message": message or reason}],
+        }
+    }
+    return HttpError(resp, json.dumps(body).encode("utf-8"))
+
+
+def quota_exceeded() -> HttpError:
+    return http_error(403, "quotaExceeded", "The request cannot be completed because you have exceeded your quota.")
+
+
+def backend_error() -> HttpError:
+    return http_error(503, "backendError")
+
+
+class FakeRequest:
+    """Like googleapiclient.http.HttpRequest: methodId, headers, execute(http=...)."""
+
+    def __init__(self, service: "FakeYouTube", method_id: str, handler: Callable, params: Dict[str, Any]) -> None:
+        self.service = service
+        self.methodId = method_id
+        self.handler = handler
+        self.params = params
+        self.headers: Dict[str, str] = {}
+
+    def execute(self, http=None, num_retries: int = 0) -> Any:
+        self.service._round_trip()
+        return self.service._dispatch(self)
+
+
+class FakeBatch:
+    """Like BatchHttpRequest: one round-trip, every sub-request answered via callback."""
+
+    def __init__(self, service: "FakeYouTube", callback: Optional[Callable]) -> None:
+        self.service = service
+        self.callback = callback
+        self.requests: List[tuple] = []
+
+    def add(self, request: FakeRequest, callback: Optional[Callable] = None, request_id: Optional[str] = None) -> None:
+        self.requests.append((request_id, request, callback))
+
+    def execute(self, http=None) -> None:
+        self.service._round_trip()
+        for request_id, request, callback in self.requests:
+            try:
+                response, exception = self.service._dispatch(request), None
+            except HttpError as e:
+                response, exception = None, e
+            (callback or self.callback)(request_id, response, exception)
+
+
+class _Resource:
+    """service.playlistItems() etc.: method calls build FakeRequests, plus list_next."""
+
+    def __init__(self, service: "FakeYouTube", name: str) -> None:
+        self.service = service
+        self.name = name
+
+    def __getattr__(self, method: str) -> Callable:
+        if method.startswith("_"):
+            raise AttributeError(method)
+        handler = getattr(self.service, f"_{self.name}_{method}")
+        method_id = f"youtube.{self.name}.{method}"
+        return lambda **params: FakeRequest(self.service, method_id, handler, params)
+
+    def list_next(self, previous_request: FakeRequest, previous_response: Dict[str, Any]) -> Optional[FakeRequest]:
+        token = previous_response.get("nextPageToken")
+        if not token:
+            return None
+        request = FakeRequest(
+            self.service, previous_request.methodId, previous_request.handler,
+            dict(previous_request.params, pageToken=token),
+        )
+        request.headers = dict(previous_request.headers)
+        return request
+
+
+class FakeYouTube:
+    """
+    One fake account: its playlists (in memory) plus counters.
+
+    latency         seconds per HTTP round-trip (a batch is one round-trip)
+    daily_quota     units before every request fails with 403 quotaExceeded (None = no limit)
+    error_rate      share of requests that fail with a retryable 503 backendError
+    fail_next(...)  queue specific errors for the next requests (tests a retry path exactly)
+    fail_after_next(...)  same, but the request is carried out first (the response is lost)
+
+    Counters: requests (HTTP round-trips), calls (per method id, sub-requests included),
+    units (quota charged per sub-request that got past the quota check, 304s included).
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        daily_quota: Optional[int] = None,
+        error_rate: float = 0.0,
+        seed: int = 0,
+    ) -> None:
+        self.latency = latency
+        self.daily_quota = daily_quota
+        self.error_rate = error_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._fail_queue: List[Exception] = []
+        self._fail_after_queue: List[Exception] = []
+        # playlist_id -> {"title", "privacy", "items": [{"id", "videoId", "title"}]}
+        self.playlists_by_id: Dict[str, Dict[str, Any]] = {}
+        self._owner: Dict[str, tuple] = {}  # playlist item id -> (playlist id, item)
+        self._deleted: set = set()  # playlists with deleted items still to be compacted
+        # video id -> what videos.list says about it (see set_video); others are public
+        self.video_overrides: Dict[str, Dict[str, Any]] = {}
+        self.requests = 0
+        self.calls: Dict[str, int] = {}
+        self.units = 0
+
+    # ------------------------------------------------------------------
+    # Setting up the account
+    # ------------------------------------------------------------------
+
+    def add_playlist(self, title: str, n_items: int = 0, privacy: str = "private") -> str:
+        playlist_id = f"PL{next(self._ids):032d}"
+        self.playlists_by_id[playlist_id] = {"title": title, "privacy": privacy, "items": []}
+        for i in range(n_items):
+            self.add_item(playlist_id, f"v{playlist_id[-6:]}{i:05d}", f"Video {i} of {title}")
+        return playlist_id
+
+    def add_item(self, playlist_id: str, video_id: str, title: Optional[str] = None) -> Dict[str, Any]:
+        item = {
+            "id": f"UExQ{next(self._ids):012d}LjU2QjQ0RjZEMTA1NTdDQzY",
+            "videoId": video_id,
+            "title": title or f"Video {video_id}",
+        }
+        self.playlists_by_id[playlist_id]["items"].append(item)
+        self._owner[item["id"]] = (playlist_id, item)
+        return item
+
+    def set_video(self, video_id: str, **state: Any) -> None:
+        """
+        What videos.list reports for a video: found=False (deleted / someone else's
+        private video), privacy="private", upload_status="rejected", blocked=["DE"].
+        """
+        with self._lock:
+            self.video_overrides[video_id] = state
+
+    def items(self, playlist_id: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            return self._playlist_or_404(playlist_id)
+
+    def fail_next(self, *errors: Exception) -> None:
+        with self._lock:
+            self._fail_queue.extend(errors)
+
+    def fail_after_next(self, *errors: Exception) -> None:
+        with self._lock:
+            self._fail_after_queue.extend(errors)
+
+    def reset_counters(self) -> None:
+        with self._lock:
+            self.requests = 0
+            self.calls = {}
+            self.units = 0
+
+    # ------------------------------------------------------------------
+    # The service surface YouTubeClient uses
+    # ------------------------------------------------------------------
+
+    def channels(self) -> _Resource:
+        return _Resource(self, "channels")
+
+    def playlists(self) -> _Resource:
+        return _Resource(self, "playlists")
+
+    def playlistItems(self) -> _Resource:
+        return _Resource(self, "playlistItems")
+
+    def search(self) -> _Resource:
+        return _Resource(self, "search")
+
+    def videos(self) -> _Resource:
+        return _Resource(self, "videos")
+
+    def new_batch_http_request(self, callback: Optional[Callable] = None) -> FakeBatch:
+        return FakeBatch(self, callback)
+
+    def _round_trip(self) -> None:
+        # outside the lock, so concurrent workers overlap like real network waits
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            self.requests += 1
+
+    def _dispatch(self, request: FakeRequest) -> Any:
+        endpoint = request.methodId.split(".", 1)[1]
+        with self._lock:
+            self.calls[request.methodId] = self.calls.get(request.methodId, 0) + 1
+            if self._fail_queue:
+                raise self._fail_queue.pop(0)
+            if self.error_rate and self._random.random() < self.error_rate:
+                raise backend_error()
+            cost = QUOTA_COST.get(endpoint, 0)
+            if self.daily_quota is not None and self.units + cost > self.daily_quota:
+                raise quota_exceeded()
+            self.units += cost
+            response = request.handler(**request.params)
+            if self._fail_after_queue:
+                raise self._fail_after_queue.pop(0)
+        etag = response.get("etag") if isinstance(response, dict) else None
+        if etag and request.headers.get("If-None-Match") == etag:
+            raise http_error(304, "notModified")
+        return response
+
+    # ------------------------------------------------------------------
+    # Endpoints (called with self._lock held)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _etag(obj: Any) -> str:
+        return '"' + hashlib.md5(json.dumps(obj, sort_keys=True).encode("utf-8")).hexdigest() + '"'
+
+    def _page(self, rows: List[Any], build: Callable, maxResults: int = 5, pageToken: Optional[str] = None, **_) -> Dict[str, Any]:
+        # only the requested slice is turned into resources, so 50k item lists stay cheap
+        size = min(int(maxResults or 5), PAGE_SIZE)
+        start = int(pageToken or 0)
+        response = {
+            "kind": "youtube#listResponse",
+            "pageInfo": {"totalResults": len(rows), "resultsPerPage": size},
+            "items": [build(start + i, row) for i, row in enumerate(rows[start:start + size])],
+        }
+        if start + size < len(rows):
+            response["nextPageToken"] = str(start + size)
+        response["etag"] = self._etag(response)
+        return response
+
+    def _channels_list(self, **params) -> Dict[str, Any]:
+        return {"items": [{"id": "UCfakechannel", "snippet": {"title": "Fake Channel"}}]}
+
+    def _playlist_resource(self, position: int, playlist_id: str) -> Dict[str, Any]:
+        playlist = self.playlists_by_id[playlist_id]
+        return {
+            "kind": "youtube#playlist",
+            "id": playlist_id,
+            "snippet": {
+                "title": playlist["title"],
+                "description": "Playlist description " * 4,
+                "thumbnails": {"default": {"url": "https://i.ytimg.com/vi/x/default.jpg", "width": 120, "height": 90}},
+            },
+            "contentDetails": {"itemCount": len(playlist["items"])},
+            "status": {"privacyStatus": playlist["privacy"]},
+        }
+
+    def _playlists_list(self, **params) -> Dict[str, Any]:
+        return self._page(list(self.playlists_by_id), self._playlist_resource, **params)
+
+    def _playlists_insert(self, body: Dict[str, Any], **params) -> Dict[str, Any]:
+        playlist_id = f"PL{next(self._ids):032d}"
+        self.playlists_by_id[playlist_id] = {
+            "title": body["snippet"]["title"],
+            "privacy": body.get("status", {}).get("privacyStatus", "private"),
+            "items": [],
+        }
+        return self._playlist_resource(0, playlist_id)
+
+    def _item_resource(self, playlist_id: str, position: int, item: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "kind": "youtube#playlistItem",
+            "id": item["id"],
+            "snippet": {
+                "playlistId": playlist_id,
+                "position": position,
+                "title": item["title"],
+                "description": "Video description " * 10,
+                "channelTitle": "Fake Channel",
+                "videoOwnerChannelTitle": "Some Uploader",
+                "publishedAt": "2024-01-01T00:00:00Z",
+                "thumbnails": {"default": {"url": "https://i.ytimg.com/vi/x/default.jpg", "width": 120, "height": 90}},
+                "resourceId": {"kind": "youtube#video", "videoId": item["videoId"]},
+            },
+            "contentDetails": {"videoId": item["videoId"], "videoPublishedAt": "2023-01-01T00:00:00Z"},
+        }
+
+    def _playlist_or_404(self, playlist_id: str) -> List[Dict[str, Any]]:
+        if playlist_id not in self.playlists_by_id:
+            raise http_error(404, "playlistNotFound")
+        items = self.playlists_by_id[playlist_id]["items"]
+        if playlist_id in self._deleted:
+            # deletes only flag the item (O(1)); drop them before anyone looks at positions
+            items[:] = [it for it in items if not it.get("deleted")]
+            self._deleted.discard(playlist_id)
+        return items
+
+    def _playlistItems_list(self, playlistId: str, **params) -> Dict[str, Any]:
+        items = self._playlist_or_404(playlistId)
+        return self._page(
+            items, lambda position, item: self._item_resource(playlistId, position, item), **params
+        )
+
+    def _playlistItems_insert(self, body: Dict[str, Any], **params) -> Dict[str, Any]:
+        snippet = body["snippet"]
+        items = self._playlist_or_404(snippet["playlistId"])
+        item = {
+            "id": f"UExQ{next(self._ids):012d}LjU2QjQ0RjZEMTA1NTdDQzY",
+            "videoId": snippet["resourceId"]["videoId"],
+            "title": f"Video {snippet['resourceId']['videoId']}",
+        }
+        position = snippet.get("position")
+        if position is None or not 0 <= position <= len(items):
+            position = len(items)
+        items.insert(position, item)
+        self._owner[item["id"]] = (snippet["playlistId"], item)
+        return self._item_resource(snippet["playlistId"], position, item)
+
+    def _playlistItems_update(self, body: Dict[str, Any], **params) -> Dict[str, Any]:
+        snippet = body["snippet"]
+        items = self._playlist_or_404(snippet["playlistId"])
+        item = next((it for it in items if it["id"] == body["id"]), None)
+        if item is None:
+            raise http_error(404, "playlistItemNotFound")
+        items.remove(item)
+        position = min(snippet.get("position", len(items)), len(items))
+        items.insert(position, item)
+        return self._item_resource(snippet["playlistId"], position, item)
+
+    def _playlistItems_delete(self, id: str, **params) -> str:
+        playlist_id, item = self._owner.pop(id, (None, None))
+        if playlist_id not in self.playlists_by_id:
+            raise http_error(404, "playlistItemNotFound")
+        # just flag it, _playlist_or_404 compacts the list once before it is read again
+        item["deleted"] = True
+        self._deleted.add(playlist_id)
+        return ""
+
+    def _search_list(self, q: str = "", maxResults: int = 5, **params) -> Dict[str, Any]:
+        return {
+            "items": [
+                {
+                    "id": {"kind": "youtube#video", "videoId": f"s{abs(hash(q)) % 10**6:06d}{i:04d}"},
+                    "snippet": {"title": f"{q} result {i}", "channelTitle": "Someone"},
+                }
+                for i in range(int(maxResults))
+            ]
+        }
+
+    def _video_resource(self, video_id: str) -> Optional[Dict[str, Any]]:
+        state = self.video_overrides.get(video_id, {})
+        if not state.get("found", True):
+            return None
+        seconds = int(hashlib.md5(video_id.encode("utf-8")).hexdigest()[:6], 16) % 3600 + 30
+        content: Dict[str, Any] = {
+            "duration": f"PT{seconds // 60}M{seconds % 60}S",
+            "dimension": "2d",
+            "definition": "hd",
+        }
+        if state.get("blocked"):
+            content["regionRestriction"] = {"blocked": list(state["blocked"])}
+        return {
+            "kind": "youtube#video",
+            "id": video_id,
+            "contentDetails": content,
+            "status": {
+                "uploadStatus": state.get("upload_status", "processed"),
+                "privacyStatus": state.get("privacy", "public"),
+                "embeddable": True,
+            },
+            "statistics": {"viewCount": str(seconds * 37), "likeCount": str(seconds)},
+        }
+
+    def _videos_list(self, id: str = "", **params) -> Dict[str, Any]:
+        ids = [vid for vid in id.split(",") if vid]
+        if len(ids) > PAGE_SIZE:
+            raise http_error(400, "invalidRequest", "Too many video ids.")
+        resources = [self._video_resource(vid) for vid in ids]
+        return {"kind": "youtube#videoListResponse", "items": [r for r in resources if r]}
+
+
+def fake_client(service: FakeYouTube, workdir: str, cached: bool = False, **client_kwargs) -> YouTubeClient:
+    """
+    A real YouTubeClient talking to `service`. Its ledger/caches live in workdir;
+    cached=True turns on the playlist cache (ETag revalidation), the library index
+    and the video details cache.
+    No client-side rate limit and instant retries, unless given in client_kwargs.
+    """
+    client_kwargs.setdefault("requests_per_second", None)
+    client_kwargs.setdefault("retry_policy", RetryPolicy(base_delay=0.0, max_delay=0.0))
+    client = YouTubeClient(
+        token_file=os.path.join(workdir, "token.pickle"),
+        cache_file=os.path.join(workdir, "playlist_cache.sqlite3") if cached else None,
+        ledger=QuotaLedger("fake", path=os.path.join(workdir, "quota_ledger.json"), daily_limit=10**9),
+        search_cache_file=None,
+        library_file=os.path.join(workdir, "library_index.sqlite3") if cached else None,
+        video_cache_file=os.path.join(workdir, "video_cache.sqlite3") if cached else None,
+        **client_kwargs,
+    )
+    client.service = service
+    # fake requests ignore the transport, skip building google-auth http objects
+    client._http = lambda: None
+    return client
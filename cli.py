@@ -0,0 +1,700 @@
+# cli.py
+# dependencies
+import argparse
+import glob
+import json
+import os
+import re
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, Callable, Iterable, Iterator, List, TextIO
+
+from job_queue import RESERVE_UNITS, JobQueue
+from models import PlaylistItem
+from playlist_io import FORMATS, ItemWriter, export_items, format_for, import_file, read_rows
+from quota_ledger import file_lock
+from reorder import ORDERINGS
+from sync import plan_sync, run_sync
+from youtube_client import QUOTA_COST, YouTubeClient
+
+# Headless entry point for scripting (cron, servers). Same YouTubeClient, caches,
+# quota ledger and library index as the GUI, so run it from the same folder.
+#
+#   python cli.py login                              # once, opens a browser
+#   python cli.py list                               # your playlists
+#   python cli.py export PL1 PL2 > items.jsonl       # every item of those playlists
+#   python cli.py export --all -j 8 > library.jsonl
+#   python cli.py export --all -o backup.csv           # CSV, replaced only if complete
+#   python cli.py import backup.csv --source PL1 --title "PL1 restored"
+#   python cli.py copy --to PLtarget --from PL1 PL2  # or video ids / export lines on stdin
+#   python cli.py delete -i items.jsonl              # export lines (or playlist item ids)
+#   python cli.py dedupe --all --dry-run
+#   python cli.py reorder PL1 --by title --dry-run   # moves needed + their quota cost
+#   python cli.py sync -i mirrors.txt --dry-run       # "SOURCE TARGET" per line, plan + cost
+#   python cli.py resume                             # finish copies/deletes cut short (crash, quota)
+#
+# Inputs come from the command line and/or -i FILE ("-" = stdin), one per line:
+# a bare id or a JSON object as written by export. Output is JSON Lines on stdout,
+# one object per playlist / item / operation, flushed as soon as it is known.
+# Exit status: 0 = everything ok, 1 = some operations failed, 2 = could not start.
+
+# playlists worked on at the same time; every worker has its own HTTP transport
+# (see YouTubeClient._http) and they all share the client's rate limiter
+DEFAULT_JOBS = 4
+
+# set on Ctrl+C: workers finish their current HTTP call and stop
+_stop = threading.Event()
+
+# copies/deletes run as JobQueue jobs, journaled like the app's. A JobQueue rewrites
+# its files whole, so no two processes (the app, two cron entries) may share them:
+# every run gets its own jobs + journal file in here, locked while the run is going
+CLI_JOBS_DIR = "cli_jobs"
+
+
+class JsonlWriter:
+    """One JSON object per line, flushed right away, safe to call from worker threads."""
+
+    def __init__(self, out: TextIO) -> None:
+        self.out = out
+        self.failed = 0
+        self._lock = threading.Lock()
+
+    def write(self, record: Dict[str, Any]) -> None:
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+        with self._lock:
+            if record.get("ok") is False:
+                self.failed += 1
+            self.out.write(line + "\n")
+            self.out.flush()
+
+
+# ----------------------------------------------------------------------
+# Inputs
+# ----------------------------------------------------------------------
+
+def read_inputs(args_values: List[str], input_file: Optional[str]) -> List[Any]:
+    """Positional values plus the lines of input_file; JSON lines become dicts."""
+    values: List[Any] = list(args_values)
+    if input_file:
+        f = sys.stdin if input_file == "-" else open(input_file, "r", encoding="utf-8")
+        try:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                if line.startswith("{"):
+                    try:
+                        values.append(json.loads(line))
+                        continue
+                    except ValueError:
+                        pass
+                values.append(line)
+        finally:
+            if f is not sys.stdin:
+                f.close()
+    return values
+
+
+def _field(value: Any, key: str) -> Optional[str]:
+    if isinstance(value, dict):
+        return value.get(key)
+    return value
+
+
+# ----------------------------------------------------------------------
+# Running things
+# ----------------------------------------------------------------------
+
+def run_parallel(
+    fn: Callable[[Any], None], work: Iterable[Any], jobs: int, out: JsonlWriter,
+    describe: Callable[[Any], Dict[str, Any]],
+) -> None:
+    """
+    fn(w) for every w with at most `jobs` running at once. An exception only fails
+    its own unit of work: it becomes an {"ok": false} line built from describe(w).
+    """
+    def guarded(w: Any) -> None:
+        try:
+            fn(w)
+        except Exception as e:
+            out.write({**describe(w), "ok": False, "error": str(e)})
+
+    pool = ThreadPoolExecutor(max_workers=max(1, jobs))
+    try:
+        for w in work:
+            pool.submit(guarded, w)
+        pool.shutdown(wait=True)
+    except KeyboardInterrupt:
+        _stop.set()
+        pool.shutdown(wait=True, cancel_futures=True)
+        raise
+
+
+def check_quota(
+    client: YouTubeClient, endpoint: str, count: int, force: bool, reserve: int = 0
+) -> None:
+    # reserve: what the job queue keeps back for browsing (RESERVE_UNITS);
+    # a run approved here must not be cut short by the queue's own budget check
+    cost = count * QUOTA_COST[endpoint]
+    remaining = max(0, client.ledger.remaining() - reserve)
+    if cost > remaining and not force:
+        raise SystemExit(
+            f"This needs about {cost:,} quota units but only about {remaining:,} are left "
+            f"today (estimate{f', {reserve:,} kept for browsing' if reserve else ''}). "
+            "Run it after the daily reset, or pass --force."
+        )
+
+
+def run_ids() -> List[str]:
+    """Runs that left files behind in CLI_JOBS_DIR (oldest first)."""
+    return sorted(
+        os.path.basename(path)[:-len(".json")]
+        for path in glob.glob(os.path.join(CLI_JOBS_DIR, "*.json"))
+    )
+
+
+@contextmanager
+def run_queue(run_id: Optional[str] = None) -> Iterator[JobQueue]:
+    """
+    The JobQueue of a new run, or with run_id of an earlier one (resume), locked
+    for this process until the block ends. Raises BlockingIOError if another process
+    holds that run. The files are deleted once nothing is left pending.
+    """
+    os.makedirs(CLI_JOBS_DIR, exist_ok=True)
+    run_id = run_id or f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+    base = os.path.join(CLI_JOBS_DIR, run_id)
+    with file_lock(base, blocking=False):
+        queue = JobQueue(base + ".json", journal_path=base + ".journal.jsonl")
+        try:
+            yield queue
+        finally:
+            if not queue.pending():
+                for path in (base + ".json", base + ".journal.jsonl", base + ".lock"):
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass  # never written, or (Windows) the lock file is still open
+
+
+def _run_claimed(
+    queue: JobQueue, client: YouTubeClient, job: Dict[str, Any], op: str, out: JsonlWriter,
+    record: Callable[[Dict[str, Any]], Dict[str, Any]], force: bool = False,
+) -> None:
+    """
+    run_job() a claimed job and write record(result) for every key it handled. If
+    it stops early (Ctrl+C, quota ran out) it stays queued and a final
+    {"pending": true} line says so (`cli.py resume` finishes it).
+    force: --force, go over today's estimate instead of stopping at it.
+    """
+    summary = queue.run_job(client, job, should_stop=_stop.is_set, force=force)
+    for res in summary["results"]:
+        out.write(record(res))
+    if job["status"] == "done":
+        queue.remove(job["id"])
+    else:
+        # not a failure of any one item, but the run didn't do what it was asked to
+        out.write({"op": op, "playlist_id": job["playlist_id"], "job_id": job["id"],
+                   "ok": False, "pending": True, "left": len(job["keys"]) - job["done"],
+                   "deferred_units": summary["deferred_units"]})
+
+
+def _item_record(playlist_id: str, item: PlaylistItem) -> Dict[str, Any]:
+    return {"playlist_id": playlist_id, **item.to_dict()}
+
+
+def _playlist_ids(client: YouTubeClient, args: argparse.Namespace) -> List[str]:
+    if args.all:
+        return [p.id for p in client.list_playlists()]
+    ids = [_field(v, "playlist_id") or _field(v, "id") for v in read_inputs(args.playlists, args.input)]
+    # same playlist twice would just be listed (and for dedupe, cleaned) twice
+    return list(dict.fromkeys(pid for pid in ids if pid))
+
+
+# ----------------------------------------------------------------------
+# Commands
+# ----------------------------------------------------------------------
+
+def cmd_login(client: YouTubeClient, args: argparse.Namespace, out: JsonlWriter) -> None:
+    # authenticate() already ran (interactively) in main()
+    out.write({"ok": True, **client.get_channel_basic_info()})
+
+
+def cmd_list(client: YouTubeClient, args: argparse.Namespace, out: JsonlWriter) -> None:
+    for playlist in client.list_playlists():
+        out.write(playlist.to_dict())
+
+
+def cmd_export(client: YouTubeClient, args: argparse.Namespace, out: JsonlWriter) -> None:
+    playlist_ids = _playlist_ids(client, args)
+    if not args.output:
+        # items straight to stdout; a failed playlist becomes a status line on stderr
+        # when it would break the CSV
+        writer = ItemWriter(sys.stdout, args.format or "jsonl")
+        status = JsonlWriter(sys.stderr) if writer.fmt == "csv" else out
+        _export(client, playlist_ids, writer, args.jobs, status)
+        if status is not out:
+            out.failed += status.failed
+        return
+
+    # to a file: temp file first, a failed export never replaces an older backup
+    tmp_path = args.output + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+        writer = ItemWriter(f, format_for(args.output, args.format))
+        failed_before = out.failed
+        _export(client, playlist_ids, writer, args.jobs, out)
+    ok = out.failed == failed_before and not _stop.is_set()
+    if ok:
+        os.replace(tmp_path, args.output)
+    else:
+        os.remove(tmp_path)
+    out.write({"op": "export", "path": args.output, "format": writer.fmt,
+               "playlists": len(playlist_ids), "rows": writer.rows, "ok": ok})
+
+
+def _export(
+    client: YouTubeClient, playlist_ids: List[str], writer: ItemWriter, jobs: int,
+    status: JsonlWriter,
+) -> None:
+    # page by page, so big playlists start streaming after one round-trip
+    run_parallel(
+        lambda playlist_id: export_items(client, [playlist_id], writer, should_stop=_stop.is_set),
+        playlist_ids, jobs, status,
+        lambda playlist_id: {"op": "export", "playlist_id": playlist_id},
+    )
+
+
+def cmd_import(client: YouTubeClient, args: argparse.Namespace, out: JsonlWriter) -> None:
+    fmt = format_for(args.file, args.format)
+    # a first streaming pass just to count: the quota check needs an upper bound
+    count = sum(
+        1 for row in read_rows(args.file, fmt)
+        if row["video_id"] and (not args.source or row["playlist_id"] == args.source)
+    )
+    if args.dry_run:
+        out.write({"op": "import", "dry_run": True, "rows": count,
+                   "units": count * QUOTA_COST["playlistItems.insert"]})
+        return
+    check_quota(client, "playlistItems.insert", count, args.force)
+
+    if args.to:
+        playlist_id = args.to
+    else:
+        playlist = client.create_playlist(args.title, args.privacy)
+        playlist_id = playlist.id
+        out.write({"op": "create", "ok": True, **playlist.to_dict()})
+
+    reported = 0
+
+    def progress(summary: Dict[str, Any]) -> None:
+        nonlocal reported
+        for err in summary["errors"][reported:]:
+            out.write({"op": "import", "playlist_id": playlist_id, "ok": False, **err})
+        reported = len(summary["errors"])
+
+    summary = import_file(
+        client, playlist_id, args.file, fmt, args.source,
+        progress=progress, should_stop=_stop.is_set,
+    )
+    del summary["errors"]
+    out.write({"op": "import", "playlist_id": playlist_id, **summary})
+
+
+def cmd_copy(client: YouTubeClient, args: argparse.Namespace, out: JsonlWriter) -> None:
+    target = args.to
+    video_ids: List[str] = []
+    if args.sources:
+        # list the sources concurrently, then keep their order
+        listed: Dict[str, List[str]] = {}
+
+        def list_source(playlist_id: str) -> None:
+            listed[playlist_id] = [
+                it.video_id for it in client.iter_playlist_items(playlist_id) if it.video_id
+            ]
+
+        run_parallel(
+            list_source, args.sources, args.jobs, out,
+            lambda playlist_id: {"op": "copy", "source": playlist_id},
+        )
+        for playlist_id in args.sources:
+            video_ids.extend(listed.get(playlist_id, []))
+    video_ids.extend(
+        vid for vid in (_field(v, "video_id") for v in read_inputs(args.videos, args.input)) if vid
+    )
+
+    if not video_ids:
+        return
+
+    # videos already in the target (or repeated) are skipped for free, so only the
+    # ones that will really be inserted count towards the quota check
+    present = client.existing_videos(target, video_ids)
+    to_insert = len(set(video_ids) - present)
+    if args.dry_run:
+        out.write({"op": "copy", "playlist_id": target, "dry_run": True,
+                   "videos": len(video_ids), "to_insert": to_insert,
+                   "units": to_insert * QUOTA_COST["playlistItems.insert"]})
+        return
+    check_quota(client, "playlistItems.insert", to_insert, args.force, RESERVE_UNITS)
+
+    # one target playlist, one job: its chunks go in one after the other so the copy
+    # keeps (roughly, see insert_playlist_items) the source order
+    def record(res: Dict[str, Any]) -> Dict[str, Any]:
+        item = res.get("item")
+        return {
+            "op": "copy",
+            "playlist_id": target,
+            "video_id": res["key"],
+            "ok": res["ok"],
+            "skipped": bool(res.get("skipped")),
+            "playlist_item_id": item.playlist_item_id if item else None,
+            "error": None if res["ok"] else str(res["error"]),
+        }
+
+    with run_queue() as queue:
+        job = queue.add_insert_job(target, video_ids, f"cli copy to {target}", claim=True)
+        _run_claimed(queue, client, job, "copy", out, record, args.force)
+
+
+def _delete(
+    client: YouTubeClient, queue: JobQueue, playlist_id: Optional[str],
+    playlist_item_ids: List[str], out: JsonlWriter, op: str = "delete", force: bool = False,
+) -> None:
+    # one job per playlist, so playlists are still deleted from in parallel
+    job = queue.add_delete_job(playlist_id, playlist_item_ids, f"cli {op} in {playlist_id}", claim=True)
+    _run_claimed(queue, client, job, op, out, lambda res: {
+        "op": op,
+        "playlist_id": playlist_id,
+        "playlist_item_id": res["key"],
+        "ok": res["ok"],
+        "error": None if res["ok"] else str(res["error"]),
+    }, force)
+
+
+def cmd_delete(client: YouTubeClient, args: argparse.Namespace, out: JsonlWriter) -> None:
+    # group by playlist (export lines know theirs) so playlists are deleted from in parallel
+    groups: Dict[Optional[str], List[str]] = {}
+    for value in read_inputs(args.items, args.input):
+        playlist_item_id = _field(value, "playlist_item_id")
+        playlist_id = value.get("playlist_id") if isinstance(value, dict) else None
+        if playlist_item_id:
+            groups.setdefault(playlist_id, []).append(playlist_item_id)
+
+    count = sum(len(ids) for ids in groups.values())
+    if args.dry_run:
+        out.write({"op": "delete", "dry_run": True, "items": count,
+                   "units": count * QUOTA_COST["playlistItems.delete"]})
+        return
+    check_quota(client, "playlistItems.delete", count, args.force, RESERVE_UNITS)
+
+    with run_queue() as queue:
+        run_parallel(
+            lambda group: _delete(client, queue, group[0], group[1], out, force=args.force),
+            list(groups.items()), args.jobs, out,
+            lambda group: {"op": "delete", "playlist_id": group[0]},
+        )
+
+
+def cmd_dedupe(client: YouTubeClient, args: argparse.Namespace, out: JsonlWriter) -> None:
+    """Remove repeated videos inside each playlist, keeping the first (lowest position) copy."""
+    playlist_ids = _playlist_ids(client, args)
+    extras: Dict[str, List[PlaylistItem]] = {}
+
+    def scan(playlist_id: str) -> None:
+        seen = set()
+        repeats = []
+        for item in client.iter_playlist_items(playlist_id):
+            if item.video_id in seen:
+                repeats.append(item)
+            elif item.video_id:
+                seen.add(item.video_id)
+        extras[playlist_id] = repeats
+
+    run_parallel(scan, playlist_ids, args.jobs, out,
+                 lambda playlist_id: {"op": "dedupe", "playlist_id": playlist_id})
+
+    count = sum(len(items) for items in extras.values())
+    if args.dry_run:
+        for playlist_id in playlist_ids:
+            for item in extras.get(playlist_id, []):
+                out.write({"op": "dedupe", "dry_run": True, **_item_record(playlist_id, item)})
+        out.write({"op": "dedupe", "dry_run": True, "items": count,
+                   "units": count * QUOTA_COST["playlistItems.delete"]})
+        return
+    check_quota(client, "playlistItems.delete", count, args.force, RESERVE_UNITS)
+
+    with run_queue() as queue:
+        run_parallel(
+            lambda playlist_id: _delete(
+                client, queue, playlist_id, [it.playlist_item_id for it in extras[playlist_id]],
+                out, "dedupe", args.force,
+            ),
+            [pid for pid in playlist_ids if extras.get(pid)], args.jobs, out,
+            lambda playlist_id: {"op": "dedupe", "playlist_id": playlist_id},
+        )
+
+
+def cmd_reorder(client: YouTubeClient, args: argparse.Namespace, out: JsonlWriter) -> None:
+    """Put a playlist in a new order, moving only the videos that have to move."""
+    ordering = ORDERINGS[args.by]
+    current, moves = client.plan_reorder(
+        args.playlist, lambda items: [it.playlist_item_id for it in ordering(items)]
+    )
+
+    if args.dry_run:
+        for item, position in moves:
+            out.write({"op": "reorder", "dry_run": True, **_item_record(args.playlist, item),
+                       "new_position": position})
+        out.write({"op": "reorder", "dry_run": True, "items": len(moves),
+                   "unchanged": len(current) - len(moves),
+                   "units": len(moves) * QUOTA_COST["playlistItems.update"]})
+        return
+    check_quota(client, "playlistItems.update", len(moves), args.force)
+
+    results = client.reorder_playlist_items(args.playlist, moves, should_stop=_stop.is_set)
+    for (item, position), res in zip(moves, results):
+        out.write({
+            "op": "reorder",
+            "playlist_id": args.playlist,
+            "playlist_item_id": item.playlist_item_id,
+            "new_position": position,
+            "ok": res["ok"],
+            "error": None if res["ok"] else str(res["error"]),
+        })
+
+
+def cmd_resume(client: YouTubeClient, args: argparse.Namespace, out: JsonlWriter) -> None:
+    """
+    Carry on with copy/delete/dedupe jobs earlier runs left queued (crashed, stopped,
+    out of quota), one run after the other. Runs still going in another process are
+    left alone and reported as busy.
+    """
+    def progress(job: Dict[str, Any]) -> None:
+        if job["status"] == "done":
+            out.write({"op": "resume", "job_id": job["id"], "label": job["label"],
+                       "ok": not job["failed"], "failed": job["failed"]})
+
+    for run_id in run_ids():
+        if _stop.is_set():
+            return
+        try:
+            with run_queue(run_id) as queue:
+                pending = queue.pending()
+                if args.dry_run:
+                    for job in pending:
+                        out.write({"op": "resume", "dry_run": True, "run": run_id, "job_id": job["id"],
+                                   "label": job["label"], "left": len(job["keys"]) - job["done"],
+                                   "units": JobQueue.estimate_cost(job)})
+                    continue
+                summary = queue.run(client, progress=progress, should_stop=_stop.is_set)
+                queue.clear_finished()
+                out.write({"op": "resume", "run": run_id, "jobs": len(pending), **summary,
+                           "pending": len(queue.pending())})
+        except BlockingIOError:
+            out.write({"op": "resume", "run": run_id, "busy": True})
+
+
+def _sync_pairs(args: argparse.Namespace, out: JsonlWriter) -> List[Dict[str, str]]:
+    pairs: List[Dict[str, str]] = []
+    targets = set()
+    for value in read_inputs(args.pairs, args.input):
+        if isinstance(value, dict):
+            source, target = value.get("source"), value.get("target")
+        else:
+            parts = [p for p in re.split(r"[\s:,]+", value) if p]
+            source, target = parts if len(parts) == 2 else (None, None)
+        pair = {"source": source, "target": target}
+        if not source or not target or source == target:
+            out.write({"op": "sync", "input": value, "ok": False,
+                       "error": "expected a source and a (different) target playlist id"})
+        elif target in targets:
+            # two sources for one mirror would undo each other's work
+            out.write({"op": "sync", **pair, "ok": False, "error": "target already used by another pair"})
+        else:
+            targets.add(target)
+            pairs.append(pair)
+    return pairs
+
+
+def cmd_sync(client: YouTubeClient, args: argparse.Namespace, out: JsonlWriter) -> None:
+    """
+    One-way mirrors (see sync.py). All pairs are planned first (listing only);
+    then, in input order, every pair whose plan fits in what is left of today's
+    quota runs, the others are reported as deferred for the next run (cron).
+    """
+    pairs = _sync_pairs(args, out)
+    plans: Dict[str, Dict[str, Any]] = {}
+
+    def plan(pair: Dict[str, str]) -> None:
+        plans[pair["target"]] = plan_sync(client, pair["source"], pair["target"], order=not args.no_order)
+
+    run_parallel(plan, pairs, args.jobs, out, lambda pair: {"op": "sync", **pair})
+
+    def describe(p: Dict[str, Any]) -> Dict[str, Any]:
+        return {"op": "sync", "source": p["source_id"], "target": p["target_id"],
+                "delete": len(p["delete"]), "insert": len(p["insert"]),
+                "moves": p["moves"], "units": p["units"]}
+
+    planned = [plans[pair["target"]] for pair in pairs if pair["target"] in plans]
+    if args.dry_run:
+        for p in planned:
+            out.write({**describe(p), "dry_run": True})
+        out.write({"op": "sync", "dry_run": True, "pairs": len(planned),
+                   "units": sum(p["units"] for p in planned),
+                   "remaining_today": client.ledger.remaining()})
+        return
+
+    budget = client.ledger.remaining()
+    scheduled = []
+    for p in planned:
+        if not p["units"]:
+            out.write({**describe(p), "ok": True, "in_sync": True})
+        elif args.force or p["units"] <= budget:
+            budget -= p["units"]
+            scheduled.append(p)
+        else:
+            out.write({**describe(p), "deferred": True})
+
+    def run(p: Dict[str, Any]) -> None:
+        summary = run_sync(client, p, should_stop=_stop.is_set)
+        for res in summary["results"]:
+            out.write({"op": f"sync.{res['op']}", "target": p["target_id"], "key": res["key"],
+                       "ok": res["ok"], "error": res["error"]})
+        out.write({**describe(p), "ok": not summary["failed"],
+                   **{k: summary[k] for k in ("deleted", "inserted", "moved", "failed", "stopped")}})
+
+    run_parallel(run, scheduled, args.jobs, out,
+                 lambda p: {"op": "sync", "source": p["source_id"], "target": p["target_id"]})
+
+
+# ----------------------------------------------------------------------
+# Argument parsing
+# ----------------------------------------------------------------------
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="cli.py",
+        description="Headless YouTube playlist operations. Output is JSON Lines on stdout.",
+    )
+    parser.add_argument("--metrics", metavar="FILE",
+                        help="write per-endpoint request metrics of this run as JSON "
+                             "(compare two runs with: python metrics.py A.json B.json)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    # options every bulk command takes (after the command name)
+    bulk = argparse.ArgumentParser(add_help=False)
+    bulk.add_argument("-j", "--jobs", type=int, default=DEFAULT_JOBS,
+                      help=f"playlists to work on concurrently (default {DEFAULT_JOBS})")
+
+    sub.add_parser("login", help="sign in in a browser and save the token for later runs")
+    sub.add_parser("list", help="list your playlists")
+
+    def add_playlist_inputs(p: argparse.ArgumentParser) -> None:
+        p.add_argument("playlists", nargs="*", help="playlist ids")
+        p.add_argument("-i", "--input", help="file with playlist ids / list lines ('-' = stdin)")
+        p.add_argument("--all", action="store_true", help="all of your playlists")
+
+    def add_write_options(p: argparse.ArgumentParser) -> None:
+        p.add_argument("--dry-run", action="store_true", help="only report what would be done")
+        p.add_argument("--force", action="store_true",
+                       help="run even if it needs more than today's estimated remaining quota")
+
+    p = sub.add_parser("export", parents=[bulk], help="every item of the given playlists")
+    add_playlist_inputs(p)
+    p.add_argument("-o", "--output", help="write to this file (.csv or .jsonl) instead of stdout")
+    p.add_argument("--format", choices=FORMATS, help="default: from --output's extension, else jsonl")
+
+    p = sub.add_parser("import", help="add the videos of an export file to a playlist")
+    p.add_argument("file", help="file written by export (.csv or .jsonl)")
+    target = p.add_mutually_exclusive_group(required=True)
+    target.add_argument("--to", help="existing playlist id")
+    target.add_argument("--title", help="create a new playlist with this title")
+    p.add_argument("--privacy", choices=("private", "unlisted", "public"), default="private",
+                   help="privacy of a playlist created with --title (default private)")
+    p.add_argument("--source", help="only rows of this playlist id (multi-playlist exports)")
+    p.add_argument("--format", choices=FORMATS, help="default: from the file extension")
+    add_write_options(p)
+
+    p = sub.add_parser("copy", parents=[bulk], help="add videos to a playlist, skipping ones already in it")
+    p.add_argument("--to", required=True, help="target playlist id")
+    p.add_argument("--from", dest="sources", nargs="+", default=[], help="source playlist ids")
+    p.add_argument("videos", nargs="*", help="video ids")
+    p.add_argument("-i", "--input", help="file with video ids / export lines ('-' = stdin)")
+    add_write_options(p)
+
+    p = sub.add_parser("delete", parents=[bulk], help="remove playlist items")
+    p.add_argument("items", nargs="*", help="playlist item ids")
+    p.add_argument("-i", "--input", help="file with playlist item ids / export lines ('-' = stdin)")
+    add_write_options(p)
+
+    p = sub.add_parser("resume", help="finish copies/deletes an earlier run left queued (crash, Ctrl+C, quota)")
+    p.add_argument("--dry-run", action="store_true", help="only list the queued jobs")
+
+    p = sub.add_parser("dedupe", parents=[bulk], help="remove repeated videos inside each playlist")
+    add_playlist_inputs(p)
+    add_write_options(p)
+
+    p = sub.add_parser("reorder", help="sort / reverse / shuffle a playlist, moving as few videos as possible")
+    p.add_argument("playlist", help="playlist id")
+    p.add_argument("--by", choices=list(ORDERINGS), required=True, help="new order")
+    add_write_options(p)
+
+    p = sub.add_parser("sync", parents=[bulk], help="make target playlists mirror source playlists (one-way)")
+    p.add_argument("pairs", nargs="*", metavar="SOURCE:TARGET", help="source and target playlist id")
+    p.add_argument("-i", "--input",
+                   help="file with 'SOURCE TARGET' lines or {\"source\", \"target\"} JSON lines ('-' = stdin)")
+    p.add_argument("--no-order", action="store_true", help="only add/remove videos, leave the order alone")
+    add_write_options(p)
+
+    return parser
+
+
+COMMANDS = {
+    "login": cmd_login,
+    "list": cmd_list,
+    "export": cmd_export,
+    "import": cmd_import,
+    "copy": cmd_copy,
+    "delete": cmd_delete,
+    "dedupe": cmd_dedupe,
+    "resume": cmd_resume,
+    "reorder": cmd_reorder,
+    "sync": cmd_sync,
+}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    out = JsonlWriter(sys.stdout)
+
+    client = YouTubeClient()
+    try:
+        # only "login" may open a browser, everything else needs a saved token
+        if not client.authenticate(interactive=args.command == "login"):
+            print("Not signed in: run `python cli.py login` (or sign in once in the app) first.",
+                  file=sys.stderr)
+            return 2
+        COMMANDS[args.command](client, args, out)
+    except SystemExit as e:
+        if isinstance(e.code, str):
+            print(e.code, file=sys.stderr)
+            return 2
+        raise
+    except KeyboardInterrupt:
+        return 130
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    finally:
+        # failed / interrupted runs are the ones worth looking at
+        print(f"quota used this run: ~{client.quota_used_units:,} units", file=sys.stderr)
+        if args.metrics:
+            client.metrics.dump(args.metrics)
+    return 1 if out.failed else 0
+
+
+# main guard
+if __name__ == "__main__":
+    sys.exit(main())
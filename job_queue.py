@@ -0,0 +1,318 @@
+# job_queue.py
+# dependencies
+import json
+import os
+import threading
+import time
+import uuid
+from typing import Optional, Dict, Any, Callable, List
+
+from googleapiclient.errors import HttpError
+
+from journal import JOURNAL_FILE, Journal
+from youtube_client import BATCH_SIZE, QUOTA_COST, YouTubeClient
+
+JOBS_FILE = "jobs.json"
+
+# units the queue leaves untouched each day, so browsing/refreshing still works
+RESERVE_UNITS = 100
+
+# what each job kind costs per item
+JOB_ENDPOINTS = {
+    "insert": "playlistItems.insert",
+    "delete": "playlistItems.delete",
+}
+
+
+class JobQueue:
+    """
+    Persistent queue of bulk playlist jobs that may not fit in today's quota.
+
+    A job is a dict (saved to JOBS_FILE after every chunk):
+      id, kind ("insert" | "delete"), label, playlist_id,
+      keys (video ids to insert / playlist item ids to delete),
+      done (checkpoint: how many keys were attempted), ok, failed (list of {key, error}),
+      status ("pending" | "done"), created_at
+
+    run() works through pending jobs as far as the ledger's remaining budget allows
+    and stops cleanly when it runs out; calling it again after the Pacific-midnight
+    reset (or after an app restart) carries on from the checkpoint.
+
+    Every chunk is also written ahead to a Journal (see journal.py), so a crash in
+    the middle of a chunk loses nothing: operations the journal records as done are
+    not sent again, and in-doubt ones are replayed idempotently (inserts re-check
+    the target playlist first, deleting an already deleted item counts as done).
+    """
+
+    def __init__(
+        self,
+        path: str = JOBS_FILE,
+        reserve_units: int = RESERVE_UNITS,
+        journal_path: str = JOURNAL_FILE,
+    ) -> None:
+        self.path = path
+        self.reserve_units = reserve_units
+        self._lock = threading.Lock()
+        self._run_lock = threading.Lock()  # one run() at a time
+        self._claimed: set = set()  # job ids being run by run_job() right now
+        self.jobs: List[Dict[str, Any]] = self._load()
+        self.journal = Journal(journal_path)
+        # entries of finished/removed jobs are dead weight
+        self.journal.compact(j["id"] for j in self.jobs if j["status"] == "pending")
+
+    # ------------------------------------------------------------------
+    # Adding / inspecting jobs
+    # ------------------------------------------------------------------
+
+    # claim=True: the caller runs it right away with run_job(), run() leaves it alone
+
+    def add_insert_job(
+        self, playlist_id: str, video_ids: List[str], label: str = "", claim: bool = False
+    ) -> Dict[str, Any]:
+        return self._add("insert", playlist_id, video_ids, label or f"Copy {len(video_ids)} video(s)", claim)
+
+    def add_delete_job(
+        self, playlist_id: str, playlist_item_ids: List[str], label: str = "", claim: bool = False
+    ) -> Dict[str, Any]:
+        return self._add("delete", playlist_id, playlist_item_ids, label or f"Delete {len(playlist_item_ids)} video(s)", claim)
+
+    def _add(self, kind: str, playlist_id: str, keys: List[str], label: str, claim: bool) -> Dict[str, Any]:
+        job = {
+            "id": uuid.uuid4().hex[:12],
+            "kind": kind,
+            "label": label,
+            "playlist_id": playlist_id,
+            "keys": list(keys),
+            "done": 0,
+            "ok": 0,
+            "failed": [],
+            "status": "pending",
+            "created_at": time.time(),
+        }
+        with self._lock:
+            self.jobs.append(job)
+            if claim:
+                self._claimed.add(job["id"])
+            self._save()
+        return job
+
+    def pending(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [j for j in self.jobs if j["status"] == "pending"]
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return next((j for j in self.jobs if j["id"] == job_id), None)
+
+    def remove(self, job_id: str) -> None:
+        with self._lock:
+            self.jobs = [j for j in self.jobs if j["id"] != job_id]
+            self._save()
+
+    def clear_finished(self) -> None:
+        with self._lock:
+            self.jobs = [j for j in self.jobs if j["status"] != "done"]
+            self._save()
+
+    @staticmethod
+    def unit_cost(job: Dict[str, Any]) -> int:
+        return QUOTA_COST[JOB_ENDPOINTS[job["kind"]]]
+
+    @classmethod
+    def estimate_cost(cls, job: Dict[str, Any]) -> int:
+        """Units still needed to finish the job."""
+        return (len(job["keys"]) - job["done"]) * cls.unit_cost(job)
+
+    def total_pending_cost(self) -> int:
+        with self._lock:
+            claimed = set(self._claimed)
+        return sum(self.estimate_cost(j) for j in self.pending() if j["id"] not in claimed)
+
+    # ------------------------------------------------------------------
+    # Running
+    # ------------------------------------------------------------------
+
+    def run(
+        self,
+        client: YouTubeClient,
+        progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+        should_stop: Optional[Callable[[], bool]] = None,
+    ) -> Dict[str, int]:
+        """
+        Execute pending jobs chunk by chunk while today's budget allows.
+        Returns {"attempted", "ok", "failed", "deferred_units"}; deferred_units > 0
+        means work is left for after the next quota reset.
+        """
+        summary = self._new_summary()
+        if not self._run_lock.acquire(blocking=False):
+            return summary  # another run is already going
+
+        try:
+            for job in self.pending():
+                with self._lock:
+                    if job["id"] in self._claimed:
+                        continue  # a window is running this one itself
+                if not self._run_job(client, job, summary, None, progress, should_stop):
+                    summary["deferred_units"] = self.total_pending_cost()
+                    break
+        finally:
+            self._run_lock.release()
+
+        return summary
+
+    def run_job(
+        self,
+        client: YouTubeClient,
+        job: Dict[str, Any],
+        progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+        should_stop: Optional[Callable[[], bool]] = None,
+        force: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Run one job now (added with claim=True), e.g. a copy started from PlaylistWindow.
+        Same summary as run(), plus "results": one result per key handled this time.
+        If it stops early (cancel, out of quota) the job stays pending for run().
+        force=True ignores today's budget: the caller already chose to go over the
+        estimate (cli.py --force).
+        """
+        summary = self._new_summary()
+        summary["results"] = []
+        try:
+            self._run_job(client, job, summary, summary["results"], progress, should_stop, force)
+        finally:
+            with self._lock:
+                self._claimed.discard(job["id"])
+        summary["deferred_units"] = self.estimate_cost(job) if job["status"] == "pending" else 0
+        return summary
+
+    @staticmethod
+    def _new_summary() -> Dict[str, Any]:
+        return {"attempted": 0, "ok": 0, "failed": 0, "skipped": 0, "deferred_units": 0}
+
+    def _run_job(
+        self,
+        client: YouTubeClient,
+        job: Dict[str, Any],
+        summary: Dict[str, Any],
+        results_out: Optional[List[Dict[str, Any]]],
+        progress: Optional[Callable[[Dict[str, Any]], None]],
+        should_stop: Optional[Callable[[], bool]],
+        force: bool = False,
+    ) -> bool:
+        """Work on one job until it's done (True) or we have to stop (False)."""
+        unit = self.unit_cost(job)
+        # what a previous (crashed) run got through after its last checkpoint
+        journaled = self.journal.state(job["id"])
+
+        while job["done"] < len(job["keys"]):
+            if should_stop and should_stop():
+                return False
+
+            start = job["done"]
+            recorded = self._recorded_prefix(job, start, journaled["done"])
+            if recorded:
+                # finished before the crash, just not checkpointed: nothing to send
+                self._checkpoint(job, start, recorded, summary, results_out, progress)
+                continue
+
+            if force:
+                affordable = BATCH_SIZE
+            else:
+                affordable = (client.ledger.remaining() - self.reserve_units) // unit
+            if affordable <= 0:
+                return False
+
+            chunk = job["keys"][start:start + min(affordable, BATCH_SIZE)]
+            in_doubt = any(start + n in journaled["in_doubt"] for n in range(len(chunk)))
+
+            self.journal.plan(job["id"], start, chunk)
+            results = self._run_chunk(client, job, chunk, recheck=in_doubt)
+            self.journal.done(job["id"], start, results)
+
+            self._checkpoint(job, start, results, summary, results_out, progress)
+            if not results:
+                return False  # nothing happened (stopped), don't spin
+        return True
+
+    @staticmethod
+    def _recorded_prefix(
+        job: Dict[str, Any], start: int, done: Dict[int, Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        results = []
+        index = start
+        while index < len(job["keys"]) and index in done:
+            rec = done[index]
+            results.append({
+                "key": rec["key"], "ok": rec["ok"], "skipped": rec.get("skipped", False),
+                "response": None, "error": rec.get("error"),
+            })
+            index += 1
+        return results
+
+    def _checkpoint(
+        self,
+        job: Dict[str, Any],
+        start: int,
+        results: List[Dict[str, Any]],
+        summary: Dict[str, Any],
+        results_out: Optional[List[Dict[str, Any]]],
+        progress: Optional[Callable[[Dict[str, Any]], None]],
+    ) -> None:
+        with self._lock:
+            job["done"] = start + len(results)
+            for res in results:
+                if res["ok"]:
+                    job["ok"] += 1
+                else:
+                    job["failed"].append({"key": res["key"], "error": str(res["error"])})
+            if job["done"] >= len(job["keys"]):
+                job["status"] = "done"
+            self._save()  # checkpoint
+
+        summary["attempted"] += len(results)
+        summary["ok"] += sum(1 for r in results if r["ok"])
+        summary["failed"] += sum(1 for r in results if not r["ok"])
+        summary["skipped"] += sum(1 for r in results if r.get("skipped"))
+        if results_out is not None:
+            results_out.extend(results)
+        if progress:
+            progress(job)
+
+    @staticmethod
+    def _run_chunk(
+        client: YouTubeClient, job: Dict[str, Any], chunk: List[str], recheck: bool = False
+    ) -> List[Dict[str, Any]]:
+        if job["kind"] == "insert":
+            # videos that are already there (added by hand meanwhile, or by the
+            # in-doubt part of a crashed chunk) cost nothing
+            return client.insert_playlist_items(
+                job["playlist_id"], chunk, skip_existing=True, recheck=recheck
+            )
+
+        results = client.delete_playlist_items(chunk)
+        for res in results:
+            # already gone (deleted elsewhere, or by a crashed run) is what we wanted
+            err = res["error"]
+            if not res["ok"] and isinstance(err, HttpError) and err.resp.status == 404:
+                res.update(ok=True, skipped=True, error=None)
+        return results
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _load(self) -> List[Dict[str, Any]]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f).get("jobs", [])
+        except (OSError, ValueError):
+            return []
+
+    def _save(self) -> None:
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"jobs": self.jobs}, f)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass
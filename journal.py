@@ -0,0 +1,153 @@
+# journal.py
+# dependencies
+import json
+import os
+import threading
+import time
+from typing import Dict, Any, Iterable, List
+
+JOURNAL_FILE = "jobs_journal.jsonl"
+
+
+class Journal:
+    """
+    Append-only write-ahead log for bulk jobs (one JSON object per line).
+
+    JobQueue writes a "plan" line for every operation of a chunk *before* sending it,
+    and a "done" line with the outcome after the batch returns, fsync'ing both.
+    After a crash the journal tells, per job and per key index:
+      done      -> finished, don't send again (outcome is in the record)
+      planned   -> in doubt: may or may not have reached YouTube, replay idempotently
+    A torn last line (crash mid-write) is cut off before the next append, otherwise
+    the next record would be glued onto it and both would be lost on replay.
+
+    Lines: {"t": epoch, "job": job_id, "ev": "plan" | "done", "i": index into job keys,
+            "key": key, and for "done": "ok", "skipped", "error"}
+    """
+
+    def __init__(self, path: str = JOURNAL_FILE) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._repaired = False
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def plan(self, job_id: str, start: int, keys: List[str]) -> None:
+        now = time.time()
+        self._append(
+            {"t": now, "job": job_id, "ev": "plan", "i": start + n, "key": key}
+            for n, key in enumerate(keys)
+        )
+
+    def done(self, job_id: str, start: int, results: List[Dict[str, Any]]) -> None:
+        now = time.time()
+        self._append(
+            {
+                "t": now,
+                "job": job_id,
+                "ev": "done",
+                "i": start + n,
+                "key": res["key"],
+                "ok": bool(res["ok"]),
+                "skipped": bool(res.get("skipped")),
+                "error": None if res["ok"] else str(res.get("error")),
+            }
+            for n, res in enumerate(results)
+        )
+
+    def _append(self, records: Iterable[Dict[str, Any]]) -> None:
+        data = "".join(json.dumps(r, separators=(",", ":")) + "\n" for r in records)
+        if not data:
+            return
+        with self._lock:
+            if not self._repaired:
+                self._truncate_torn_line()
+                self._repaired = True
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def _truncate_torn_line(self) -> None:
+        """Cut the file back to its last complete line (after a crash mid-write)."""
+        try:
+            with open(self.path, "rb+") as f:
+                end = f.seek(0, os.SEEK_END)
+                if end == 0:
+                    return
+                f.seek(end - 1)
+                if f.read(1) == b"\n":
+                    return
+                # walk back to the last newline, a block at a time
+                pos = end
+                keep = 0
+                while pos > 0:
+                    size = min(64 * 1024, pos)
+                    pos -= size
+                    f.seek(pos)
+                    newline = f.read(size).rfind(b"\n")
+                    if newline >= 0:
+                        keep = pos + newline + 1
+                        break
+                f.truncate(keep)
+                f.flush()
+                os.fsync(f.fileno())
+        except OSError:
+            pass  # no journal yet
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def _records(self) -> Iterable[Dict[str, Any]]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        continue  # torn write
+        except OSError:
+            return
+
+    def state(self, job_id: str) -> Dict[str, Dict[int, Dict[str, Any]]]:
+        """{"done": {index: done record}, "in_doubt": {index: plan record}} for one job."""
+        planned: Dict[int, Dict[str, Any]] = {}
+        done: Dict[int, Dict[str, Any]] = {}
+        with self._lock:
+            for rec in self._records():
+                if rec.get("job") != job_id:
+                    continue
+                if rec.get("ev") == "plan":
+                    planned[rec["i"]] = rec
+                elif rec.get("ev") == "done":
+                    done[rec["i"]] = rec
+        in_doubt = {i: rec for i, rec in planned.items() if i not in done}
+        return {"done": done, "in_doubt": in_doubt}
+
+    def compact(self, keep_job_ids: Iterable[str]) -> None:
+        """Rewrite the file with only the lines of still-unfinished jobs."""
+        keep = set(keep_job_ids)
+        with self._lock:
+            lines = [
+                json.dumps(rec, separators=(",", ":")) + "\n"
+                for rec in self._records()
+                if rec.get("job") in keep
+            ]
+            if not lines:
+                try:
+                    os.remove(self.path)
+                except OSError:
+                    pass
+                return
+            tmp_path = self.path + ".tmp"
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    f.writelines(lines)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.path)
+            except OSError:
+                pass  # the old, longer journal is still correct
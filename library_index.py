@@ -0,0 +1,354 @@
+# library_index.py
+# dependencies
+import re
+import sqlite3
+import threading
+import time
+from typing import Optional, Dict, Any, Iterable, List, Sequence, Set, Tuple
+
+from models import PlaylistItem
+
+LIBRARY_FILE = "library_index.sqlite3"
+
+# how long a full listing is trusted for "already in the playlist?" checks; our own
+# writes keep the index current, this only covers changes made elsewhere (web, phone)
+FRESH_SECONDS = 10 * 60
+
+# full-text index of titles and video ids; external content (the text lives in
+# library_items), rows are added/removed next to their library_items rows
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE library_fts USING fts5(
+    title, video_id,
+    content='library_items', content_rowid='rowid',
+    tokenize='unicode61 remove_diacritics 2'
+);
+INSERT INTO library_fts (library_fts) VALUES ('rebuild');
+"""
+
+# words of a search box query; anything else (quotes, operators) is dropped
+_WORD = re.compile(r"[\w-]+")
+
+
+class LibraryIndex:
+    """
+    Local index of every video in the user's playlists:
+    video_id -> {playlist_id: [playlist_item_id, ...]}.
+
+    YouTubeClient keeps it current: a fully listed playlist replaces that playlist's
+    rows, inserts/deletes patch them. Answers "is this video already in that playlist"
+    and "which videos are in my library more than once" without any API calls.
+
+    A playlist only counts as indexed once it has been listed completely
+    (see indexed_playlists), partial loads never replace its rows.
+
+    search() ranks titles with SQLite FTS5 when the sqlite3 build has it (it
+    falls back to a plain substring match otherwise, see has_fts).
+    """
+
+    def __init__(self, path: str = LIBRARY_FILE) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS library_items (
+                playlist_item_id TEXT PRIMARY KEY,
+                playlist_id TEXT NOT NULL,
+                video_id TEXT,
+                title TEXT,
+                position INTEGER
+            );
+            CREATE INDEX IF NOT EXISTS library_items_video ON library_items (video_id);
+            CREATE INDEX IF NOT EXISTS library_items_playlist ON library_items (playlist_id);
+            CREATE TABLE IF NOT EXISTS indexed_playlists (
+                playlist_id TEXT PRIMARY KEY,
+                item_count INTEGER NOT NULL,
+                indexed_at REAL NOT NULL
+            );
+            """
+        )
+        self.has_fts = self._create_fts()
+        self._conn.commit()
+
+    def _create_fts(self) -> bool:
+        exists = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'library_fts'"
+        ).fetchone()
+        if exists:
+            return True
+        try:
+            # one transaction: an index file from before FTS gets its existing rows indexed
+            self._conn.executescript("BEGIN;" + _FTS_SCHEMA + "COMMIT;")
+        except sqlite3.OperationalError:
+            # sqlite3 built without FTS5
+            if self._conn.in_transaction:
+                self._conn.rollback()
+            return False
+        return True
+
+    # ------------------------------------------------------------------
+    # Updating
+    # ------------------------------------------------------------------
+
+    def replace_playlist(self, playlist_id: str, items: Sequence[PlaylistItem]) -> None:
+        """The complete, current contents of a playlist (after listing every page)."""
+        with self._lock:
+            # only touch what changed: a re-listed playlist is usually identical, and
+            # re-indexing 10k+ unchanged titles on every refresh would be the slow part
+            existing = {
+                row[0]: row[1:]
+                for row in self._conn.execute(
+                    "SELECT playlist_item_id, video_id, title, position FROM library_items "
+                    "WHERE playlist_id = ?",
+                    (playlist_id,),
+                )
+            }
+            listed = {it.playlist_item_id for it in items}
+            changed, moved = [], []
+            for it in items:
+                old = existing.get(it.playlist_item_id)
+                if old is None or old[:2] != (it.video_id, it.title):
+                    changed.append(it)
+                elif old[2] != it.position:
+                    moved.append((it.position, it.playlist_item_id))
+            self._delete_ids(
+                [pid for pid in existing if pid not in listed]
+                + [it.playlist_item_id for it in changed]
+            )
+            self._insert(playlist_id, changed)
+            # position isn't in the full-text index, a plain update will do
+            self._conn.executemany(
+                "UPDATE library_items SET position = ? WHERE playlist_item_id = ?", moved
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO indexed_playlists VALUES (?, ?, ?)",
+                (playlist_id, len(items), time.time()),
+            )
+            self._conn.commit()
+
+    def add_items(self, playlist_id: str, items: Iterable[PlaylistItem]) -> None:
+        items = list(items)
+        if not items:
+            return
+        with self._lock:
+            self._delete_ids([it.playlist_item_id for it in items])
+            self._insert(playlist_id, items)
+            self._recount(playlist_id)
+            self._conn.commit()
+
+    def remove_items(self, playlist_item_ids: Iterable[str]) -> None:
+        ids = [(pid,) for pid in playlist_item_ids]
+        if not ids:
+            return
+        with self._lock:
+            owners = {
+                row[0]
+                for chunk in _chunks(ids, 500)
+                for row in self._conn.execute(
+                    "SELECT DISTINCT playlist_id FROM library_items WHERE playlist_item_id IN (%s)"
+                    % ",".join("?" * len(chunk)),
+                    [i for (i,) in chunk],
+                )
+            }
+            self._delete_ids([i for (i,) in ids])
+            for playlist_id in owners:
+                self._recount(playlist_id)
+            self._conn.commit()
+
+    def forget_playlist(self, playlist_id: str) -> None:
+        with self._lock:
+            self._delete_where("playlist_id = ?", (playlist_id,))
+            self._conn.execute("DELETE FROM indexed_playlists WHERE playlist_id = ?", (playlist_id,))
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM library_items")
+            self._conn.execute("DELETE FROM indexed_playlists")
+            if self.has_fts:
+                self._conn.execute("INSERT INTO library_fts (library_fts) VALUES ('delete-all')")
+            self._conn.commit()
+
+    def _insert(self, playlist_id: str, items: Sequence[PlaylistItem]) -> None:
+        # callers delete the ids first (_delete_ids), so the full-text index never
+        # keeps the text of a row that INSERT OR REPLACE dropped
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO library_items VALUES (?, ?, ?, ?, ?)",
+            [
+                (it.playlist_item_id, playlist_id, it.video_id, it.title, it.position)
+                for it in items
+            ],
+        )
+        if self.has_fts:
+            for chunk in _chunks([it.playlist_item_id for it in items], 500):
+                self._conn.execute(
+                    "INSERT INTO library_fts (rowid, title, video_id) "
+                    "SELECT rowid, title, video_id FROM library_items "
+                    "WHERE playlist_item_id IN (%s)" % ",".join("?" * len(chunk)),
+                    chunk,
+                )
+
+    def _delete_where(self, where: str, params: Sequence[Any]) -> None:
+        if self.has_fts:
+            # external content: FTS5 needs the old text to remove a row's terms
+            self._conn.execute(
+                "INSERT INTO library_fts (library_fts, rowid, title, video_id) "
+                "SELECT 'delete', rowid, title, video_id FROM library_items WHERE " + where,
+                params,
+            )
+        self._conn.execute("DELETE FROM library_items WHERE " + where, params)
+
+    def _delete_ids(self, playlist_item_ids: Sequence[str]) -> None:
+        for chunk in _chunks(playlist_item_ids, 500):
+            self._delete_where("playlist_item_id IN (%s)" % ",".join("?" * len(chunk)), chunk)
+
+    def _recount(self, playlist_id: str) -> None:
+        self._conn.execute(
+            "UPDATE indexed_playlists SET item_count = "
+            "(SELECT COUNT(*) FROM library_items WHERE playlist_id = ?) WHERE playlist_id = ?",
+            (playlist_id, playlist_id),
+        )
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def indexed_playlists(self) -> Dict[str, int]:
+        """playlist_id -> item count, for every playlist that was listed completely."""
+        with self._lock:
+            return dict(self._conn.execute("SELECT playlist_id, item_count FROM indexed_playlists"))
+
+    def indexed_at(self, playlist_id: str) -> Optional[float]:
+        """When the playlist was last listed completely (None = never)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT indexed_at FROM indexed_playlists WHERE playlist_id = ?", (playlist_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def is_fresh(self, playlist_id: str, max_age: float = FRESH_SECONDS) -> bool:
+        indexed_at = self.indexed_at(playlist_id)
+        return indexed_at is not None and time.time() - indexed_at <= max_age
+
+    def locations(self, video_id: str) -> Dict[str, List[str]]:
+        """{playlist_id: [playlist_item_id, ...]} for every copy of this video."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT playlist_id, playlist_item_id FROM library_items "
+                "WHERE video_id = ? ORDER BY playlist_id, position",
+                (video_id,),
+            ).fetchall()
+        out: Dict[str, List[str]] = {}
+        for playlist_id, playlist_item_id in rows:
+            out.setdefault(playlist_id, []).append(playlist_item_id)
+        return out
+
+    def present_in(self, playlist_id: str, video_ids: Iterable[str]) -> Set[str]:
+        """The subset of video_ids already in the playlist."""
+        wanted = list(set(video_ids))
+        found: Set[str] = set()
+        with self._lock:
+            for chunk in _chunks(wanted, 500):
+                found.update(
+                    row[0]
+                    for row in self._conn.execute(
+                        "SELECT DISTINCT video_id FROM library_items "
+                        "WHERE playlist_id = ? AND video_id IN (%s)" % ",".join("?" * len(chunk)),
+                        [playlist_id, *chunk],
+                    )
+                )
+        return found
+
+    def search(self, query: str, limit: int = 200) -> List[Dict[str, Any]]:
+        """
+        Videos in the library whose title (or id) matches every word of `query`,
+        best match first. Words match as prefixes ("mozar" finds "Mozart"),
+        case and accents are ignored:
+          video_id, title, locations ({playlist_id: [playlist_item_id, ...]})
+        """
+        words = _WORD.findall(query)
+        if not words:
+            return []
+        with self._lock:
+            if self.has_fts:
+                match = " ".join('"%s"*' % w.replace('"', "") for w in words)
+                hits = """
+                    SELECT li.video_id, MIN(f.rank) AS score
+                    FROM library_fts f JOIN library_items li ON li.rowid = f.rowid
+                    WHERE library_fts MATCH ? AND li.video_id IS NOT NULL
+                    GROUP BY li.video_id ORDER BY score LIMIT ?
+                """
+                params: List[Any] = [match, limit]
+            else:
+                hits = """
+                    SELECT video_id, MIN(position) AS score FROM library_items
+                    WHERE video_id IS NOT NULL AND %s
+                    GROUP BY video_id ORDER BY score LIMIT ?
+                """ % " AND ".join(["(title LIKE ? OR video_id = ?)"] * len(words))
+                params = [v for w in words for v in (f"%{w}%", w)] + [limit]
+            rows = self._conn.execute(
+                f"""
+                SELECT li.video_id, li.title, li.playlist_id, li.playlist_item_id
+                FROM ({hits}) h JOIN library_items li ON li.video_id = h.video_id
+                ORDER BY h.score, li.video_id, li.playlist_id, li.position
+                """,
+                params,
+            ).fetchall()
+
+        results: Dict[str, Dict[str, Any]] = {}
+        for video_id, title, playlist_id, playlist_item_id in rows:
+            entry = results.setdefault(
+                video_id, {"video_id": video_id, "title": title, "locations": {}}
+            )
+            entry["locations"].setdefault(playlist_id, []).append(playlist_item_id)
+        return list(results.values())
+
+    def duplicates(self) -> List[Dict[str, Any]]:
+        """
+        Videos that occur more than once anywhere in the library, most copies first:
+          video_id, title, count, locations ({playlist_id: [playlist_item_id, ...]})
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT li.video_id, li.title, li.playlist_id, li.playlist_item_id, d.n
+                FROM library_items li
+                JOIN (
+                    SELECT video_id, COUNT(*) AS n FROM library_items
+                    WHERE video_id IS NOT NULL GROUP BY video_id HAVING n > 1
+                ) d ON d.video_id = li.video_id
+                ORDER BY d.n DESC, li.video_id, li.playlist_id, li.position
+                """
+            ).fetchall()
+
+        report: Dict[str, Dict[str, Any]] = {}
+        for video_id, title, playlist_id, playlist_item_id, count in rows:
+            entry = report.setdefault(
+                video_id, {"video_id": video_id, "title": title, "count": count, "locations": {}}
+            )
+            entry["locations"].setdefault(playlist_id, []).append(playlist_item_id)
+        return list(report.values())
+
+
+def _chunks(seq: Sequence[Any], size: int) -> Iterable[Sequence[Any]]:
+    # SQLite caps the number of ? parameters per statement
+    for start in range(0, len(seq), size):
+        yield seq[start:start + size]
+
+
+def split_new_videos(
+    video_ids: Sequence[str], already_present: Set[str]
+) -> Tuple[List[str], List[str]]:
+    """
+    (to_insert, skipped): drops videos already in the target and repeats within
+    video_ids itself, keeping the original order.
+    """
+    seen = set(already_present)
+    to_insert, skipped = [], []
+    for vid in video_ids:
+        if vid in seen:
+            skipped.append(vid)
+        else:
+            seen.add(vid)
+            to_insert.append(vid)
+    return to_insert, skipped
@@ -0,0 +1,219 @@
+# metrics.py
+# dependencies
+import bisect
+import json
+import os
+import sys
+import threading
+import time
+from typing import Optional, Dict, Any, List
+
+METRICS_DIR = "metrics"
+
+# latency histogram bucket upper bounds in seconds: 1 ms .. ~2 min, 25% apart, so a
+# percentile read from the buckets is off by at most a quarter (plenty for p50/p95/p99)
+# and memory stays fixed however many calls are recorded
+BUCKETS: List[float] = []
+_bound = 0.001
+while _bound < 120:
+    BUCKETS.append(round(_bound, 6))
+    _bound *= 1.25
+del _bound
+
+PERCENTILES = (50, 95, 99)
+
+
+class _EndpointStats:
+    __slots__ = (
+        "http_calls", "requests", "errors", "not_modified", "retries", "units",
+        "bytes_in", "bytes_out", "seconds", "max_seconds", "throttled_seconds", "histogram",
+    )
+
+    def __init__(self) -> None:
+        self.http_calls = 0      # round-trips (a batch is one)
+        self.requests = 0        # API requests, batch sub-requests counted one by one
+        self.errors = 0          # round-trips that raised (after retries)
+        self.not_modified = 0    # 304s from ETag revalidation
+        self.retries = 0
+        self.units = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.throttled_seconds = 0.0  # waited on the client-side rate limiter
+        self.histogram = [0] * (len(BUCKETS) + 1)  # last one = slower than BUCKETS[-1]
+
+    def percentile(self, p: float) -> Optional[float]:
+        total = sum(self.histogram)
+        if not total:
+            return None
+        rank = total * p / 100.0
+        seen = 0
+        for index, count in enumerate(self.histogram):
+            seen += count
+            if seen >= rank:
+                return BUCKETS[index] if index < len(BUCKETS) else self.max_seconds
+        return self.max_seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        timed = sum(self.histogram)
+        out = {name: getattr(self, name) for name in self.__slots__ if name != "histogram"}
+        out["mean_seconds"] = self.seconds / timed if timed else None
+        for p in PERCENTILES:
+            out[f"p{p}_seconds"] = self.percentile(p)
+        return out
+
+
+class Metrics:
+    """
+    Per-endpoint counters for everything YouTubeClient sends: round-trips, requests,
+    errors, 304s, retries, quota units, bytes in/out and a latency histogram
+    (p50/p95/p99). Thread-safe; HomePage shows snapshot() live and app.py dumps it
+    to METRICS_DIR when the window closes, one file per run.
+
+    Endpoints are the API method names ("playlistItems.list"); a batch is recorded
+    under the endpoint of its sub-requests.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stats: Dict[str, _EndpointStats] = {}
+        self.started_at = time.time()
+
+    def _get(self, endpoint: str) -> _EndpointStats:
+        stats = self._stats.get(endpoint)
+        if stats is None:
+            stats = self._stats[endpoint] = _EndpointStats()
+        return stats
+
+    # ------------------------------------------------------------------
+    # Recording (YouTubeClient)
+    # ------------------------------------------------------------------
+
+    def record_call(
+        self,
+        endpoint: str,
+        seconds: float,
+        requests: int = 1,
+        outcome: str = "ok",
+        bytes_in: int = 0,
+        bytes_out: int = 0,
+    ) -> None:
+        """One HTTP round-trip; outcome is "ok", "not_modified" or "error"."""
+        with self._lock:
+            stats = self._get(endpoint)
+            stats.http_calls += 1
+            stats.requests += requests
+            if outcome == "error":
+                stats.errors += 1
+            elif outcome == "not_modified":
+                stats.not_modified += 1
+            stats.bytes_in += bytes_in
+            stats.bytes_out += bytes_out
+            stats.seconds += seconds
+            stats.max_seconds = max(stats.max_seconds, seconds)
+            stats.histogram[bisect.bisect_left(BUCKETS, seconds)] += 1
+
+    def record_retry(self, endpoint: str, count: int = 1) -> None:
+        with self._lock:
+            self._get(endpoint).retries += count
+
+    def record_units(self, endpoint: str, units: int) -> None:
+        with self._lock:
+            self._get(endpoint).units += units
+
+    def record_throttle(self, endpoint: str, seconds: float) -> None:
+        if seconds <= 0:
+            return
+        with self._lock:
+            self._get(endpoint).throttled_seconds += seconds
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """{endpoint: stats dict}, plus "total" summed over all endpoints (latency from all calls)."""
+        with self._lock:
+            endpoints = {name: stats.to_dict() for name, stats in sorted(self._stats.items())}
+            total = _EndpointStats()
+            for stats in self._stats.values():
+                for name in _EndpointStats.__slots__:
+                    if name == "histogram":
+                        total.histogram = [a + b for a, b in zip(total.histogram, stats.histogram)]
+                    elif name == "max_seconds":
+                        total.max_seconds = max(total.max_seconds, stats.max_seconds)
+                    else:
+                        setattr(total, name, getattr(total, name) + getattr(stats, name))
+        if endpoints:
+            endpoints["total"] = total.to_dict()
+        return endpoints
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats = {}
+            self.started_at = time.time()
+
+    def dump(self, path: Optional[str] = None) -> Optional[str]:
+        """
+        Write the snapshot as JSON (default: METRICS_DIR/run-<start time>.json).
+        Nothing is written for a run without API calls. Returns the path written.
+        """
+        endpoints = self.snapshot()
+        if not endpoints:
+            return None
+        if path is None:
+            stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(self.started_at))
+            path = os.path.join(METRICS_DIR, f"run-{stamp}.json")
+        data = {
+            "started_at": self.started_at,
+            "ended_at": time.time(),
+            "endpoints": endpoints,
+        }
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+        except OSError:
+            return None
+        return path
+
+
+# ----------------------------------------------------------------------
+# Comparing two runs:  python metrics.py metrics/run-A.json metrics/run-B.json
+# ----------------------------------------------------------------------
+
+def _ms(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value * 1000:.0f}"
+
+
+def compare(before: Dict[str, Any], after: Dict[str, Any]) -> List[str]:
+    lines = [
+        f"{'endpoint':<24}{'calls':>14}{'units':>18}{'p50 ms':>14}{'p95 ms':>14}{'KiB in':>16}"
+    ]
+    a, b = before["endpoints"], after["endpoints"]
+    for name in sorted(set(a) | set(b), key=lambda n: (n == "total", n)):
+        x, y = a.get(name, {}), b.get(name, {})
+
+        def pair(key: str, fmt=lambda v: f"{v:,}") -> str:
+            vx, vy = x.get(key), y.get(key)
+            return f"{'-' if vx is None else fmt(vx)} > {'-' if vy is None else fmt(vy)}"
+
+        lines.append(
+            f"{name:<24}{pair('http_calls'):>14}{pair('units'):>18}"
+            f"{pair('p50_seconds', _ms):>14}{pair('p95_seconds', _ms):>14}"
+            f"{pair('bytes_in', lambda v: f'{v / 1024:,.0f}'):>16}"
+        )
+    return lines
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        sys.exit("usage: python metrics.py BEFORE.json AFTER.json")
+    runs = []
+    for path in sys.argv[1:]:
+        with open(path, "r", encoding="utf-8") as f:
+            runs.append(json.load(f))
+    print("\n".join(compare(*runs)))
@@ -0,0 +1,157 @@
+# models.py
+# dependencies
+import re
+import sys
+from dataclasses import dataclass, fields
+from typing import Optional, Dict, Any, List
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    # the same channel title / privacy status repeats thousands of times in a big
+    # library; json.loads hands out a fresh str for every occurrence
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+# contentDetails.duration, e.g. "PT1H2M3S" ("P0D" for upcoming live streams)
+_DURATION_RE = re.compile(r"P(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?$")
+
+
+def _duration_seconds(value: Optional[str]) -> Optional[int]:
+    match = _DURATION_RE.match(value or "")
+    if not match:
+        return None
+    days, hours, minutes, seconds = (int(part or 0) for part in match.groups())
+    return ((days * 24 + hours) * 60 + minutes) * 60 + seconds
+
+
+class _Record:
+    """
+    Shared bits of the record types below.
+
+    They are slotted dataclasses: no per-instance __dict__, so a 50k item library
+    is a lot smaller than the same data as dicts. Caches (SQLite/JSON) still store
+    plain dicts, to_dict()/from_dict() convert at that boundary.
+    """
+
+    __slots__ = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]):
+        # ignore unknown keys, so older/newer cache rows still load
+        return cls(**{f.name: data.get(f.name) for f in fields(cls)})
+
+
+@dataclass(slots=True)
+class Playlist(_Record):
+    id: str
+    title: Optional[str] = None
+    item_count: Optional[int] = None
+    privacy_status: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        self.privacy_status = _intern(self.privacy_status)
+
+    @classmethod
+    def from_resource(cls, item: Dict[str, Any]) -> "Playlist":
+        """Build from a playlists.list resource."""
+        return cls(
+            id=item.get("id"),
+            title=item.get("snippet", {}).get("title"),
+            item_count=item.get("contentDetails", {}).get("itemCount"),
+            privacy_status=item.get("status", {}).get("privacyStatus"),
+        )
+
+
+@dataclass(slots=True)
+class PlaylistItem(_Record):
+    """A video in a playlist. position is mutable, PlaylistWindow renumbers locally."""
+
+    playlist_item_id: str
+    video_id: Optional[str] = None
+    title: Optional[str] = None
+    position: Optional[int] = None
+    channel_title: Optional[str] = None  # the video's uploader, not the playlist owner
+
+    def __post_init__(self) -> None:
+        # the same video often sits in several playlists
+        self.video_id = _intern(self.video_id)
+        self.channel_title = _intern(self.channel_title)
+
+    @classmethod
+    def from_resource(cls, it: Dict[str, Any]) -> "PlaylistItem":
+        """Build from a playlistItems.list / playlistItems.insert resource."""
+        snippet = it.get("snippet", {})
+        content = it.get("contentDetails", {})
+        return cls(
+            playlist_item_id=it.get("id"),
+            # insert responses (part=snippet) only have it under snippet.resourceId
+            video_id=content.get("videoId") or snippet.get("resourceId", {}).get("videoId"),
+            title=snippet.get("title"),
+            position=snippet.get("position"),
+            # missing for deleted / private videos
+            channel_title=snippet.get("videoOwnerChannelTitle"),
+        )
+
+
+@dataclass(slots=True)
+class SearchResult(_Record):
+    video_id: str
+    title: Optional[str] = None
+    channel_title: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        self.channel_title = _intern(self.channel_title)
+
+    @classmethod
+    def from_resource(cls, item: Dict[str, Any]) -> Optional["SearchResult"]:
+        """Build from a search.list resource; None for non-video hits."""
+        video_id = item.get("id", {}).get("videoId")
+        if not video_id:
+            return None
+        snippet = item.get("snippet", {})
+        return cls(
+            video_id=video_id,
+            title=snippet.get("title"),
+            channel_title=snippet.get("channelTitle"),
+        )
+
+
+@dataclass(slots=True)
+class VideoInfo(_Record):
+    """
+    videos.list details of one video (see video_cache.py). found=False means
+    videos.list didn't return it at all: deleted, or someone else's private video.
+    """
+
+    video_id: str
+    found: bool = True
+    duration_seconds: Optional[int] = None
+    privacy_status: Optional[str] = None
+    upload_status: Optional[str] = None  # "processed", or "rejected" / "failed" / "deleted"
+    blocked_regions: Optional[List[str]] = None  # contentDetails.regionRestriction
+    allowed_regions: Optional[List[str]] = None
+    view_count: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        self.privacy_status = _intern(self.privacy_status)
+        self.upload_status = _intern(self.upload_status)
+
+    @classmethod
+    def from_resource(cls, item: Dict[str, Any]) -> "VideoInfo":
+        """Build from a videos.list resource (part=contentDetails,status,statistics)."""
+        content = item.get("contentDetails", {})
+        status = item.get("status", {})
+        restriction = content.get("regionRestriction", {})
+        views = item.get("statistics", {}).get("viewCount")  # a string, hidden by some uploaders
+        return cls(
+            video_id=item.get("id"),
+            duration_seconds=_duration_seconds(content.get("duration")),
+            privacy_status=status.get("privacyStatus"),
+            upload_status=status.get("uploadStatus"),
+            blocked_regions=restriction.get("blocked"),
+            allowed_regions=restriction.get("allowed"),
+            view_count=int(views) if views is not None else None,
+        )
@@ -0,0 +1,162 @@
+# playlist_cache.py
+# dependencies
+import json
+import sqlite3
+import threading
+import time
+from typing import Optional, Dict, Any, List
+
+# lives next to token.pickle, keep it out of git too
+CACHE_FILE = "playlist_cache.sqlite3"
+
+# list keys (one cached list per key, stored page by page)
+MY_PLAYLISTS_KEY = "playlists:mine"
+
+
+def playlist_items_key(playlist_id: str) -> str:
+    return f"playlistItems:{playlist_id}"
+
+
+class PlaylistCache:
+    """
+    On-disk (SQLite) cache of list responses, stored per page together with the ETag
+    Google sent for that page.
+
+    YouTubeClient sends the ETag back as If-None-Match; when Google answers 304 the
+    page is served from here instead of being downloaded again.
+    Survives restarts; YouTubeClient invalidates the affected lists on local writes.
+
+    stats (observable from the UI):
+      hits          pages served from disk
+      misses        pages downloaded in full (nothing cached, or content changed)
+      not_modified  304 responses received
+    """
+
+    def __init__(self, path: str = CACHE_FILE) -> None:
+        self.path = path
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0, "not_modified": 0}
+        self._lock = threading.Lock()
+        # one connection shared by the worker threads, serialized by self._lock
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS pages (
+                list_key TEXT NOT NULL,
+                page_index INTEGER NOT NULL,
+                page_token TEXT,
+                next_page_token TEXT,
+                etag TEXT,
+                items_json TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                PRIMARY KEY (list_key, page_index)
+            );
+            CREATE TABLE IF NOT EXISTS item_owner (
+                playlist_item_id TEXT PRIMARY KEY,
+                playlist_id TEXT NOT NULL
+            );
+            """
+        )
+        self._conn.commit()
+
+    # ------------------------------------------------------------------
+    # Pages
+    # ------------------------------------------------------------------
+
+    def get_page(self, list_key: str, page_index: int) -> Optional[Dict[str, Any]]:
+        """Return the cached page as a dict (page_token, next_page_token, etag, items) or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT page_token, next_page_token, etag, items_json FROM pages "
+                "WHERE list_key = ? AND page_index = ?",
+                (list_key, page_index),
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            "page_token": row[0],
+            "next_page_token": row[1],
+            "etag": row[2],
+            "items": json.loads(row[3]),
+        }
+
+    def put_page(
+        self,
+        list_key: str,
+        page_index: int,
+        page_token: Optional[str],
+        next_page_token: Optional[str],
+        etag: Optional[str],
+        items: List[Dict[str, Any]],
+    ) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    list_key,
+                    page_index,
+                    page_token,
+                    next_page_token,
+                    etag,
+                    json.dumps(items),
+                    time.time(),
+                ),
+            )
+            # remember which playlist an item lives in, so deletes can invalidate it
+            if list_key.startswith("playlistItems:"):
+                playlist_id = list_key.split(":", 1)[1]
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO item_owner VALUES (?, ?)",
+                    [(it["playlist_item_id"], playlist_id) for it in items],
+                )
+            self._conn.commit()
+
+    def trim(self, list_key: str, page_count: int) -> None:
+        """Drop pages past the end of the list (it got shorter since last time)."""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM pages WHERE list_key = ? AND page_index >= ?",
+                (list_key, page_count),
+            )
+            self._conn.commit()
+
+    def record(self, stat: str, count: int = 1) -> None:
+        with self._lock:
+            self.stats[stat] = self.stats.get(stat, 0) + count
+
+    # ------------------------------------------------------------------
+    # Invalidation
+    # ------------------------------------------------------------------
+
+    def invalidate(self, list_key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM pages WHERE list_key = ?", (list_key,))
+            self._conn.commit()
+
+    def invalidate_playlist(self, playlist_id: str) -> None:
+        """A playlist's items changed: drop its items and the playlists list (item counts)."""
+        self.invalidate(playlist_items_key(playlist_id))
+        self.invalidate(MY_PLAYLISTS_KEY)
+
+    def invalidate_item(self, playlist_item_id: str) -> None:
+        """Invalidate whatever playlist this item was cached under (if we know it)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT playlist_id FROM item_owner WHERE playlist_item_id = ?",
+                (playlist_item_id,),
+            ).fetchone()
+            self._conn.execute(
+                "DELETE FROM item_owner WHERE playlist_item_id = ?", (playlist_item_id,)
+            )
+            self._conn.commit()
+        if row is not None:
+            self.invalidate_playlist(row[0])
+        else:
+            self.invalidate(MY_PLAYLISTS_KEY)
+
+    def clear(self) -> None:
+        """Forget everything (e.g. on logout, the next account has other playlists)."""
+        with self._lock:
+            self._conn.execute("DELETE FROM pages")
+            self._conn.execute("DELETE FROM item_owner")
+            self._conn.commit()
+            self.stats = {"hits": 0, "misses": 0, "not_modified": 0}
@@ -0,0 +1,245 @@
+# playlist_io.py
+# dependencies
+import csv
+import json
+import os
+import threading
+from typing import Optional, Dict, Any, Callable, Iterable, Iterator, List, TextIO
+
+from models import PlaylistItem
+from youtube_client import BATCH_SIZE, YouTubeClient
+
+# Backup / restore of playlists as JSON Lines or CSV, one row per playlist item.
+# Both directions stream: export writes each page as it arrives, import reads the
+# file BATCH_SIZE rows at a time, so neither ever holds a whole library in memory.
+
+FORMATS = ("jsonl", "csv")
+
+# column order of the CSV (and key order of the JSON lines)
+COLUMNS = ("playlist_id", "playlist_item_id", "video_id", "title", "position")
+
+# json.dumps() with non-default options builds a new encoder on every call,
+# which is most of the time spent per row
+_json_encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def format_for(path: str, fmt: Optional[str] = None) -> str:
+    """Explicit fmt wins, otherwise the file extension decides (.csv, anything else = jsonl)."""
+    if fmt:
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown format {fmt!r}, expected one of {', '.join(FORMATS)}.")
+        return fmt
+    return "csv" if os.path.splitext(path)[1].lower() == ".csv" else "jsonl"
+
+
+# ----------------------------------------------------------------------
+# Writing
+# ----------------------------------------------------------------------
+
+class ItemWriter:
+    """
+    Writes playlist items to an open text stream as JSONL or CSV.
+    Safe to share between threads (cli.py exports several playlists at once).
+    """
+
+    def __init__(self, out: TextIO, fmt: str = "jsonl") -> None:
+        self.out = out
+        self.fmt = format_for("", fmt)
+        self.rows = 0
+        self._lock = threading.Lock()
+        self._csv = None
+        if self.fmt == "csv":
+            self._csv = csv.writer(out)
+            self._csv.writerow(COLUMNS)
+
+    def write_page(self, playlist_id: str, items: Iterable[PlaylistItem]) -> None:
+        # one page = one write, the lock is taken once per 50 rows
+        rows = [
+            (playlist_id, it.playlist_item_id, it.video_id, it.title, it.position)
+            for it in items
+        ]
+        with self._lock:
+            if self._csv is not None:
+                self._csv.writerows(rows)
+            else:
+                encode = _json_encoder.encode
+                self.out.write("".join(encode(dict(zip(COLUMNS, row))) + "\n" for row in rows))
+            self.rows += len(rows)
+
+    def flush(self) -> None:
+        with self._lock:
+            self.out.flush()
+
+
+def export_items(
+    client: YouTubeClient,
+    playlist_ids: Iterable[str],
+    writer: ItemWriter,
+    progress: Optional[Callable[[int], None]] = None,
+    should_stop: Optional[Callable[[], bool]] = None,
+) -> bool:
+    """
+    Write every item of the playlists to `writer`, page by page (1 unit per 50 items,
+    304s from the playlist cache included). Returns False if should_stop() ended it early.
+    """
+    for playlist_id in playlist_ids:
+        for page in client.iter_playlist_item_pages(playlist_id):
+            writer.write_page(playlist_id, page)
+            if progress:
+                progress(writer.rows)
+            if should_stop and should_stop():
+                return False
+    writer.flush()
+    return True
+
+
+def export_to_file(
+    client: YouTubeClient,
+    playlist_ids: Iterable[str],
+    path: str,
+    fmt: Optional[str] = None,
+    progress: Optional[Callable[[int], None]] = None,
+    should_stop: Optional[Callable[[], bool]] = None,
+) -> Optional[int]:
+    """
+    export_items into `path` (format from fmt or the extension). Written to a temp
+    file first, so a failed or stopped export never replaces an older backup.
+    Returns the number of rows written, or None if should_stop() ended it.
+    """
+    fmt = format_for(path, fmt)
+    tmp_path = path + ".tmp"
+    try:
+        # newline="" so csv writes its own \r\n line ends untouched
+        with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+            writer = ItemWriter(f, fmt)
+            finished = export_items(client, playlist_ids, writer, progress, should_stop)
+        if not finished:
+            os.remove(tmp_path)
+            return None
+        os.replace(tmp_path, path)
+        return writer.rows
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+# ----------------------------------------------------------------------
+# Reading
+# ----------------------------------------------------------------------
+
+def iter_rows(f: TextIO, fmt: str = "jsonl") -> Iterator[Dict[str, Any]]:
+    """Rows of an export file as dicts with the COLUMNS keys (position as int or None)."""
+    if format_for("", fmt) == "csv":
+        rows: Iterable[Dict[str, Any]] = csv.DictReader(f)
+    else:
+        rows = _json_rows(f)
+    for row in rows:
+        position = row.get("position")
+        if isinstance(position, str):
+            position = int(position) if position.strip() else None
+        yield {
+            "playlist_id": row.get("playlist_id") or None,
+            "playlist_item_id": row.get("playlist_item_id") or None,
+            "video_id": row.get("video_id") or None,
+            "title": row.get("title") or None,
+            "position": position,
+        }
+
+
+def _json_rows(f: TextIO) -> Iterator[Dict[str, Any]]:
+    for line_no, line in enumerate(f, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError:
+            raise ValueError(f"Line {line_no} is not valid JSON.") from None
+        if not isinstance(row, dict):
+            raise ValueError(f"Line {line_no} is not a JSON object.")
+        yield row
+
+
+def read_rows(path: str, fmt: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    fmt = format_for(path, fmt)
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        yield from iter_rows(f, fmt)
+
+
+# ----------------------------------------------------------------------
+# Importing
+# ----------------------------------------------------------------------
+
+def import_rows(
+    client: YouTubeClient,
+    playlist_id: str,
+    rows: Iterable[Dict[str, Any]],
+    source_playlist_id: Optional[str] = None,
+    progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+    should_stop: Optional[Callable[[], bool]] = None,
+) -> Dict[str, Any]:
+    """
+    Insert the videos of `rows` (file order) into playlist_id, BATCH_SIZE per batch
+    HTTP call. Videos already in the playlist, or repeated in the file, are skipped
+    for free (insert_playlist_items(skip_existing=True)). source_playlist_id only takes
+    the rows of that playlist from a multi-playlist export.
+
+    Returns (and passes to progress after every batch) a summary:
+      read, inserted, skipped, failed, errors ([{video_id, error}]), stopped
+    """
+    summary: Dict[str, Any] = {
+        "read": 0, "inserted": 0, "skipped": 0, "failed": 0, "errors": [], "stopped": False,
+    }
+
+    def flush(chunk: List[str]) -> None:
+        results = client.insert_playlist_items(
+            playlist_id, chunk, should_stop=should_stop, skip_existing=True
+        )
+        for res in results:
+            if res.get("skipped"):
+                summary["skipped"] += 1
+            elif res["ok"]:
+                summary["inserted"] += 1
+            else:
+                summary["failed"] += 1
+                summary["errors"].append({"video_id": res["key"], "error": str(res["error"])})
+        if len(results) < len(chunk):
+            summary["stopped"] = True
+        if progress:
+            progress(summary)
+
+    chunk: List[str] = []
+    for row in rows:
+        if source_playlist_id and row["playlist_id"] != source_playlist_id:
+            continue
+        if not row["video_id"]:
+            continue  # deleted/private video, nothing to re-add
+        summary["read"] += 1
+        chunk.append(row["video_id"])
+        if len(chunk) == BATCH_SIZE:
+            flush(chunk)
+            chunk = []
+            if summary["stopped"] or (should_stop and should_stop()):
+                summary["stopped"] = True
+                return summary
+    if chunk:
+        flush(chunk)
+    return summary
+
+
+def import_file(
+    client: YouTubeClient,
+    playlist_id: str,
+    path: str,
+    fmt: Optional[str] = None,
+    source_playlist_id: Optional[str] = None,
+    progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+    should_stop: Optional[Callable[[], bool]] = None,
+) -> Dict[str, Any]:
+    """import_rows from an export file, see there."""
+    return import_rows(
+        client, playlist_id, read_rows(path, fmt), source_playlist_id, progress, should_stop
+    )
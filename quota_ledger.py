@@ -0,0 +1,272 @@
+# quota_ledger.py
+# dependencies
+import atexit
+import json
+import os
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import Optional, Dict
+
+# cross-process lock on the ledger file (the GUI and a cron'd cli.py share it)
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+try:
+    import msvcrt
+except ImportError:  # everything else
+    msvcrt = None
+
+# usage is kept per Google Cloud project, because that's what the quota belongs to
+LEDGER_FILE = "quota_ledger.json"
+
+# default YouTube Data API allowance per project per day
+DAILY_QUOTA = 10_000
+
+# charges are collected in memory and merged into the file once this many units are
+# pending or this many seconds have passed (and at exit), not on every 1 unit list call
+FLUSH_UNITS = 50
+FLUSH_SECONDS = 5.0
+
+# every ledger still alive, flushed by one atexit hook (weak: a client's ledger that
+# goes away flushes itself in __del__ instead of being kept alive until exit)
+_live_ledgers: "weakref.WeakSet[QuotaLedger]" = weakref.WeakSet()
+
+
+def _flush_live_ledgers() -> None:
+    for ledger in list(_live_ledgers):
+        ledger.flush()
+
+
+atexit.register(_flush_live_ledgers)
+
+
+def _pacific() -> tzinfo:
+    # Google resets the daily quota at midnight Pacific time
+    try:
+        from zoneinfo import ZoneInfo
+        return ZoneInfo("America/Los_Angeles")
+    except Exception:
+        # no tz database (e.g. Windows without the tzdata package): PST, ignores DST
+        return timezone(timedelta(hours=-8), "PST")
+
+
+PACIFIC = _pacific()
+
+
+def quota_day(now: Optional[datetime] = None) -> str:
+    """The quota day ('YYYY-MM-DD' in Pacific time) that `now` falls into."""
+    now = now or datetime.now(timezone.utc)
+    return now.astimezone(PACIFIC).date().isoformat()
+
+
+def next_reset(now: Optional[datetime] = None) -> datetime:
+    """Next Pacific midnight, as an aware datetime."""
+    now = (now or datetime.now(timezone.utc)).astimezone(PACIFIC)
+    tomorrow = now.date() + timedelta(days=1)
+    return datetime(tomorrow.year, tomorrow.month, tomorrow.day, tzinfo=PACIFIC)
+
+
+def project_id_from_client_secrets(path: str) -> str:
+    """Read the Cloud project id out of client_secrets.json ('default' if we can't)."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return "default"
+    section = data.get("installed") or data.get("web") or {}
+    return section.get("project_id") or "default"
+
+
+@contextmanager
+def file_lock(path: str, blocking: bool = True):
+    """
+    Exclusive lock on path + ".lock" while the block runs (no-op if the OS offers none).
+    blocking=False raises BlockingIOError right away if another process holds it.
+    """
+    with open(path + ".lock", "a+") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+        elif msvcrt is not None:
+            f.seek(0)
+            try:
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK, 1)
+            except OSError as e:
+                if blocking:
+                    raise
+                raise BlockingIOError(str(e)) from e
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            elif msvcrt is not None:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class QuotaLedger:
+    """
+    Persistent estimate of quota units spent today, per Google Cloud project.
+
+    YouTubeClient charges it once per HTTP request actually sent (every page of a
+    list, every sub-request of a batch). The numbers survive restarts and logout,
+    and roll over at Pacific midnight the same way Google's counter does.
+    Still an estimate: other apps using the same project are invisible to us.
+
+    Several processes (the GUI and a cron'd cli.py) can share the file: each one
+    only adds its own not-yet-written units (deltas) to what is on disk, under a
+    file lock, so nobody's usage is overwritten. Writes are batched, see FLUSH_UNITS
+    / FLUSH_SECONDS; flush() forces one.
+    """
+
+    def __init__(
+        self,
+        project_id: str = "default",
+        path: str = LEDGER_FILE,
+        daily_limit: int = DAILY_QUOTA,
+    ) -> None:
+        self.project_id = project_id
+        self.path = path
+        self.daily_limit = daily_limit
+        self._lock = threading.Lock()
+        self._day = quota_day()
+        self._used = 0  # on disk at the last sync + pending
+        self._by_endpoint: Dict[str, int] = {}
+        self._pending: Dict[str, int] = {}  # endpoint -> units not written yet
+        self._synced_at = time.monotonic()
+        self._load()
+        _live_ledgers.add(self)
+
+    def __del__(self) -> None:
+        try:
+            if self._pending:
+                self.flush()
+        except Exception:
+            pass  # interpreter shutdown; the atexit hook already ran
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def charge(self, endpoint: str, units: int) -> None:
+        if units <= 0:
+            return
+        with self._lock:
+            self._roll_over()
+            self._used += units
+            self._by_endpoint[endpoint] = self._by_endpoint.get(endpoint, 0) + units
+            self._pending[endpoint] = self._pending.get(endpoint, 0) + units
+            if (
+                sum(self._pending.values()) >= FLUSH_UNITS
+                or time.monotonic() - self._synced_at >= FLUSH_SECONDS
+            ):
+                self._sync()
+
+    def flush(self) -> None:
+        """Write pending charges now (and pick up what other processes wrote)."""
+        with self._lock:
+            self._sync()
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def used_today(self) -> int:
+        with self._lock:
+            self._roll_over()
+            # see other processes' charges without re-reading the file on every call
+            if time.monotonic() - self._synced_at >= FLUSH_SECONDS:
+                self._sync()
+            return self._used
+
+    def remaining(self) -> int:
+        return max(0, self.daily_limit - self.used_today())
+
+    def by_endpoint(self) -> Dict[str, int]:
+        with self._lock:
+            self._roll_over()
+            return dict(self._by_endpoint)
+
+    def can_afford(self, units: int) -> bool:
+        return units <= self.remaining()
+
+    def seconds_until_reset(self) -> float:
+        now = datetime.now(timezone.utc)
+        return max(0.0, (next_reset(now) - now).total_seconds())
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _roll_over(self) -> None:
+        today = quota_day()
+        if today != self._day:
+            self._sync()  # yesterday's pending units still belong to yesterday
+            # if that write failed they are written off, not carried into today's total
+            self._pending = {}
+            self._day = today
+            self._used = 0
+            self._by_endpoint = {}
+            self._load()
+
+    def _read(self) -> dict:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _load(self) -> None:
+        """Disk state for self._day, plus whatever this process hasn't written yet."""
+        entry = self._read().get("projects", {}).get(self.project_id)
+        used, by_endpoint = 0, {}
+        if entry and entry.get("day") == self._day:
+            used = int(entry.get("used", 0))
+            by_endpoint = dict(entry.get("by_endpoint", {}))
+        for endpoint, units in self._pending.items():
+            by_endpoint[endpoint] = by_endpoint.get(endpoint, 0) + units
+        self._used = used + sum(self._pending.values())
+        self._by_endpoint = by_endpoint
+
+    def _sync(self) -> None:
+        """
+        Merge our pending units into the file under the file lock: re-read it, add
+        the deltas, swap the result in atomically. Called with self._lock held.
+        """
+        self._synced_at = time.monotonic()
+        try:
+            with file_lock(self.path):
+                if not self._pending:
+                    self._load()
+                    return
+                data = self._read()
+                projects = data.setdefault("projects", {})
+                entry = projects.get(self.project_id)
+                if entry and entry.get("day", "") > self._day:
+                    # another process already rolled over; our units are for a past day
+                    self._pending = {}
+                    self._load()
+                    return
+                if not entry or entry.get("day") != self._day:
+                    entry = {"day": self._day, "used": 0, "by_endpoint": {}}
+                by_endpoint = dict(entry.get("by_endpoint", {}))
+                for endpoint, units in self._pending.items():
+                    by_endpoint[endpoint] = by_endpoint.get(endpoint, 0) + units
+                projects[self.project_id] = {
+                    "day": self._day,
+                    "used": int(entry.get("used", 0)) + sum(self._pending.values()),
+                    "by_endpoint": by_endpoint,
+                }
+                tmp_path = f"{self.path}.{os.getpid()}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(data, f, indent=2)
+                os.replace(tmp_path, self.path)
+                self._pending = {}
+                self._load()
+        except OSError:
+            pass  # not fatal: the units stay pending and go out with the next sync
@@ -0,0 +1,94 @@
+# reorder.py
+# dependencies
+import bisect
+import random
+from typing import Optional, Dict, Callable, List, Sequence, Tuple
+
+from models import PlaylistItem
+
+# Reordering a playlist costs one playlistItems.update (50 units) per video moved.
+# plan_moves keeps the longest run of videos that is already in the right relative
+# order (the longest increasing subsequence of their target positions) where it is
+# and only moves the others, each one straight to its final place. Reversing 100
+# videos still needs 99 moves, but sorting a mostly sorted playlist or dragging one
+# video somewhere else needs only a handful.
+
+
+def _title_key(item: PlaylistItem) -> str:
+    return (item.title or "").casefold()
+
+
+def _shuffled(items: Sequence[PlaylistItem]) -> List[PlaylistItem]:
+    out = list(items)
+    random.shuffle(out)
+    return out
+
+
+# name -> items in the new order (sorts are stable: ties keep the playlist order)
+ORDERINGS: Dict[str, Callable[[Sequence[PlaylistItem]], List[PlaylistItem]]] = {
+    "title": lambda items: sorted(items, key=_title_key),
+    "title-desc": lambda items: sorted(items, key=_title_key, reverse=True),
+    "channel": lambda items: sorted(
+        items, key=lambda it: ((it.channel_title or "").casefold(), _title_key(it))
+    ),
+    "reverse": lambda items: list(reversed(items)),
+    "shuffle": _shuffled,
+}
+
+
+def longest_increasing_subsequence(seq: Sequence[int]) -> List[int]:
+    """Indexes into seq of one longest strictly increasing subsequence, O(n log n)."""
+    tails: List[int] = []  # tails[k] = smallest last value of an increasing run of length k+1
+    tail_index: List[int] = []  # ... and its index in seq
+    previous: List[Optional[int]] = [None] * len(seq)
+    for i, value in enumerate(seq):
+        k = bisect.bisect_left(tails, value)
+        if k == len(tails):
+            tails.append(value)
+            tail_index.append(i)
+        else:
+            tails[k] = value
+            tail_index[k] = i
+        previous[i] = tail_index[k - 1] if k else None
+
+    out: List[int] = []
+    i = tail_index[-1] if tail_index else None
+    while i is not None:
+        out.append(i)
+        i = previous[i]
+    out.reverse()
+    return out
+
+
+def apply_move(order: List[str], key: str, position: int) -> None:
+    """What playlistItems.update(position=...) does: take the item out, insert it at position."""
+    order.remove(key)
+    order.insert(position, key)
+
+
+def plan_moves(current: Sequence[str], desired: Sequence[str]) -> List[Tuple[str, int]]:
+    """
+    The fewest (key, position) moves that turn `current` into `desired` (both lists
+    of the same playlist item ids). Apply them in the returned order, one after the
+    other: every position assumes the moves before it already happened.
+    """
+    if len(current) != len(desired) or set(current) != set(desired):
+        raise ValueError("The new order must contain exactly the items of the playlist.")
+    target = {key: index for index, key in enumerate(desired)}
+    if len(target) != len(desired):
+        raise ValueError("The playlist contains the same item twice.")
+
+    keep = {current[i] for i in longest_increasing_subsequence([target[k] for k in current])}
+
+    # place the others in target order, each right behind its target predecessor;
+    # the kept ones are already in the right relative order, so the result is `desired`
+    order = list(current)
+    moves: List[Tuple[str, int]] = []
+    for index, key in enumerate(desired):
+        if key in keep:
+            continue
+        order.remove(key)
+        position = order.index(desired[index - 1]) + 1 if index else 0
+        order.insert(position, key)
+        moves.append((key, position))
+    return moves
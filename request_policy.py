@@ -0,0 +1,158 @@
+# request_policy.py
+# dependencies
+import json
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional, Callable, List
+
+from googleapiclient.errors import HttpError
+
+# HTTP statuses worth another try (Google's own guidance for the Data API)
+RETRYABLE_STATUSES = {500, 502, 503, 504}
+
+# error reasons that are transient even though the status is 403/409/429
+RETRYABLE_REASONS = {
+    "rateLimitExceeded",
+    "userRateLimitExceeded",
+    "backendError",
+    "internalError",
+    "SERVICE_UNAVAILABLE",  # 409 when several inserts hit the same playlist at once
+}
+
+# errors that prove the request was NOT carried out. Only these are retried for
+# non-idempotent calls: a 5xx or a dropped connection may come after Google already
+# added the video, and sending the insert again would add it twice (another 50 units)
+NOT_COMMITTED_REASONS = {"rateLimitExceeded", "userRateLimitExceeded"}
+
+# creating things is not idempotent; deletes and position updates are
+NON_IDEMPOTENT_ENDPOINTS = {"playlistItems.insert", "playlists.insert"}
+
+# never wait longer than this for a Retry-After, whatever the server asks for
+MAX_RETRY_AFTER = 300.0
+
+# default client-side cap, shared by all worker threads of one YouTubeClient
+REQUESTS_PER_SECOND = 10.0
+BURST = 20
+
+
+def error_reasons(e: HttpError) -> List[str]:
+    """The 'reason' strings of a Google API error (e.g. ['quotaExceeded'])."""
+    details = getattr(e, "error_details", None)
+    if isinstance(details, list) and details:
+        return [d.get("reason", "") for d in details if isinstance(d, dict)]
+    try:
+        data = json.loads(e.content.decode("utf-8"))
+    except (AttributeError, ValueError, UnicodeDecodeError):
+        return []
+    error = data.get("error", {}) if isinstance(data, dict) else {}
+    if not isinstance(error, dict):
+        return []
+    return [d.get("reason", "") for d in error.get("errors", []) if isinstance(d, dict)]
+
+
+def is_retryable(e: BaseException, idempotent: bool = True) -> bool:
+    """
+    Worth sending again? For a non-idempotent request (idempotent=False) only when
+    the error proves nothing happened: 429 / rateLimitExceeded / connection refused.
+    """
+    if not idempotent:
+        if isinstance(e, HttpError):
+            status = getattr(e.resp, "status", None)
+            return status == 429 or any(r in NOT_COMMITTED_REASONS for r in error_reasons(e))
+        return isinstance(e, ConnectionRefusedError)
+    if isinstance(e, HttpError):
+        status = getattr(e.resp, "status", None)
+        if status in RETRYABLE_STATUSES or status == 429:
+            return True
+        # quotaExceeded (daily quota) is also a 403, retrying that just fails again
+        return any(reason in RETRYABLE_REASONS for reason in error_reasons(e))
+    # dropped connections / timeouts from httplib2
+    return isinstance(e, (ConnectionError, TimeoutError))
+
+
+def is_in_doubt(e: BaseException) -> bool:
+    """A transient failure of a non-idempotent request that may still have been carried out."""
+    return is_retryable(e) and not is_retryable(e, idempotent=False)
+
+
+def retry_after(e: Optional[BaseException]) -> Optional[float]:
+    """Seconds from a Retry-After header (delta-seconds or HTTP date), None without one."""
+    resp = getattr(e, "resp", None)
+    value = resp.get("retry-after") if hasattr(resp, "get") else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter: attempt n sleeps U(0, min(max_delay, base * 2^n)),
+    unless the error carries a Retry-After, then that (up to MAX_RETRY_AFTER).
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 32.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._sleep = sleep
+
+    def delay(self, attempt: int, *errors: BaseException) -> float:
+        # a batch retries several sub-requests at once: wait for the slowest of them
+        asked = [s for s in (retry_after(e) for e in errors) if s is not None]
+        if asked:
+            return min(max(asked), MAX_RETRY_AFTER)
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def sleep(self, attempt: int, *errors: BaseException) -> None:
+        self._sleep(self.delay(attempt, *errors))
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket. acquire(n) blocks until n tokens are available;
+    asking for more than `burst` at once (a big batch) just waits longer.
+    """
+
+    def __init__(
+        self,
+        rate: float = REQUESTS_PER_SECOND,
+        burst: int = BURST,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int = 1) -> float:
+        """Take `tokens`, sleeping if needed. Returns the time waited in seconds."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # go into debt; whoever comes next waits for it to be paid back
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
@@ -0,0 +1,103 @@
+# search_cache.py
+# dependencies
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List
+
+SEARCH_CACHE_FILE = "search_cache.sqlite3"
+
+# search.list is 100 units a pop, results for the same query rarely change within a day
+SEARCH_TTL_SECONDS = 24 * 60 * 60
+# recent searches kept in memory (LRU); older ones still come from disk
+MEMORY_ENTRIES = 64
+
+
+def normalize_query(query: str) -> str:
+    """'  Lo-Fi   BEATS ' and 'lo-fi beats' are the same search."""
+    return " ".join(query.casefold().split())
+
+
+def search_key(query: str, params: Dict[str, Any]) -> str:
+    return json.dumps([normalize_query(query), params], sort_keys=True)
+
+
+class SearchCache:
+    """
+    Memoizes search.list results: a bounded in-memory LRU in front of a SQLite table.
+    Entries older than `ttl` seconds are treated as missing (and purged on write).
+
+    stats: hits (memory or disk), misses
+    """
+
+    def __init__(
+        self,
+        path: str = SEARCH_CACHE_FILE,
+        ttl: float = SEARCH_TTL_SECONDS,
+        max_entries: int = MEMORY_ENTRIES,
+    ) -> None:
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0}
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS searches (
+                key TEXT PRIMARY KEY,
+                results_json TEXT NOT NULL,
+                fetched_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return {"results": [...], "fetched_at": epoch seconds} or None (missing/expired)."""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                row = self._conn.execute(
+                    "SELECT results_json, fetched_at FROM searches WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    entry = {"results": json.loads(row[0]), "fetched_at": row[1]}
+
+            if entry is None or now - entry["fetched_at"] > self.ttl:
+                self._memory.pop(key, None)
+                self.stats["misses"] += 1
+                return None
+
+            self._remember(key, entry)
+            self.stats["hits"] += 1
+            return {"results": list(entry["results"]), "fetched_at": entry["fetched_at"]}
+
+    def put(self, key: str, results: List[Dict[str, Any]]) -> None:
+        entry = {"results": list(results), "fetched_at": time.time()}
+        with self._lock:
+            self._remember(key, entry)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO searches VALUES (?, ?, ?)",
+                (key, json.dumps(entry["results"]), entry["fetched_at"]),
+            )
+            self._conn.execute(
+                "DELETE FROM searches WHERE fetched_at < ?", (entry["fetched_at"] - self.ttl,)
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            self._conn.execute("DELETE FROM searches")
+            self._conn.commit()
+
+    def _remember(self, key: str, entry: Dict[str, Any]) -> None:
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
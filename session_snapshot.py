@@ -0,0 +1,111 @@
+# session_snapshot.py
+# dependencies
+import json
+import os
+import threading
+import time
+from typing import Optional, Dict, List
+
+from models import Playlist
+
+SNAPSHOT_FILE = "session_snapshot.json"
+
+# how many recently opened playlists to remember
+RECENT_PLAYLISTS = 5
+
+
+class SessionSnapshot:
+    """
+    Small JSON file with what HomePage showed last time: channel info, the playlist
+    list and the recently opened playlists. Rendered straight away at launch (marked
+    as stale) while the app signs in and revalidates in the background.
+
+    Belongs to one account: HomePage clears it on logout.
+    """
+
+    def __init__(self, path: str = SNAPSHOT_FILE, max_recent: int = RECENT_PLAYLISTS) -> None:
+        self.path = path
+        self.max_recent = max_recent
+        self._lock = threading.Lock()
+        self.channel: Dict[str, Optional[str]] = {}
+        self.playlists: List[Playlist] = []
+        self.recent: List[str] = []  # playlist ids, most recent first
+        self.saved_at: Optional[float] = None
+        self._load()
+
+    def is_empty(self) -> bool:
+        return self.saved_at is None
+
+    def age_seconds(self) -> float:
+        return time.time() - self.saved_at if self.saved_at else 0.0
+
+    # ------------------------------------------------------------------
+    # Updating
+    # ------------------------------------------------------------------
+
+    def update(
+        self,
+        channel: Optional[Dict[str, Optional[str]]] = None,
+        playlists: Optional[List[Playlist]] = None,
+    ) -> None:
+        """Store fresh data from YouTube (only the parts given)."""
+        with self._lock:
+            if channel is not None:
+                self.channel = dict(channel)
+            if playlists is not None:
+                self.playlists = list(playlists)
+                # forget recent playlists that were deleted meanwhile
+                present = {p.id for p in self.playlists}
+                self.recent = [pid for pid in self.recent if pid in present]
+            self.saved_at = time.time()
+            self._save()
+
+    def touch_playlist(self, playlist_id: str) -> None:
+        """A playlist window was opened: move it to the front of the recent list."""
+        with self._lock:
+            self.recent = [playlist_id] + [pid for pid in self.recent if pid != playlist_id]
+            del self.recent[self.max_recent:]
+            self._save()
+
+    def clear(self) -> None:
+        with self._lock:
+            self.channel = {}
+            self.playlists = []
+            self.recent = []
+            self.saved_at = None
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict):
+            return
+        self.channel = dict(data.get("channel") or {})
+        self.playlists = [Playlist.from_dict(d) for d in data.get("playlists", [])]
+        self.recent = list(data.get("recent", []))[: self.max_recent]
+        self.saved_at = data.get("saved_at")
+
+    def _save(self) -> None:
+        data = {
+            "saved_at": self.saved_at,
+            "channel": self.channel,
+            "playlists": [p.to_dict() for p in self.playlists],
+            "recent": self.recent,
+        }
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass  # next launch just starts empty
@@ -0,0 +1,144 @@
+# sync.py
+# dependencies
+from typing import Optional, Dict, Any, Callable, List, Sequence, Tuple
+
+from models import PlaylistItem
+from reorder import plan_moves
+from youtube_client import QUOTA_COST, YouTubeClient
+
+# One-way mirror: make a target playlist hold exactly the videos of a source playlist
+# (repeats included, deleted/private videos left out), optionally in the same order.
+# Only the difference is written: items the source doesn't have are deleted, videos
+# the target doesn't have are inserted (both batched), and then the minimal set of
+# moves from reorder.py fixes the order. A target already in sync costs nothing but
+# the two listings (1 unit per 50 items, mostly 304s).
+
+Key = Tuple[str, int]  # (video_id, n-th copy of it in the playlist)
+
+
+def _keys(items: Sequence[PlaylistItem]) -> List[Optional[Key]]:
+    """Per item its (video_id, copy number), None for items without a video."""
+    seen: Dict[str, int] = {}
+    out: List[Optional[Key]] = []
+    for it in items:
+        if not it.video_id:
+            out.append(None)
+            continue
+        copy = seen.get(it.video_id, 0)
+        seen[it.video_id] = copy + 1
+        out.append((it.video_id, copy))
+    return out
+
+
+def target_order(source: Sequence[PlaylistItem], target: Sequence[PlaylistItem]) -> List[str]:
+    """
+    Playlist item ids of `target` in the order of `source`. Target items the source
+    doesn't have (e.g. a delete that failed) keep their relative order at the end.
+    """
+    by_key = {key: it.playlist_item_id for key, it in zip(_keys(target), target) if key}
+    wanted = [k for k in _keys(source) if k]
+    ordered = [by_key[k] for k in wanted if k in by_key]
+    placed = set(ordered)
+    return ordered + [it.playlist_item_id for it in target if it.playlist_item_id not in placed]
+
+
+def diff(
+    source: Sequence[PlaylistItem], target: Sequence[PlaylistItem], order: bool = True
+) -> Dict[str, Any]:
+    """
+    What it takes to turn target into a mirror of source:
+      delete  target items to remove ([PlaylistItem])
+      insert  video ids to add, in source order
+      moves   position updates afterwards (an estimate: batched inserts may land
+              in any order, the real moves are planned once they are in)
+      units   quota for all of it
+    """
+    source_keys = [k for k in _keys(source) if k]
+    wanted = set(source_keys)
+    target_keys = _keys(target)
+    have = {k for k in target_keys if k}
+
+    delete = [it for key, it in zip(target_keys, target) if key not in wanted]
+    missing = [k for k in source_keys if k not in have]
+    moves = 0
+    if order:
+        # target after deletes and inserts: kept items as they are, new ones appended
+        after = [k for k in target_keys if k in wanted] + missing
+        moves = len(plan_moves(after, source_keys))
+
+    return {
+        "delete": delete,
+        "insert": [video_id for video_id, _ in missing],
+        "moves": moves,
+        "units": len(delete) * QUOTA_COST["playlistItems.delete"]
+        + len(missing) * QUOTA_COST["playlistItems.insert"]
+        + moves * QUOTA_COST["playlistItems.update"],
+    }
+
+
+def plan_sync(
+    client: YouTubeClient, source_id: str, target_id: str, order: bool = True
+) -> Dict[str, Any]:
+    """List both playlists and diff() them. The plan also keeps source_id, target_id, order, source."""
+    source = client.list_playlist_items(source_id)
+    target = client.list_playlist_items(target_id)
+    plan = diff(source, target, order)
+    plan.update(source_id=source_id, target_id=target_id, order=order, source=source)
+    return plan
+
+
+def run_sync(
+    client: YouTubeClient,
+    plan: Dict[str, Any],
+    progress: Optional[Callable[[str, int, int], None]] = None,
+    should_stop: Optional[Callable[[], bool]] = None,
+) -> Dict[str, Any]:
+    """
+    Carry out a plan_sync plan: deletes, then inserts, then (if plan["order"]) moves.
+    progress(step, done, total) with step "delete" | "insert" | "move".
+
+    Returns a summary: deleted, inserted, moved, failed, stopped and results, one
+    {op, key, ok, error} per operation attempted. After a stop or failure, planning
+    again later does only what is left.
+    """
+    target_id = plan["target_id"]
+    summary: Dict[str, Any] = {
+        "deleted": 0, "inserted": 0, "moved": 0, "failed": 0, "stopped": False, "results": [],
+    }
+
+    def record(op: str, results: List[Dict[str, Any]], wanted: int) -> None:
+        for res in results:
+            summary["results"].append(
+                {"op": op, "key": res["key"], "ok": res["ok"],
+                 "error": None if res["ok"] else str(res["error"])}
+            )
+            if res["ok"]:
+                summary[{"delete": "deleted", "insert": "inserted", "move": "moved"}[op]] += 1
+            else:
+                summary["failed"] += 1
+        if len(results) < wanted:
+            summary["stopped"] = True
+
+    def step_progress(step: str):
+        return (lambda done, total: progress(step, done, total)) if progress else None
+
+    delete_ids = [it.playlist_item_id for it in plan["delete"]]
+    if delete_ids:
+        record("delete", client.delete_playlist_items(
+            delete_ids, progress=step_progress("delete"), should_stop=should_stop
+        ), len(delete_ids))
+
+    if plan["insert"] and not summary["stopped"]:
+        record("insert", client.insert_playlist_items(
+            target_id, plan["insert"], progress=step_progress("insert"), should_stop=should_stop
+        ), len(plan["insert"]))
+
+    if plan["order"] and not summary["stopped"] and not (should_stop and should_stop()):
+        source = plan["source"]
+        _, moves = client.plan_reorder(target_id, lambda target: target_order(source, target))
+        results = client.reorder_playlist_items(
+            target_id, moves, progress=step_progress("move"), should_stop=should_stop
+        )
+        record("move", results, len(moves))
+
+    return summary
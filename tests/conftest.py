@@ -0,0 +1,6 @@
+# tests/conftest.py
+# the modules live flat in the project root (run as scripts, not an installed package)
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
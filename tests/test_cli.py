@@ -0,0 +1,186 @@
+# tests/test_cli.py
+# cli.py copy/delete through the job queue (journaled, resumable) and the --metrics dump.
+import argparse
+import io
+import json
+import os
+
+import pytest
+
+import cli
+from benchmarks.fake_youtube import FakeYouTube, fake_client, http_error
+
+
+@pytest.fixture(autouse=True)
+def workdir(tmp_path, monkeypatch):
+    # the CLI keeps its jobs and journal in the current folder
+    monkeypatch.chdir(tmp_path)
+    cli._stop.clear()
+    return tmp_path
+
+
+def copy_args(target, videos):
+    return argparse.Namespace(to=target, sources=[], videos=videos, input=None, jobs=1,
+                              dry_run=False, force=False)
+
+
+def lines(buf):
+    return [json.loads(line) for line in buf.getvalue().splitlines()]
+
+
+def test_copy_runs_as_a_journaled_job(workdir):
+    service = FakeYouTube()
+    target = service.add_playlist("T")
+    client = fake_client(service, str(workdir))
+    buf = io.StringIO()
+
+    cli.cmd_copy(client, copy_args(target, ["a", "b", "c"]), cli.JsonlWriter(buf))
+
+    assert [it["videoId"] for it in service.items(target)] == ["a", "b", "c"]
+    assert [(r["video_id"], r["ok"]) for r in lines(buf)] == [("a", True), ("b", True), ("c", True)]
+    assert cli.run_ids() == []  # a finished run leaves no files behind
+
+
+def test_copy_the_quota_check_approves_is_not_cut_short(workdir):
+    service = FakeYouTube()
+    target = service.add_playlist("T")
+    client = fake_client(service, str(workdir))
+    client.ledger.daily_limit = 1000
+    buf = io.StringIO()
+
+    # 19 inserts = 950 units fit in 1000, but not next to the queue's browsing reserve
+    with pytest.raises(SystemExit, match="100 kept for browsing"):
+        cli.cmd_copy(client, copy_args(target, [f"v{i}" for i in range(19)]), cli.JsonlWriter(buf))
+    assert service.items(target) == []
+
+    videos = [f"v{i}" for i in range(17)]
+    cli.cmd_copy(client, copy_args(target, videos), cli.JsonlWriter(buf))
+    assert [it["videoId"] for it in service.items(target)] == videos
+    assert not any(r.get("pending") for r in lines(buf))
+
+
+def test_forced_copy_goes_over_the_estimate(workdir):
+    service = FakeYouTube()
+    target = service.add_playlist("T")
+    client = fake_client(service, str(workdir))
+    client.ledger.daily_limit = 1000
+    videos = [f"v{i}" for i in range(40)]
+    args = copy_args(target, videos)
+    args.force = True
+    out = cli.JsonlWriter(io.StringIO())
+
+    cli.cmd_copy(client, args, out)
+
+    assert [it["videoId"] for it in service.items(target)] == videos
+    assert out.failed == 0
+    assert cli.run_ids() == []
+
+
+def test_copy_left_pending_counts_as_failed(workdir):
+    service = FakeYouTube()
+    target = service.add_playlist("T")
+    client = fake_client(service, str(workdir))
+    buf = io.StringIO()
+    out = cli.JsonlWriter(buf)
+    # the app uses up today's quota while the first chunk is being inserted
+    real_insert = client.insert_playlist_items
+
+    def insert_and_use_up_quota(*args, **kwargs):
+        client.ledger.charge("search.list", client.ledger.remaining())
+        return real_insert(*args, **kwargs)
+
+    client.insert_playlist_items = insert_and_use_up_quota
+
+    cli.cmd_copy(client, copy_args(target, [f"v{i}" for i in range(70)]), out)
+
+    assert len(service.items(target)) == 50
+    assert lines(buf)[-1]["pending"] is True and lines(buf)[-1]["left"] == 20
+    assert out.failed == 1
+    assert len(cli.run_ids()) == 1
+
+
+def copy_interrupted(client, target, videos):
+    """cli copy where the second chunk reaches YouTube, then Ctrl+C before it is journaled as done."""
+    real_insert = client.insert_playlist_items
+    calls = []
+
+    def insert_then_interrupt(*args, **kwargs):
+        results = real_insert(*args, **kwargs)
+        calls.append(len(results))
+        if len(calls) == 2:
+            raise KeyboardInterrupt
+        return results
+
+    client.insert_playlist_items = insert_then_interrupt
+    with pytest.raises(KeyboardInterrupt):
+        cli.cmd_copy(client, copy_args(target, videos), cli.JsonlWriter(io.StringIO()))
+
+
+def test_interrupted_copy_is_finished_by_resume_without_duplicates(workdir):
+    service = FakeYouTube()
+    target = service.add_playlist("T")
+    videos = [f"v{i}" for i in range(70)]  # two chunks
+
+    copy_interrupted(fake_client(service, str(workdir)), target, videos)
+    assert len(cli.run_ids()) == 1
+
+    buf = io.StringIO()
+    cli.cmd_resume(fake_client(service, str(workdir)), argparse.Namespace(dry_run=False),
+                   cli.JsonlWriter(buf))
+
+    assert [it["videoId"] for it in service.items(target)] == videos
+    assert lines(buf)[-1]["pending"] == 0
+    assert cli.run_ids() == []
+
+
+def test_runs_keep_their_own_files_and_resume_skips_busy_ones(workdir):
+    service = FakeYouTube()
+    target = service.add_playlist("T")
+
+    # a run that is still going in another process
+    with cli.run_queue() as other:
+        other_job = other.add_insert_job(target, ["x", "y"])
+        other.journal.plan(other_job["id"], 0, ["x", "y"])
+        [other_run] = cli.run_ids()
+
+        # a run of our own that is cut short, then resumed
+        copy_interrupted(fake_client(service, str(workdir)), target, [f"v{i}" for i in range(70)])
+        assert len(cli.run_ids()) == 2
+
+        buf = io.StringIO()
+        cli.cmd_resume(fake_client(service, str(workdir)), argparse.Namespace(dry_run=False),
+                       cli.JsonlWriter(buf))
+        assert {"op": "resume", "run": other_run, "busy": True} in lines(buf)
+        assert cli.run_ids() == [other_run]
+
+    # neither the copy nor the resume touched the other run's jobs or journal
+    with cli.run_queue(other_run) as other:
+        assert [job["id"] for job in other.pending()] == [other_job["id"]]
+        assert sorted(other.journal.state(other_job["id"])["in_doubt"]) == [0, 1]
+
+
+def test_delete_runs_as_a_job_per_playlist(workdir):
+    service = FakeYouTube()
+    playlist_id = service.add_playlist("P", n_items=4)
+    item_ids = [it["id"] for it in service.items(playlist_id)]
+    client = fake_client(service, str(workdir))
+    buf = io.StringIO()
+    args = argparse.Namespace(items=item_ids[:2], input=None, jobs=2, dry_run=False, force=False)
+
+    cli.cmd_delete(client, args, cli.JsonlWriter(buf))
+
+    assert [it["id"] for it in service.items(playlist_id)] == item_ids[2:]
+    assert all(r["ok"] for r in lines(buf))
+    assert cli.run_ids() == []
+
+
+def test_metrics_are_written_when_the_command_fails(workdir, monkeypatch, capsys):
+    service = FakeYouTube()
+    client = fake_client(service, str(workdir))
+    client.authenticate = lambda interactive=True: True
+    monkeypatch.setattr(cli, "YouTubeClient", lambda: client)
+    service.fail_next(http_error(400, "badRequest"))
+
+    assert cli.main(["--metrics", "run.json", "list"]) == 2
+    assert os.path.exists("run.json")
+    assert "Error:" in capsys.readouterr().err
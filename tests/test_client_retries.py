@@ -0,0 +1,187 @@
+# tests/test_client_retries.py
+# YouTubeClient._send / _execute_batch against benchmarks/fake_youtube.FakeYouTube
+# with injected failures (fail_next) and a RetryPolicy that records instead of sleeping.
+import pytest
+from googleapiclient.errors import HttpError
+
+from benchmarks.fake_youtube import FakeYouTube, backend_error, fake_client, http_error, quota_exceeded
+from request_policy import RetryPolicy
+
+
+class Sleeps(list):
+    def __call__(self, seconds):
+        self.append(seconds)
+
+
+@pytest.fixture
+def sleeps():
+    return Sleeps()
+
+
+@pytest.fixture
+def make_client(tmp_path, sleeps):
+    def make(service, max_retries=5, cached=False):
+        policy = RetryPolicy(max_retries=max_retries, base_delay=0.01, max_delay=0.01, sleep=sleeps)
+        return fake_client(service, str(tmp_path), cached=cached, retry_policy=policy)
+    return make
+
+
+@pytest.mark.parametrize("error", [
+    backend_error(),
+    http_error(503, "serviceUnavailable"),
+    http_error(403, "rateLimitExceeded"),
+    http_error(429, "tooManyRequests"),
+])
+def test_transient_errors_are_retried_with_backoff(make_client, sleeps, error):
+    service = FakeYouTube()
+    playlist_id = service.add_playlist("P", n_items=3)
+    client = make_client(service)
+    service.fail_next(error, error)
+
+    assert len(client.list_playlist_items(playlist_id)) == 3
+    assert service.calls["youtube.playlistItems.list"] == 3
+    assert len(sleeps) == 2
+    assert client.metrics.snapshot()["playlistItems.list"]["retries"] == 2
+
+
+@pytest.mark.parametrize("error", [
+    quota_exceeded(),
+    http_error(404, "playlistNotFound"),
+    http_error(400, "invalidValue"),
+    http_error(304, "notModified"),
+])
+def test_permanent_errors_are_not_retried(make_client, sleeps, error):
+    service = FakeYouTube()
+    playlist_id = service.add_playlist("P", n_items=3)
+    client = make_client(service)
+    service.fail_next(error)
+
+    with pytest.raises(HttpError):
+        client.list_playlist_items(playlist_id)
+    assert service.calls["youtube.playlistItems.list"] == 1
+    assert sleeps == []
+
+
+def test_retries_stop_at_the_cap(make_client, sleeps):
+    service = FakeYouTube()
+    playlist_id = service.add_playlist("P", n_items=3)
+    client = make_client(service, max_retries=2)
+    service.fail_next(*[backend_error() for _ in range(5)])
+
+    with pytest.raises(HttpError):
+        client.list_playlist_items(playlist_id)
+    assert service.calls["youtube.playlistItems.list"] == 3  # first try + 2 retries
+    assert len(sleeps) == 2
+
+
+def test_retry_after_is_honoured(make_client, sleeps):
+    service = FakeYouTube()
+    playlist_id = service.add_playlist("P", n_items=3)
+    client = make_client(service)
+    service.fail_next(http_error(429, "tooManyRequests", headers={"retry-after": "4"}))
+
+    client.list_playlist_items(playlist_id)
+    assert sleeps == [4.0]
+
+
+def test_quota_is_charged_once_per_logical_request(make_client):
+    service = FakeYouTube()
+    playlist_id = service.add_playlist("P", n_items=3)
+    client = make_client(service)
+    service.fail_next(backend_error(), backend_error())
+
+    client.list_playlist_items(playlist_id)
+    assert client.quota_used_units == 1
+    assert client.ledger.used_today() == 1
+
+
+def test_batch_resends_only_the_failed_sub_requests(make_client, sleeps):
+    service = FakeYouTube()
+    playlist_id = service.add_playlist("P", n_items=10)
+    client = make_client(service)
+    item_ids = [it["id"] for it in service.items(playlist_id)]
+    # sub-requests run in order: the 2nd and 5th of the first round fail
+    errors = iter([None, backend_error(), None, None, http_error(403, "rateLimitExceeded")])
+    original = service._dispatch
+    sent = []
+
+    def flaky(request):
+        sent.append(request.params["id"])
+        error = next(errors, None)
+        if error is not None:
+            raise error
+        return original(request)
+
+    service._dispatch = flaky
+    results = client.delete_playlist_items(item_ids)
+
+    assert all(res["ok"] for res in results)
+    assert [res["key"] for res in results] == item_ids
+    assert service.requests == 2  # one batch, one follow-up batch
+    assert sent[10:] == [item_ids[1], item_ids[4]]
+    assert len(sleeps) == 1
+    # billed per sub-request, once, retries aside
+    assert client.quota_used_units == 10 * 50
+    assert service.items(playlist_id) == []
+
+
+def test_batch_stops_retrying_permanent_sub_request_errors(make_client):
+    service = FakeYouTube()
+    target = service.add_playlist("T")
+    client = make_client(service)
+    service.fail_next(quota_exceeded())
+
+    results = client.insert_playlist_items(target, ["a", "b", "c"])
+    assert [res["ok"] for res in results] == [False, True, True]
+    assert service.requests == 1
+
+
+def test_insert_is_not_blindly_retried_after_an_ambiguous_failure(make_client):
+    service = FakeYouTube()
+    target = service.add_playlist("T")
+    client = make_client(service, cached=True)
+    # the insert happens, but the caller only sees a 503
+    service.fail_after_next(backend_error())
+
+    results = client.insert_playlist_items(target, ["a", "b"])
+    assert all(res["ok"] for res in results)
+    assert results[0].get("recovered")
+    assert results[0]["item"].video_id == "a"
+    assert [it["videoId"] for it in service.items(target)] == ["a", "b"]  # no duplicate
+    assert service.calls["youtube.playlistItems.insert"] == 2
+
+
+def test_ambiguous_insert_that_did_not_happen_is_sent_again(make_client):
+    service = FakeYouTube()
+    target = service.add_playlist("T")
+    client = make_client(service, cached=True)
+    service.fail_next(backend_error())  # failed before anything was added
+
+    results = client.insert_playlist_items(target, ["a", "b"])
+    assert all(res["ok"] for res in results)
+    assert not results[0].get("recovered")
+    assert sorted(it["videoId"] for it in service.items(target)) == ["a", "b"]
+
+
+def test_dropped_connection_on_single_insert_is_settled_by_listing(make_client):
+    service = FakeYouTube()
+    target = service.add_playlist("T")
+    client = make_client(service, cached=True)
+    service.fail_after_next(ConnectionResetError())
+
+    item = client.insert_playlist_item(target, "a")
+    assert item.video_id == "a"
+    assert [it["videoId"] for it in service.items(target)] == ["a"]
+    assert service.calls["youtube.playlistItems.insert"] == 1
+
+
+def test_rate_limited_insert_is_retried_directly(make_client, sleeps):
+    service = FakeYouTube()
+    target = service.add_playlist("T")
+    client = make_client(service)
+    service.fail_next(http_error(403, "rateLimitExceeded"))
+
+    client.insert_playlist_item(target, "a")
+    assert [it["videoId"] for it in service.items(target)] == ["a"]
+    assert service.calls["youtube.playlistItems.insert"] == 2
+    assert "youtube.playlistItems.list" not in service.calls
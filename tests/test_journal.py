@@ -0,0 +1,65 @@
+# tests/test_journal.py
+# Crash / torn-write recovery of the bulk-job journal (journal.py + JobQueue replay).
+from benchmarks.fake_youtube import FakeYouTube, fake_client
+from job_queue import JobQueue
+from journal import Journal
+
+
+def test_torn_last_line_is_cut_before_the_next_append(tmp_path):
+    path = str(tmp_path / "journal.jsonl")
+    journal = Journal(path)
+    journal.plan("job1", 0, ["a", "b"])
+    # crash in the middle of writing the "done" line
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"t":1,"job":"job1","ev":"done","i":0,"key":"a","o')
+
+    reopened = Journal(path)
+    reopened.done("job1", 0, [{"key": "a", "ok": True}, {"key": "b", "ok": True}])
+
+    state = reopened.state("job1")
+    assert sorted(state["done"]) == [0, 1]
+    assert state["in_doubt"] == {}
+    with open(path, "rb") as f:
+        assert f.read().count(b"\n") == 4  # 2 plans + 2 dones, no glued line
+
+
+def test_file_that_is_only_a_torn_line(tmp_path):
+    path = str(tmp_path / "journal.jsonl")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('{"t":1,"job":"jo')
+    journal = Journal(path)
+    journal.plan("job1", 0, ["a"])
+    assert list(journal.state("job1")["in_doubt"]) == [0]
+
+
+def test_crashed_chunk_resumes_from_the_recorded_prefix(tmp_path):
+    service = FakeYouTube()
+    target = service.add_playlist("T")
+    client = fake_client(service, str(tmp_path), cached=True)
+    jobs_path = str(tmp_path / "jobs.json")
+    journal_path = str(tmp_path / "journal.jsonl")
+
+    queue = JobQueue(jobs_path, reserve_units=0, journal_path=journal_path)
+    job = queue.add_insert_job(target, ["a", "b", "c", "d"], claim=True)
+    # a run that inserted a and b, journaled that, then died before the checkpoint,
+    # leaving half a line for c behind
+    queue.journal.plan(job["id"], 0, ["a", "b", "c", "d"])
+    client.insert_playlist_items(target, ["a", "b"])
+    queue.journal.done(job["id"], 0, [{"key": "a", "ok": True}, {"key": "b", "ok": True}])
+    with open(journal_path, "a", encoding="utf-8") as f:
+        f.write('{"t":1,"job":"' + job["id"] + '","ev":"done","i":2,"ke')
+
+    restarted = JobQueue(jobs_path, reserve_units=0, journal_path=journal_path)
+    restarted_job = restarted.get(job["id"])
+    assert JobQueue._recorded_prefix(
+        restarted_job, 0, restarted.journal.state(job["id"])["done"]
+    ) == [
+        {"key": "a", "ok": True, "skipped": False, "response": None, "error": None},
+        {"key": "b", "ok": True, "skipped": False, "response": None, "error": None},
+    ]
+
+    service.reset_counters()
+    summary = restarted.run_job(client, restarted_job)
+    assert summary["ok"] == 4
+    assert [it["videoId"] for it in service.items(target)] == ["a", "b", "c", "d"]
+    assert service.calls.get("youtube.playlistItems.insert") == 2  # only c and d were sent
@@ -0,0 +1,118 @@
+# tests/test_quota_ledger.py
+import gc
+import json
+import multiprocessing
+import weakref
+
+import quota_ledger
+from quota_ledger import QuotaLedger
+
+
+def _charge_many(path, count):
+    ledger = QuotaLedger("p", path=path)
+    for _ in range(count):
+        ledger.charge("playlistItems.list", 1)
+        ledger.charge("playlistItems.insert", 50)
+    ledger.flush()
+
+
+def test_two_ledgers_on_one_file_add_up(tmp_path):
+    path = str(tmp_path / "ledger.json")
+    gui, cli = QuotaLedger("p", path=path), QuotaLedger("p", path=path)
+    gui.charge("search.list", 100)
+    cli.charge("playlistItems.insert", 50)
+    gui.charge("playlistItems.list", 1)
+    gui.flush()
+    cli.flush()
+
+    assert QuotaLedger("p", path=path).used_today() == 151
+    gui.flush()  # picks up the CLI's units
+    assert gui.used_today() == 151
+    assert gui.by_endpoint() == {"search.list": 100, "playlistItems.insert": 50, "playlistItems.list": 1}
+
+
+def test_concurrent_processes_do_not_lose_charges(tmp_path):
+    path = str(tmp_path / "ledger.json")
+    ctx = multiprocessing.get_context("spawn")
+    workers = [ctx.Process(target=_charge_many, args=(path, 40)) for _ in range(4)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join(30)
+        assert w.exitcode == 0
+
+    with open(path, "r", encoding="utf-8") as f:
+        entry = json.load(f)["projects"]["p"]
+    assert entry["used"] == 4 * 40 * 51
+    assert entry["by_endpoint"] == {"playlistItems.list": 160, "playlistItems.insert": 160 * 50}
+
+
+def test_small_charges_are_batched(tmp_path, monkeypatch):
+    path = str(tmp_path / "ledger.json")
+    monkeypatch.setattr(quota_ledger, "FLUSH_SECONDS", 3600)
+    ledger = QuotaLedger("p", path=path)
+    writes = []
+    real_replace = quota_ledger.os.replace
+    monkeypatch.setattr(quota_ledger.os, "replace", lambda a, b: (writes.append(b), real_replace(a, b)))
+
+    for _ in range(120):
+        ledger.charge("playlistItems.list", 1)
+    assert len(writes) == 120 // quota_ledger.FLUSH_UNITS
+    assert ledger.used_today() == 120  # pending units count right away
+    ledger.flush()
+    assert QuotaLedger("p", path=path).used_today() == 120
+
+
+def test_other_projects_in_the_file_are_kept(tmp_path):
+    path = str(tmp_path / "ledger.json")
+    a, b = QuotaLedger("a", path=path), QuotaLedger("b", path=path)
+    a.charge("search.list", 100)
+    b.charge("search.list", 100)
+    a.flush()
+    b.flush()
+    assert QuotaLedger("a", path=path).used_today() == 100
+    assert QuotaLedger("b", path=path).used_today() == 100
+
+
+def test_one_exit_hook_for_all_ledgers(tmp_path, monkeypatch):
+    path = str(tmp_path / "ledger.json")
+    monkeypatch.setattr(quota_ledger, "FLUSH_SECONDS", 3600)
+    registered = []
+    monkeypatch.setattr(quota_ledger.atexit, "register", registered.append)
+    kept = QuotaLedger("p", path=path)
+    kept.charge("search.list", 1)
+    gone = QuotaLedger("p", path=path)
+    gone.charge("playlistItems.list", 2)
+    assert registered == []  # no per-instance hook keeping ledgers alive
+
+    gone_ref = weakref.ref(gone)
+    del gone  # flushes its units on the way out
+    gc.collect()
+    assert gone_ref() is None and kept in quota_ledger._live_ledgers
+    assert QuotaLedger("p", path=path).used_today() == 2
+    quota_ledger._flush_live_ledgers()
+    assert QuotaLedger("p", path=path).used_today() == 3
+
+
+def test_units_of_a_day_that_could_not_be_written_are_not_carried_over(tmp_path, monkeypatch):
+    path = str(tmp_path / "ledger.json")
+    monkeypatch.setattr(quota_ledger, "FLUSH_SECONDS", 3600)
+    monkeypatch.setattr(quota_ledger, "quota_day", lambda: "2026-01-01")
+    ledger = QuotaLedger("p", path=path)
+    ledger.charge("search.list", 40)  # pending, below FLUSH_UNITS
+
+    # midnight, and the file can't be written right then
+    monkeypatch.setattr(quota_ledger, "quota_day", lambda: "2026-01-02")
+    real_lock = quota_ledger.file_lock
+
+    def broken_lock(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(quota_ledger, "file_lock", broken_lock)
+    assert ledger.used_today() == 0
+    monkeypatch.setattr(quota_ledger, "file_lock", real_lock)
+
+    ledger.charge("playlistItems.list", 1)
+    ledger.flush()
+    assert QuotaLedger("p", path=path).used_today() == 1
+    assert ledger.by_endpoint() == {"playlistItems.list": 1}
@@ -0,0 +1,86 @@
+# tests/test_request_policy.py
+from email.utils import formatdate
+import time
+
+import pytest
+
+from benchmarks.fake_youtube import backend_error, http_error, quota_exceeded
+from request_policy import (
+    MAX_RETRY_AFTER,
+    RetryPolicy,
+    TokenBucket,
+    is_in_doubt,
+    is_retryable,
+    retry_after,
+)
+
+
+def test_transient_errors_are_retryable():
+    assert is_retryable(backend_error())
+    assert is_retryable(http_error(500, "internalError"))
+    assert is_retryable(http_error(429, "tooManyRequests"))
+    assert is_retryable(http_error(403, "rateLimitExceeded"))
+    assert is_retryable(ConnectionResetError())
+    assert is_retryable(TimeoutError())
+
+
+def test_permanent_errors_are_not_retryable():
+    assert not is_retryable(quota_exceeded())
+    assert not is_retryable(http_error(404, "playlistNotFound"))
+    assert not is_retryable(http_error(400, "invalidValue"))
+    assert not is_retryable(http_error(304, "notModified"))
+    assert not is_retryable(ValueError())
+
+
+def test_non_idempotent_requests_only_retry_what_was_not_carried_out():
+    assert is_retryable(http_error(429, "tooManyRequests"), idempotent=False)
+    assert is_retryable(http_error(403, "rateLimitExceeded"), idempotent=False)
+    assert is_retryable(ConnectionRefusedError(), idempotent=False)
+    # may have been committed before it failed
+    for error in (backend_error(), ConnectionResetError(), TimeoutError()):
+        assert not is_retryable(error, idempotent=False)
+        assert is_in_doubt(error)
+    assert not is_in_doubt(quota_exceeded())
+    assert not is_in_doubt(http_error(403, "rateLimitExceeded"))
+
+
+def test_retry_after_seconds_and_http_date():
+    assert retry_after(http_error(503, "backendError", headers={"retry-after": "7"})) == 7.0
+    date = formatdate(time.time() + 60, usegmt=True)
+    seconds = retry_after(http_error(503, "backendError", headers={"retry-after": date}))
+    assert 55 <= seconds <= 60
+    assert retry_after(backend_error()) is None
+    assert retry_after(ConnectionResetError()) is None
+
+
+def test_delay_uses_retry_after_capped_and_jitter_otherwise():
+    policy = RetryPolicy(base_delay=1.0, max_delay=8.0)
+    assert policy.delay(0, http_error(429, "x", headers={"retry-after": "12"})) == 12.0
+    assert policy.delay(0, http_error(429, "x", headers={"retry-after": "99999"})) == MAX_RETRY_AFTER
+    # a batch waits for the longest Retry-After of its failed sub-requests
+    assert policy.delay(0, backend_error(), http_error(429, "x", headers={"retry-after": "3"})) == 3.0
+    for attempt in range(10):
+        assert 0 <= policy.delay(attempt, backend_error()) <= min(8.0, 2 ** attempt)
+
+
+def test_token_bucket_paces_with_injected_clock():
+    now = [100.0]
+    slept = []
+
+    def sleep(seconds):
+        slept.append(seconds)
+        now[0] += seconds
+
+    bucket = TokenBucket(rate=10.0, burst=5, clock=lambda: now[0], sleep=sleep)
+    # the burst goes through without waiting
+    assert [bucket.acquire() for _ in range(5)] == [0.0] * 5
+    # then one token per 1/rate seconds
+    assert bucket.acquire() == pytest.approx(0.1)
+    assert bucket.acquire() == pytest.approx(0.1)
+    # a big batch takes its tokens in one go and waits for all of them
+    assert bucket.acquire(10) == pytest.approx(1.0)
+    assert sum(slept) == pytest.approx(1.2)
+    # idle time refills, but never beyond the burst
+    now[0] += 60
+    assert [bucket.acquire() for _ in range(5)] == [0.0] * 5
+    assert bucket.acquire() > 0
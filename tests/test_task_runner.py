@@ -0,0 +1,124 @@
+# tests/test_task_runner.py
+# TaskRunner without a display: a stand-in widget whose after() callbacks we run by
+# hand, and the real TaskStatusBar hooks on a bar built without Tk.
+import time
+
+from ui.status_bar import TaskStatusBar
+from ui.task_runner import TaskRunner
+
+
+class FakeWidget:
+    def __init__(self):
+        self.pending = {}
+        self.errors = []
+        self._ids = 0
+
+    def bind(self, *args, **kwargs):
+        pass
+
+    def after(self, ms, fn):
+        self._ids += 1
+        self.pending[self._ids] = fn
+        return self._ids
+
+    def after_cancel(self, job):
+        self.pending.pop(job, None)
+
+    def report_callback_exception(self, exc_type, exc, tb):
+        self.errors.append(exc)
+
+    def run_until(self, condition, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while not condition():
+            assert time.monotonic() < deadline, "timed out"
+            for job in list(self.pending):
+                self.pending.pop(job)()
+            time.sleep(0.005)
+
+
+class FakeVar:
+    def __init__(self, value=""):
+        self.value = value
+
+    def set(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+
+class FakeWidgetStub:
+    def __init__(self):
+        self.options = {"mode": "determinate"}
+        self.history = []
+
+    def config(self, **kwargs):
+        self.options.update(kwargs)
+        self.history.append(kwargs)
+
+    def cget(self, name):
+        return self.options.get(name)
+
+    def start(self, *args):
+        pass
+
+    def stop(self):
+        pass
+
+
+def status_bar() -> TaskStatusBar:
+    bar = TaskStatusBar.__new__(TaskStatusBar)  # skip the Tk widget setup
+    bar.idle_text = "Ready."
+    bar._runner = None
+    bar._tasks = []
+    bar.message_var = FakeVar()
+    bar.cancel_button = FakeWidgetStub()
+    bar.progress = FakeWidgetStub()
+    return bar
+
+
+def test_reporting_task_with_status_bar_delivers_progress_and_result():
+    widget, bar = FakeWidget(), status_bar()
+    runner = TaskRunner(widget, status_bar=bar)
+    progress, done = [], []
+
+    def work(task):
+        for i in range(1, 4):
+            task.report(i, 3, f"step {i}")
+        return "result"
+
+    runner.submit(work, name="Reporting", on_done=done.append,
+                  on_progress=lambda *p: progress.append(p))
+    widget.run_until(lambda: done)
+
+    assert done == ["result"]
+    assert progress == [(1, 3, "step 1"), (2, 3, "step 2"), (3, 3, "step 3")]
+    assert widget.errors == []
+    assert {"mode": "determinate", "maximum": 3, "value": 3} in bar.progress.history
+    assert bar.message_var.get() == "Ready."
+    assert not runner.is_busy()
+    runner.shutdown()
+
+
+def test_failing_callback_does_not_stop_the_poll_loop():
+    widget = FakeWidget()
+    runner = TaskRunner(widget, status_bar=status_bar())
+    done = []
+
+    def broken_progress(*_):
+        raise ValueError("broken hook")
+
+    def work(task):
+        task.report(1, 1, "")
+        return 1
+
+    runner.submit(work, on_progress=broken_progress, on_done=done.append)
+    runner.submit(lambda task: 2, on_done=lambda r: (done.append(r), 1 / 0))
+    runner.submit(lambda task: 3, on_done=done.append)
+    widget.run_until(lambda: len(done) == 3)
+
+    assert sorted(done) == [1, 2, 3]
+    assert [type(e) for e in widget.errors].count(ValueError) == 1
+    assert [type(e) for e in widget.errors].count(ZeroDivisionError) == 1
+    assert not runner.is_busy()
+    runner.shutdown()
@@ -1,21 +1,34 @@
 # ui/home.py
 # dependencies
+import time
 import tkinter as tk
 from tkinter import ttk, messagebox
 
-from youtube_client import YouTubeClient
+from job_queue import JobQueue
+from metrics import METRICS_DIR, Metrics
+from models import Playlist
+from quota_ledger import QuotaLedger, project_id_from_client_secrets
+from session_snapshot import SessionSnapshot
+from youtube_client import CLIENT_SECRET_FILE, YouTubeClient
 from ui.playlist_window import PlaylistWindow
+from ui.status_bar import TaskStatusBar
+from ui.task_runner import TaskRunner
 
 
 class HomePage(ttk.Frame):
     """
     Home screen:
       - Sign in with Google (OAuth)
-      - Display estimated quota usage (session only)
+      - Display estimated quota usage (session + today's ledger, remaining budget)
       - List playlists
       - Open selected playlist in a new window
       - Refresh playlists on demand
       - logout (clear local OAuth token i.e. pickle file)
+      - Jobs: bulk copies/deletes that didn't fit in today's quota, resumed after the reset
+      - Metrics: per-endpoint calls, latency percentiles, bytes, retries and units, live
+
+    All YouTube calls run on background workers (see ui/task_runner.py),
+    so the window stays responsive while signing in / loading.
     """
 
     # home page UI initialization
@@ -23,13 +36,34 @@ class HomePage(ttk.Frame):
         super().__init__(master, **kwargs)
 
         self.youtube_client: YouTubeClient | None = None
-        self.playlists: list[dict] = []
+        self.playlists: list[Playlist] = []
+        # today's usage for this Cloud project, shared with every client we create
+        self.ledger = QuotaLedger(project_id_from_client_secrets(CLIENT_SECRET_FILE))
+        # request metrics for this run, shared by every client we create (app.py dumps it on exit)
+        self.metrics = Metrics()
+        self.job_queue = JobQueue()
+        self._resume_job = None  # after() id of the post-reset resume
+        # what we showed last time, rendered at launch until YouTube confirms it
+        self.snapshot = SessionSnapshot()
+        self._stale = False
 
         self.current_user_label = tk.StringVar(value="Not signed in")
         self.quota_label_var = tk.StringVar(value="Quota used this session: 0 units")
+        self.quota_today_var = tk.StringVar(value="")
+        self.quota_breakdown_var = tk.StringVar(value="")
+        self.cache_label_var = tk.StringVar(value="Cache: no requests yet")
         self.status_label_var = tk.StringVar(value="Please sign in to view your playlists.")
+        self.jobs_info_var = tk.StringVar(value="")
+        self.duplicates_info_var = tk.StringVar(
+            value="Scan your playlists to find videos you have more than once."
+        )
+        self.metrics_info_var = tk.StringVar(value="No API requests yet.")
 
         self._build_ui()
+        self.tasks = TaskRunner(self, status_bar=self.status_bar)
+        self._tick_quota()
+        self._load_jobs_into_tree()
+        self._restore_snapshot()
 
     # adding UI components to the home page
     def _build_ui(self) -> None:
@@ -55,6 +89,10 @@ class HomePage(ttk.Frame):
         self.logout_button.pack(side="left", padx=(8, 0))
 
 
+        # Background task status (packed before the notebook so it keeps its space)
+        self.status_bar = TaskStatusBar(self)
+        self.status_bar.pack(side="bottom", fill="x", padx=16, pady=(0, 8))
+
         # Notebook
         notebook = ttk.Notebook(self)
         notebook.pack(fill="both", expand=True, padx=16, pady=(0, 16))
@@ -66,17 +104,32 @@ class HomePage(ttk.Frame):
         quota_frame = ttk.LabelFrame(overview_tab, text="Quota (Approximate)")
         quota_frame.pack(fill="x", padx=12, pady=(12, 8))
 
+        quota_today_label = ttk.Label(quota_frame, textvariable=self.quota_today_var)
+        quota_today_label.pack(anchor="w", padx=8, pady=(4, 0))
+
         quota_label = ttk.Label(quota_frame, textvariable=self.quota_label_var)
         quota_label.pack(anchor="w", padx=8, pady=4)
 
+        breakdown_label = ttk.Label(
+            quota_frame, textvariable=self.quota_breakdown_var, foreground="gray"
+        )
+        breakdown_label.pack(anchor="w", padx=8, pady=(0, 4))
+
         note_label = ttk.Label(
             quota_frame,
             text="Note: Google does not expose exact remaining quota via the API.\n"
-                 "This shows estimated usage (units) in this app session only.",
+                 "These are estimates from the documented cost of every request this app sent, "
+                 "for this Cloud project (other apps on the same project are not counted).",
             wraplength=600,
         )
         note_label.pack(anchor="w", padx=8, pady=(0, 8))
 
+        cache_frame = ttk.LabelFrame(overview_tab, text="Playlist cache")
+        cache_frame.pack(fill="x", padx=12, pady=(0, 8))
+
+        cache_label = ttk.Label(cache_frame, textvariable=self.cache_label_var)
+        cache_label.pack(anchor="w", padx=8, pady=8)
+
         status_frame = ttk.LabelFrame(overview_tab, text="Status")
         status_frame.pack(fill="x", padx=12, pady=(0, 12))
 
@@ -109,6 +162,8 @@ class HomePage(ttk.Frame):
         self.playlists_tree.column("title", width=360, anchor="w")
         self.playlists_tree.column("item_count", width=80, anchor="center")
         self.playlists_tree.column("privacy", width=100, anchor="center")
+        self.playlists_tree.tag_configure("stale", foreground="gray50")
+        self.playlists_tree.tag_configure("recent", font=("Segoe UI", 9, "bold"))
 
         scrollbar = ttk.Scrollbar(
             playlists_frame, orient="vertical", command=self.playlists_tree.yview
@@ -138,6 +193,145 @@ class HomePage(ttk.Frame):
         )
         self.open_playlist_button.pack(side="right")
 
+        # Jobs tab (quota-aware queue, see job_queue.py)
+        jobs_tab = ttk.Frame(notebook)
+        notebook.add(jobs_tab, text="Jobs")
+
+        jobs_frame = ttk.LabelFrame(jobs_tab, text="Queued bulk jobs")
+        jobs_frame.pack(fill="both", expand=True, padx=12, pady=12)
+
+        jobs_info = ttk.Label(jobs_frame, textvariable=self.jobs_info_var, wraplength=900)
+        jobs_info.pack(anchor="w", padx=8, pady=(8, 0))
+
+        self.jobs_tree = ttk.Treeview(
+            jobs_frame,
+            columns=("label", "kind", "progress", "cost", "status"),
+            show="headings",
+            selectmode="browse",
+            height=10,
+        )
+        self.jobs_tree.pack(fill="both", expand=True, padx=8, pady=8)
+
+        self.jobs_tree.heading("label", text="Job")
+        self.jobs_tree.heading("kind", text="Kind")
+        self.jobs_tree.heading("progress", text="Done")
+        self.jobs_tree.heading("cost", text="Units left")
+        self.jobs_tree.heading("status", text="Status")
+
+        self.jobs_tree.column("label", width=360, anchor="w")
+        self.jobs_tree.column("kind", width=80, anchor="center")
+        self.jobs_tree.column("progress", width=120, anchor="center")
+        self.jobs_tree.column("cost", width=100, anchor="center")
+        self.jobs_tree.column("status", width=160, anchor="w")
+
+        jobs_actions = ttk.Frame(jobs_tab)
+        jobs_actions.pack(fill="x", padx=12, pady=(0, 12))
+
+        self.run_jobs_button = ttk.Button(
+            jobs_actions, text="Run queued jobs now", command=self.run_jobs
+        )
+        self.run_jobs_button.pack(side="left")
+
+        remove_job_button = ttk.Button(
+            jobs_actions, text="Remove selected job", command=self.on_remove_job_clicked
+        )
+        remove_job_button.pack(side="left", padx=(8, 0))
+
+        clear_jobs_button = ttk.Button(
+            jobs_actions, text="Clear finished", command=self.on_clear_jobs_clicked
+        )
+        clear_jobs_button.pack(side="left", padx=(8, 0))
+
+        # Duplicates tab (local library index, see library_index.py)
+        duplicates_tab = ttk.Frame(notebook)
+        notebook.add(duplicates_tab, text="Duplicates")
+
+        duplicates_frame = ttk.LabelFrame(duplicates_tab, text="Videos in your library more than once")
+        duplicates_frame.pack(fill="both", expand=True, padx=12, pady=12)
+
+        duplicates_info = ttk.Label(
+            duplicates_frame, textvariable=self.duplicates_info_var, wraplength=900
+        )
+        duplicates_info.pack(anchor="w", padx=8, pady=(8, 0))
+
+        self.duplicates_tree = ttk.Treeview(
+            duplicates_frame,
+            columns=("title", "video_id", "copies", "playlists"),
+            show="headings",
+            selectmode="browse",
+            height=12,
+        )
+        self.duplicates_tree.pack(fill="both", expand=True, padx=8, pady=8)
+
+        self.duplicates_tree.heading("title", text="Title")
+        self.duplicates_tree.heading("video_id", text="Video ID")
+        self.duplicates_tree.heading("copies", text="Copies")
+        self.duplicates_tree.heading("playlists", text="Playlists")
+
+        self.duplicates_tree.column("title", width=320, anchor="w")
+        self.duplicates_tree.column("video_id", width=140, anchor="center")
+        self.duplicates_tree.column("copies", width=70, anchor="center")
+        self.duplicates_tree.column("playlists", width=420, anchor="w")
+
+        duplicates_actions = ttk.Frame(duplicates_tab)
+        duplicates_actions.pack(fill="x", padx=12, pady=(0, 12))
+
+        self.scan_duplicates_button = ttk.Button(
+            duplicates_actions, text="Scan library", command=self.on_scan_duplicates_clicked
+        )
+        self.scan_duplicates_button.pack(side="left")
+
+        # Metrics tab (metrics.py, updated with the quota numbers)
+        metrics_tab = ttk.Frame(notebook)
+        notebook.add(metrics_tab, text="Metrics")
+
+        metrics_frame = ttk.LabelFrame(metrics_tab, text="API requests this run")
+        metrics_frame.pack(fill="both", expand=True, padx=12, pady=12)
+
+        metrics_info = ttk.Label(metrics_frame, textvariable=self.metrics_info_var, wraplength=900)
+        metrics_info.pack(anchor="w", padx=8, pady=(8, 0))
+
+        metric_columns = {
+            "endpoint": ("Endpoint", 170, "w"),
+            "calls": ("HTTP calls", 80, "e"),
+            "requests": ("Requests", 80, "e"),
+            "errors": ("Errors", 60, "e"),
+            "not_modified": ("304s", 60, "e"),
+            "retries": ("Retries", 60, "e"),
+            "units": ("Units", 80, "e"),
+            "p50": ("p50 ms", 70, "e"),
+            "p95": ("p95 ms", 70, "e"),
+            "p99": ("p99 ms", 70, "e"),
+            "kib_in": ("KiB in", 80, "e"),
+            "kib_out": ("KiB out", 80, "e"),
+            "throttled": ("Throttled s", 90, "e"),
+        }
+        self.metrics_tree = ttk.Treeview(
+            metrics_frame,
+            columns=tuple(metric_columns),
+            show="headings",
+            selectmode="none",
+            height=12,
+        )
+        self.metrics_tree.pack(fill="both", expand=True, padx=8, pady=8)
+        for column, (heading, width, anchor) in metric_columns.items():
+            self.metrics_tree.heading(column, text=heading)
+            self.metrics_tree.column(column, width=width, anchor=anchor)
+        self.metrics_tree.tag_configure("total", font=("Segoe UI", 9, "bold"))
+
+        metrics_actions = ttk.Frame(metrics_tab)
+        metrics_actions.pack(fill="x", padx=12, pady=(0, 12))
+
+        save_metrics_button = ttk.Button(
+            metrics_actions, text="Save to file", command=self.on_save_metrics_clicked
+        )
+        save_metrics_button.pack(side="left")
+
+        reset_metrics_button = ttk.Button(
+            metrics_actions, text="Reset", command=self.on_reset_metrics_clicked
+        )
+        reset_metrics_button.pack(side="left", padx=(8, 0))
+
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
@@ -146,23 +340,171 @@ class HomePage(ttk.Frame):
         if self.youtube_client:
             used = self.youtube_client.quota_used_units
             self.quota_label_var.set(f"Quota used this session: {used} units")
+            self._update_cache_label()
+
+        ledger = self.ledger
+        hours, rest = divmod(int(ledger.seconds_until_reset()), 3600)
+        self.quota_today_var.set(
+            f"Used today: {ledger.used_today():,} / {ledger.daily_limit:,} units, "
+            f"{ledger.remaining():,} remaining (resets in {hours}h {rest // 60:02d}m, "
+            "midnight Pacific time)"
+        )
+        breakdown = sorted(ledger.by_endpoint().items(), key=lambda kv: -kv[1])
+        self.quota_breakdown_var.set(
+            "  ".join(f"{name}: {units:,}" for name, units in breakdown)
+        )
+
+    def _tick_quota(self) -> None:
+        # playlist windows spend quota too, so keep the numbers live
+        self._update_quota_label()
+        self._update_metrics_tree()
+        self.after(2000, self._tick_quota)
+
+    def _update_metrics_tree(self) -> None:
+        snapshot = self.metrics.snapshot()
+        if not snapshot:
+            self.metrics_info_var.set("No API requests yet.")
+        else:
+            total = snapshot["total"]
+            self.metrics_info_var.set(
+                f"{total['http_calls']:,} HTTP calls, {total['requests']:,} API requests, "
+                f"{total['units']:,} units since {time.strftime('%H:%M', time.localtime(self.metrics.started_at))}. "
+                f"Latencies are per HTTP call (a batch is one call) and rounded up to the next "
+                f"histogram bucket. Saved to the {METRICS_DIR}/ folder when the app closes."
+            )
+
+        def ms(value) -> str:
+            return "-" if value is None else f"{value * 1000:,.0f}"
+
+        for endpoint, stats in snapshot.items():
+            values = (
+                endpoint,
+                f"{stats['http_calls']:,}",
+                f"{stats['requests']:,}",
+                stats["errors"],
+                stats["not_modified"],
+                stats["retries"],
+                f"{stats['units']:,}",
+                ms(stats["p50_seconds"]),
+                ms(stats["p95_seconds"]),
+                ms(stats["p99_seconds"]),
+                f"{stats['bytes_in'] / 1024:,.1f}",
+                f"{stats['bytes_out'] / 1024:,.1f}",
+                f"{stats['throttled_seconds']:.1f}",
+            )
+            # update rows in place, rebuilding every 2 s would flicker and lose the scroll position
+            if self.metrics_tree.exists(endpoint):
+                self.metrics_tree.item(endpoint, values=values)
+            else:
+                self.metrics_tree.insert(
+                    "", "end", iid=endpoint, values=values,
+                    tags=("total",) if endpoint == "total" else (),
+                )
+        # keep the total row last
+        if self.metrics_tree.exists("total"):
+            self.metrics_tree.move("total", "", "end")
+        for endpoint in self.metrics_tree.get_children():
+            if endpoint not in snapshot:
+                self.metrics_tree.delete(endpoint)
+
+    def _update_cache_label(self) -> None:
+        cache = self.youtube_client.cache if self.youtube_client else None
+        if not cache:
+            self.cache_label_var.set("Cache: disabled")
+            return
+        stats = cache.stats
+        self.cache_label_var.set(
+            f"Cache: {stats['hits']} page(s) served from disk, "
+            f"{stats['misses']} downloaded, {stats['not_modified']} not-modified (304) responses"
+        )
+
+    def _load_jobs_into_tree(self) -> None:
+        for row in self.jobs_tree.get_children():
+            self.jobs_tree.delete(row)
+
+        for job in self.job_queue.jobs:
+            total = len(job["keys"])
+            if job["status"] == "done":
+                status = f"Done ({len(job['failed'])} failed)" if job["failed"] else "Done"
+            else:
+                status = "Waiting for quota" if job["done"] else "Pending"
+            self.jobs_tree.insert(
+                "",
+                "end",
+                iid=job["id"],
+                values=(
+                    job["label"],
+                    job["kind"],
+                    f"{job['done']}/{total}",
+                    self.job_queue.estimate_cost(job),
+                    status,
+                ),
+            )
+
+        pending = self.job_queue.pending()
+        if not pending:
+            self.jobs_info_var.set("No queued jobs.")
+            return
+        info = (
+            f"{len(pending)} pending job(s), about {self.job_queue.total_pending_cost():,} "
+            "units of work left. Jobs use what is left of today's quota "
+            f"(keeping {self.job_queue.reserve_units} units spare) and continue after the reset."
+        )
+        if not self.youtube_client:
+            info += " Sign in to run them."
+        self.jobs_info_var.set(info)
 
     def _load_playlists_into_tree(self) -> None:
         for row in self.playlists_tree.get_children():
             self.playlists_tree.delete(row)
 
+        recent = set(self.snapshot.recent)
         for pl in self.playlists:
-            title = pl.get("title") or "(no title)"
-            count = pl.get("item_count") or 0
-            privacy = (pl.get("privacy_status") or "").capitalize()
-            iid = pl["id"]  # use playlist ID as internal item id
+            title = pl.title or "(no title)"
+            count = pl.item_count or 0
+            privacy = (pl.privacy_status or "").capitalize()
+            iid = pl.id  # use playlist ID as internal item id
+            tags = []
+            if self._stale:
+                tags.append("stale")
+            if pl.id in recent:
+                tags.append("recent")
             self.playlists_tree.insert(
                 "",
                 "end",
                 iid=iid,
                 values=(title, count, privacy),
+                tags=tuple(tags),
             )
 
+    # ------------------------------------------------------------------
+    # Session snapshot (stale-while-revalidate)
+    # ------------------------------------------------------------------
+
+    def _restore_snapshot(self) -> None:
+        """
+        Show last session's channel + playlists right away (greyed out as stale),
+        then sign in with the saved token and revalidate in the background.
+        """
+        snapshot = self.snapshot
+        if snapshot.is_empty():
+            return
+
+        self._stale = True
+        self.playlists = snapshot.playlists
+        self._load_playlists_into_tree()
+        if snapshot.recent and self.playlists_tree.exists(snapshot.recent[0]):
+            self.playlists_tree.selection_set(snapshot.recent[0])
+            self.playlists_tree.see(snapshot.recent[0])
+
+        title = snapshot.channel.get("title") or "Unknown channel"
+        self.current_user_label.set(f"Signed in as: {title} (saved session)")
+        minutes = int(snapshot.age_seconds() // 60)
+        self.status_label_var.set(
+            f"Showing playlists saved {minutes} min ago, checking with YouTube..."
+        )
+        self._start_sign_in(interactive=False)
+
     # ------------------------------------------------------------------
     # Event handlers
     # ------------------------------------------------------------------
@@ -170,40 +512,97 @@ class HomePage(ttk.Frame):
     def on_login_clicked(self) -> None:
         """
         Handle "Sign in with Google".
+        OAuth + channel info + playlists all happen on a worker thread.
         """
-        try:
-            self.status_label_var.set("Signing in...")
-            self.update_idletasks()
+        self.status_label_var.set("Signing in...")
+        self._start_sign_in(interactive=True)
 
-            client = YouTubeClient()
-            client.authenticate()
+    def _start_sign_in(self, interactive: bool) -> None:
+        """
+        interactive=False is the launch-time revalidation: saved token only, no
+        browser, and failures leave the stale snapshot on screen without a popup.
+        """
 
+        def work(task):
+            client = YouTubeClient(ledger=self.ledger, metrics=self.metrics)
+            if interactive:
+                task.report(0, None, "Signing in (check your browser)...")
+            else:
+                task.report(0, None, "Refreshing saved sign-in...")
+            if not client.authenticate(interactive=interactive):
+                return None
+            task.check_cancelled()
+
+            task.report(0, None, "Fetching channel info...")
             info = client.get_channel_basic_info()
-            channel_title = info.get("title") or "Unknown channel"
-            self.youtube_client = client
+            task.check_cancelled()
+
+            task.report(0, None, "Fetching playlists...")
+            playlists = client.list_playlists()
+            return client, info, playlists
+
+        self.tasks.submit(
+            work,
+            name="Signing in" if interactive else "Revalidating saved session",
+            on_done=self._on_login_done,
+            on_error=self._on_login_failed if interactive else self._on_revalidate_failed,
+            on_cancel=lambda: self.status_label_var.set("Sign-in cancelled."),
+            busy=(self.login_button,),
+        )
 
-            self.current_user_label.set(f"Signed in as: {channel_title}")
-            self.status_label_var.set("Fetching playlists...")
-            self.update_idletasks()
+    def _on_login_done(self, result) -> None:
+        if result is None:
+            # only happens without the browser: the saved token is gone or revoked
+            self.status_label_var.set(
+                "Showing saved playlists. Your sign-in expired, click 'Sign in with Google'."
+            )
+            return
 
-            self.playlists = client.list_playlists()
-            self._load_playlists_into_tree()
+        client, info, playlists = result
+        channel_title = info.get("title") or "Unknown channel"
+        self.youtube_client = client
 
-            self.status_label_var.set("Playlists loaded.")
-            self.open_playlist_button.config(state="normal")
-            self.refresh_button.config(state="normal")
-            self.logout_button.config(state="normal")
-            self._update_quota_label()
+        self.current_user_label.set(f"Signed in as: {channel_title}")
+        self._stale = False
+        self.snapshot.update(channel=info, playlists=playlists)
+        self.playlists = playlists
+        self._load_playlists_into_tree()
 
-        except FileNotFoundError as e:
+        self.status_label_var.set("Playlists loaded.")
+        self.open_playlist_button.config(state="normal")
+        self.refresh_button.config(state="normal")
+        self.logout_button.config(state="normal")
+        self._update_quota_label()
+
+        # pick up jobs left over from earlier sessions
+        self.run_jobs()
+
+    def _on_login_failed(self, e: Exception) -> None:
+        if isinstance(e, FileNotFoundError):
             messagebox.showerror(
                 "OAuth Error",
                 f"{e}\n\nMake sure client_secret.json is in the project folder.",
             )
-            self.status_label_var.set("Sign-in failed.")
-        except Exception as e:
+        else:
             messagebox.showerror("Error", f"Failed to sign in or load playlists:\n\n{e}")
-            self.status_label_var.set("Sign-in failed.")
+        self.status_label_var.set("Sign-in failed.")
+
+    def _on_revalidate_failed(self, e: Exception) -> None:
+        # offline etc.: keep showing the snapshot, a manual sign-in can retry
+        self.status_label_var.set(
+            f"Showing saved playlists, couldn't reach YouTube ({e}). Sign in to retry."
+        )
+
+    def on_save_metrics_clicked(self) -> None:
+        path = self.metrics.dump()
+        if path:
+            messagebox.showinfo("Metrics saved", f"Saved to {path}")
+        else:
+            messagebox.showinfo("Metrics", "Nothing to save yet (or the file could not be written).")
+
+    def on_reset_metrics_clicked(self) -> None:
+        self.metrics.reset()
+        self._update_metrics_tree()
 
     def on_logout_clicked(self) -> None:
             """
@@ -221,6 +620,12 @@ class HomePage(ttk.Frame):
             if not confirm:
                 return
 
+            # anything still running belongs to the old account
+            self.tasks.cancel_all()
+            if self._resume_job is not None:
+                self.after_cancel(self._resume_job)
+                self._resume_job = None
+
             try:
                 self.youtube_client.logout()
             except Exception:
@@ -229,9 +634,12 @@ class HomePage(ttk.Frame):
 
             # Reset app state
             self.youtube_client = None
+            self.snapshot.clear()  # belonged to the old account
+            self._stale = False
             self.playlists = []
             self.current_user_label.set("Not signed in")
             self.quota_label_var.set("Quota used this session: 0 units")
+            self.cache_label_var.set("Cache: no requests yet")
             self.status_label_var.set("Logged out. Please sign in to view your playlists.")
 
             # Disable buttons until next login
@@ -242,6 +650,8 @@ class HomePage(ttk.Frame):
             # Clear playlists table
             for row in self.playlists_tree.get_children():
                 self.playlists_tree.delete(row)
+            for row in self.duplicates_tree.get_children():
+                self.duplicates_tree.delete(row)
 
 
     def on_refresh_clicked(self) -> None:
@@ -252,18 +662,30 @@ class HomePage(ttk.Frame):
             messagebox.showwarning("Not signed in", "Please sign in first.")
             return
 
-        try:
-            self.status_label_var.set("Refreshing playlists...")
-            self.update_idletasks()
+        self.status_label_var.set("Refreshing playlists...")
+        client = self.youtube_client
 
-            self.playlists = self.youtube_client.list_playlists()
-            self._load_playlists_into_tree()
+        self.tasks.submit(
+            lambda task: client.list_playlists(),
+            name="Refreshing playlists",
+            on_done=self._on_refresh_done,
+            on_error=self._on_refresh_failed,
+            on_cancel=lambda: self.status_label_var.set("Refresh cancelled."),
+            busy=(self.refresh_button,),
+        )
 
-            self.status_label_var.set("Playlists refreshed.")
-            self._update_quota_label()
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to refresh playlists:\n\n{e}")
-            self.status_label_var.set("Failed to refresh playlists.")
+    def _on_refresh_done(self, playlists: list[Playlist]) -> None:
+        self.snapshot.update(playlists=playlists)
+        self.playlists = playlists
+        self._load_playlists_into_tree()
+
+        self.status_label_var.set("Playlists refreshed.")
+        self._update_quota_label()
+
+    def _on_refresh_failed(self, e: Exception) -> None:
+        messagebox.showerror("Error", f"Failed to refresh playlists:\n\n{e}")
+        self.status_label_var.set("Failed to refresh playlists.")
+        self._update_quota_label()
 
     def on_open_playlist_clicked(self) -> None:
         """
@@ -279,19 +701,159 @@ class HomePage(ttk.Frame):
             return
 
         playlist_id = selected[0]
-        playlist = next((p for p in self.playlists if p["id"] == playlist_id), None)
+        playlist = next((p for p in self.playlists if p.id == playlist_id), None)
         if not playlist:
             messagebox.showerror("Error", "Could not find playlist details.")
             return
 
+        self.snapshot.touch_playlist(playlist_id)
+        self._load_playlists_into_tree()
+        self.playlists_tree.selection_set(playlist_id)
+
         # Open a new window for playlist management
         PlaylistWindow(
             master=self.winfo_toplevel(),
             youtube_client=self.youtube_client,
             playlist=playlist,
             all_playlists=self.playlists,
+            job_queue=self.job_queue,
+            on_jobs_queued=self.run_jobs,
         )
         
         # Quota usage might have changed (if window did operations previously),
         # but this call here mainly keeps things in sync if you add more logic later.
         self._update_quota_label()
+
+    # ------------------------------------------------------------------
+    # Jobs (quota-aware queue)
+    # ------------------------------------------------------------------
+
+    def run_jobs(self) -> None:
+        """Work through queued jobs in the background as far as today's quota allows."""
+        if not self.youtube_client:
+            self._load_jobs_into_tree()
+            return
+        if not self.job_queue.pending():
+            self._load_jobs_into_tree()
+            return
+
+        client = self.youtube_client
+        job_queue = self.job_queue
+
+        def work(task):
+            return job_queue.run(
+                client,
+                progress=lambda job: task.call_soon(self._load_jobs_into_tree),
+                should_stop=lambda: task.cancelled,
+            )
+
+        def on_done(summary: dict) -> None:
+            self._load_jobs_into_tree()
+            self._update_quota_label()
+            if summary["deferred_units"]:
+                self._schedule_job_resume()
+                self.status_label_var.set(
+                    f"Jobs paused: out of quota for today, "
+                    f"{summary['deferred_units']:,} units of work continue after the reset."
+                )
+            elif summary["attempted"]:
+                self.status_label_var.set(
+                    f"Jobs finished: {summary['ok']} ok, {summary['failed']} failed."
+                )
+
+        self.tasks.submit(
+            work,
+            name="Running queued jobs",
+            on_done=on_done,
+            on_error=lambda e: messagebox.showerror("Error", f"Queued job failed:\n\n{e}"),
+            on_cancel=self._load_jobs_into_tree,
+            busy=(self.run_jobs_button,),
+        )
+
+    def _schedule_job_resume(self) -> None:
+        if self._resume_job is not None:
+            self.after_cancel(self._resume_job)
+        # a minute of slack past Pacific midnight
+        delay_ms = int((self.ledger.seconds_until_reset() + 60) * 1000)
+        self._resume_job = self.after(delay_ms, self._on_resume_jobs)
+
+    def _on_resume_jobs(self) -> None:
+        self._resume_job = None
+        self.run_jobs()
+
+    def on_remove_job_clicked(self) -> None:
+        selected = self.jobs_tree.selection()
+        if not selected:
+            messagebox.showwarning("No selection", "Select a job first.")
+            return
+        if self.tasks.is_busy():
+            messagebox.showwarning("Busy", "Wait for the running task to finish (or cancel it) first.")
+            return
+        self.job_queue.remove(selected[0])
+        self._load_jobs_into_tree()
+
+    def on_clear_jobs_clicked(self) -> None:
+        self.job_queue.clear_finished()
+        self._load_jobs_into_tree()
+
+    # ------------------------------------------------------------------
+    # Duplicates (library index)
+    # ------------------------------------------------------------------
+
+    def on_scan_duplicates_clicked(self) -> None:
+        """
+        Index every playlist (only the ones whose item count changed since the last
+        scan are re-listed, 1 unit per 50 items) and show videos found more than once.
+        """
+        if not self.youtube_client:
+            messagebox.showwarning("Not signed in", "Please sign in first.")
+            return
+
+        client = self.youtube_client
+        playlists = list(self.playlists)
+
+        def work(task):
+            summary = client.index_library(
+                playlists,
+                progress=lambda done, n: task.report(done, n, f"Indexed {done}/{n} playlist(s)..."),
+                should_stop=lambda: task.cancelled,
+            )
+            task.check_cancelled()
+            return summary, client.library.duplicates()
+
+        self.duplicates_info_var.set("Scanning playlists...")
+        self.tasks.submit(
+            work,
+            name="Scanning library",
+            on_done=self._on_scan_duplicates_done,
+            on_error=lambda e: messagebox.showerror("Error", f"Library scan failed:\n\n{e}"),
+            on_cancel=lambda: self.duplicates_info_var.set("Scan cancelled."),
+            busy=(self.scan_duplicates_button,),
+        )
+
+    def _on_scan_duplicates_done(self, result) -> None:
+        summary, duplicates = result
+        self._update_quota_label()
+
+        for row in self.duplicates_tree.get_children():
+            self.duplicates_tree.delete(row)
+
+        titles = {p.id: p.title or p.id for p in self.playlists}
+        for dup in duplicates:
+            where = ", ".join(
+                f"{titles.get(pid, pid)} (x{len(ids)})" if len(ids) > 1 else titles.get(pid, pid)
+                for pid, ids in dup["locations"].items()
+            )
+            self.duplicates_tree.insert(
+                "",
+                "end",
+                iid=dup["video_id"],
+                values=(dup["title"] or "(no title)", dup["video_id"], dup["count"], where),
+            )
+
+        extra = sum(d["count"] - 1 for d in duplicates)
+        self.duplicates_info_var.set(
+            f"{len(duplicates)} video(s) appear more than once ({extra} extra copies). "
+            f"Re-listed {summary['listed']} playlist(s), {summary['unchanged']} unchanged since the last scan. "
+            "Copying skips videos the target playlist already has."
+        )
@@ -1,27 +1,73 @@
 # ui/playlist_window.py
 # dependencies
+import time
 import tkinter as tk
-from tkinter import ttk, messagebox
-from typing import Dict, Any, List
+from tkinter import ttk, filedialog, messagebox
+from typing import Dict, Any, Callable, List, Optional
 
-from youtube_client import YouTubeClient
+from job_queue import JobQueue
+from library_index import split_new_videos
+from models import Playlist, PlaylistItem, SearchResult, VideoInfo
+from playlist_io import export_to_file, import_file, read_rows
+from reorder import ORDERINGS, apply_move
+from sync import plan_sync, run_sync
+from video_cache import UNAVAILABLE, availability, region_code
+from youtube_client import QUOTA_COST, YouTubeClient
+from ui.status_bar import TaskStatusBar
+from ui.task_runner import TaskRunner
+from ui.virtual_table import SortText, VirtualTable
+
+# wait this long after the last keystroke before filtering the table
+FILTER_DELAY_MS = 150
+
+# Reorder dropdown label -> reorder.ORDERINGS name (None = the table's current sort)
+REORDER_CHOICES = {
+    "Title A-Z": "title",
+    "Title Z-A": "title-desc",
+    "Channel": "channel",
+    "Reverse": "reverse",
+    "Shuffle": "shuffle",
+    "As sorted in the table": None,
+}
+
+# video_cache.availability() -> Availability column ("" = details not loaded yet)
+AVAILABILITY_LABELS = {
+    "ok": "ok",
+    "private": "private (yours)",
+    "missing": "deleted or private",
+    "rejected": "removed by YouTube",
+    "blocked": "blocked here",
+}
+
+
+def _format_duration(seconds: int) -> str:
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes}:{seconds:02d}"
 
 
 class PlaylistWindow(tk.Toplevel):
     """
     A separate window that manages a single playlist:
       - List videos in the playlist
-      - Delete from playlist
+      - Delete from playlist, or remove every deleted / private / blocked video at once
       - Copy (add) to another playlist
-      - Search YouTube and add to this playlist
+      - Reorder (sort, reverse, shuffle or drag and drop), moving as few videos as possible
+      - Mirror another playlist into this one (one-way sync, only the differences)
+      - Search YouTube, or the local index of your own playlists, and add to this playlist
+
+    Every API call runs through self.tasks (background workers); the buttons that
+    would start a conflicting call are disabled while it is in flight.
     """
 
     def __init__(
         self,
         master: tk.Misc,
         youtube_client: YouTubeClient,
-        playlist: Dict[str, Any],
-        all_playlists: List[Dict[str, Any]],
+        playlist: Playlist,
+        all_playlists: List[Playlist],
+        job_queue: Optional[JobQueue] = None,
+        on_jobs_queued: Optional[Callable[[], None]] = None,
         **kwargs,
     ):
         super().__init__(master, **kwargs)
@@ -29,27 +75,43 @@ class PlaylistWindow(tk.Toplevel):
         self.youtube_client = youtube_client
         self.playlist = playlist
         self.all_playlists = all_playlists
+        # bulk work that doesn't fit in today's quota goes here (owned by HomePage)
+        self.job_queue = job_queue
+        self.on_jobs_queued = on_jobs_queued
 
-        self.title(f"Playlist: {playlist.get('title', '(no title)')}")
+        self.title(f"Playlist: {playlist.title or '(no title)'}")
         # Bigger default window so buttons are visible without resizing
         self.geometry("1920x1080")
         self.minsize(1000, 650)
 
-        self.videos: List[Dict[str, Any]] = []
-        self.search_results: List[Dict[str, Any]] = []
+        self.videos: List[PlaylistItem] = []
+        self.search_results: List[SearchResult] = []
+        # videos.list details (duration, availability), filled in after each load
+        self.video_info: Dict[str, VideoInfo] = {}
+        self.region = region_code()
+        # when on, re-fetch the playlist in the background after each write
+        self.reconcile_var = tk.BooleanVar(value=False)
+        self._write_generation = 0  # bumped on every local write, see _reconcile_playlist_items
+        self._load_task = None
+        self._filter_after: Optional[str] = None
 
         self._build_ui()
+        self.tasks = TaskRunner(self, status_bar=self.status_bar)
         self._load_playlist_items()
 
     def _build_ui(self) -> None:
         # Top label
         header = ttk.Label(
             self,
-            text=f"Playlist: {self.playlist.get('title', '(no title)')}",
+            text=f"Playlist: {self.playlist.title or '(no title)'}",
             font=("Segoe UI", 14, "bold"),
         )
         header.pack(pady=(10, 5))
 
+        # Background task status along the bottom edge
+        self.status_bar = TaskStatusBar(self)
+        self.status_bar.pack(side="bottom", fill="x", padx=10, pady=(0, 10))
+
         # Main paned window: left = playlist videos, right = search
         paned = ttk.PanedWindow(self, orient="horizontal")
         paned.pack(fill="both", expand=True, padx=10, pady=10)
@@ -63,27 +125,46 @@ class PlaylistWindow(tk.Toplevel):
         lf_label = ttk.Label(left_frame, text="Videos in this playlist")
         lf_label.pack(anchor="w", pady=(0, 4))
 
-        self.videos_tree = ttk.Treeview(
+        # as-you-type filter over title / video id / channel (click a heading to sort)
+        filter_bar = ttk.Frame(left_frame)
+        filter_bar.pack(fill="x", pady=(0, 4))
+        ttk.Label(filter_bar, text="Filter:").pack(side="left")
+        self.filter_var = tk.StringVar()
+        filter_entry = ttk.Entry(filter_bar, textvariable=self.filter_var, width=40)
+        filter_entry.pack(side="left", padx=4)
+        filter_entry.bind("<Escape>", lambda _event: self.filter_var.set(""))
+        self.filter_var.trace_add("write", lambda *_: self._schedule_filter())
+        self.filter_count_var = tk.StringVar(value="")
+        ttk.Label(filter_bar, textvariable=self.filter_count_var, foreground="gray").pack(side="left")
+
+        # virtualized: only the visible rows exist as Treeview items, so
+        # 10k+ item playlists (e.g. channel uploads) stay fast
+        self.videos_tree = VirtualTable(
             left_frame,
-            columns=("title", "video_id", "position"),
-            show="headings",
+            columns=("title", "video_id", "position", "channel", "duration", "views", "availability"),
+            key=lambda item: item.playlist_item_id,
+            values=self._video_row_values,
             selectmode="extended",
+            sortable=True,
+            on_drop=self.on_videos_dropped,
         )
         self.videos_tree.heading("title", text="Title")
         self.videos_tree.heading("video_id", text="Video ID")
         self.videos_tree.heading("position", text="Pos")
+        self.videos_tree.heading("channel", text="Channel")
+        self.videos_tree.heading("duration", text="Length")
+        self.videos_tree.heading("views", text="Views")
+        self.videos_tree.heading("availability", text="Availability")
 
         self.videos_tree.column("title", width=350, anchor="w")
         self.videos_tree.column("video_id", width=200, anchor="center")
         self.videos_tree.column("position", width=50, anchor="center")
+        self.videos_tree.column("channel", width=180, anchor="w")
+        self.videos_tree.column("duration", width=70, anchor="e")
+        self.videos_tree.column("views", width=100, anchor="e")
+        self.videos_tree.column("availability", width=130, anchor="w")
 
-        self.videos_tree.pack(fill="both", expand=True, side="left")
-
-        vsb = ttk.Scrollbar(
-            left_frame, orient="vertical", command=self.videos_tree.yview
-        )
-        vsb.pack(side="right", fill="y")
-        self.videos_tree.configure(yscrollcommand=vsb.set)
+        self.videos_tree.pack(fill="both", expand=True)
 
         # Buttons under playlist videos
         buttons_frame = ttk.Frame(left_frame)
@@ -93,14 +174,18 @@ class PlaylistWindow(tk.Toplevel):
             buttons_frame, text="Delete from playlist", command=self.on_delete_clicked
         )
         self.delete_button.pack(side="left", padx=(0, 4))
+        self.remove_unavailable_button = ttk.Button(
+            buttons_frame, text="Remove unavailable...", command=self.on_remove_unavailable_clicked
+        )
+        self.remove_unavailable_button.pack(side="left", padx=(0, 8))
 
         # Dropdown for "Copy to playlist"
         ttk.Label(buttons_frame, text="Copy to:").pack(side="left")
         self.target_playlist_var = tk.StringVar(value="")
         playlist_titles = [
-            f"{pl.get('title', '(no title)')} ({pl['id']})"
+            f"{pl.title or '(no title)'} ({pl.id})"
             for pl in self.all_playlists
-            if pl["id"] != self.playlist["id"]
+            if pl.id != self.playlist.id
         ]
         self.target_menu = ttk.Combobox(
             buttons_frame,
@@ -116,6 +201,63 @@ class PlaylistWindow(tk.Toplevel):
         )
         self.move_button.pack(side="left", padx=(4, 0))
 
+        reconcile_check = ttk.Checkbutton(
+            buttons_frame,
+            text="Re-check with YouTube after changes",
+            variable=self.reconcile_var,
+        )
+        reconcile_check.pack(side="right")
+
+        # backup / restore (playlist_io): this playlist to / from a .jsonl or .csv file
+        self.import_button = ttk.Button(
+            buttons_frame, text="Import...", command=self.on_import_clicked
+        )
+        self.import_button.pack(side="right", padx=(0, 8))
+        export_button = ttk.Button(
+            buttons_frame, text="Export...", command=self.on_export_clicked
+        )
+        export_button.pack(side="right", padx=(0, 4))
+
+        # reordering: playlistItems.update per moved video (see reorder.py), cost shown first
+        reorder_frame = ttk.Frame(left_frame)
+        reorder_frame.pack(fill="x", pady=(6, 0))
+        ttk.Label(reorder_frame, text="Reorder:").pack(side="left")
+        self.reorder_var = tk.StringVar(value=next(iter(REORDER_CHOICES)))
+        reorder_menu = ttk.Combobox(
+            reorder_frame,
+            textvariable=self.reorder_var,
+            values=list(REORDER_CHOICES),
+            state="readonly",
+            width=24,
+        )
+        reorder_menu.pack(side="left", padx=4)
+        self.reorder_button = ttk.Button(
+            reorder_frame, text="Reorder playlist...", command=self.on_reorder_clicked
+        )
+        self.reorder_button.pack(side="left", padx=(4, 0))
+        reorder_hint = ttk.Label(
+            reorder_frame,
+            text="or drag selected videos to a new place",
+            foreground="gray",
+        )
+        reorder_hint.pack(side="left", padx=(8, 0))
+
+        # one-way sync: make this playlist a copy of another one (sync.py)
+        self.sync_button = ttk.Button(
+            reorder_frame, text="Sync...", command=self.on_sync_clicked
+        )
+        self.sync_button.pack(side="right")
+        self.sync_source_var = tk.StringVar(value="")
+        sync_menu = ttk.Combobox(
+            reorder_frame,
+            textvariable=self.sync_source_var,
+            values=playlist_titles,
+            state="readonly",
+            width=40,
+        )
+        sync_menu.pack(side="right", padx=4)
+        ttk.Label(reorder_frame, text="Mirror from:").pack(side="right")
+
         # ------------------------------------------------------------------
         # Right side: search & add
         # ------------------------------------------------------------------
@@ -123,30 +265,57 @@ class PlaylistWindow(tk.Toplevel):
         paned.add(right_frame, weight=2)
 
         search_label = ttk.Label(
-            right_frame, text="Search YouTube (global) and add to this playlist"
+            right_frame, text="Search YouTube (global) or your own playlists and add to this playlist"
         )
         search_label.pack(anchor="w", pady=(0, 4))
 
+        # "library" = LibraryIndex.search: titles of every indexed playlist, free and instant
+        self.search_mode_var = tk.StringVar(value="youtube")
+        mode_bar = ttk.Frame(right_frame)
+        mode_bar.pack(fill="x", pady=(0, 4))
+        ttk.Label(mode_bar, text="Search in:").pack(side="left")
+        ttk.Radiobutton(
+            mode_bar, text="YouTube (~100 units)", value="youtube",
+            variable=self.search_mode_var,
+        ).pack(side="left", padx=(4, 0))
+        ttk.Radiobutton(
+            mode_bar, text="My library (free)", value="library",
+            variable=self.search_mode_var,
+        ).pack(side="left", padx=(4, 0))
+
         search_bar = ttk.Frame(right_frame)
         search_bar.pack(fill="x", pady=(0, 4))
 
         self.search_var = tk.StringVar()
         search_entry = ttk.Entry(search_bar, textvariable=self.search_var)
         search_entry.pack(side="left", fill="x", expand=True)
+        search_entry.bind("<Return>", lambda _event: self.on_search_clicked())
 
-        search_button = ttk.Button(
+        self.search_button = ttk.Button(
             search_bar, text="Search", command=self.on_search_clicked
         )
-        search_button.pack(side="left", padx=(4, 0))
+        self.search_button.pack(side="left", padx=(4, 0))
+
+        # repeat searches are served from the local cache unless this is ticked
+        self.force_refresh_var = tk.BooleanVar(value=False)
+        force_check = ttk.Checkbutton(
+            search_bar, text="Force refresh", variable=self.force_refresh_var
+        )
+        force_check.pack(side="left", padx=(4, 0))
 
         # Reminder label about quota cost
         quota_hint = ttk.Label(
             right_frame,
-            text="Note: each global search costs about 100 quota units.",
+            text="Note: each global search costs about 100 quota units "
+                 "(repeating a recent search is free, it comes from the local cache).",
             foreground="gray"
         )
         quota_hint.pack(anchor="w", pady=(0, 4))
 
+        self.search_source_var = tk.StringVar(value="")
+        search_source = ttk.Label(right_frame, textvariable=self.search_source_var, wraplength=600)
+        search_source.pack(anchor="w", pady=(0, 4))
+
         self.search_tree = ttk.Treeview(
             right_frame,
             columns=("title", "video_id", "channel"),
@@ -170,38 +339,296 @@ class PlaylistWindow(tk.Toplevel):
         s_vsb.pack(side="right", fill="y")
         self.search_tree.configure(yscrollcommand=s_vsb.set)
 
-        add_button = ttk.Button(
+        self.add_button = ttk.Button(
             right_frame, text="Add selected to playlist", command=self.on_add_clicked
         )
-        add_button.pack(pady=(6, 0))
+        self.add_button.pack(pady=(6, 0))
 
     # ------------------------------------------------------------------
     # Load / refresh data
     # ------------------------------------------------------------------
 
+    def _write_buttons(self) -> tuple:
+        """Buttons that change the playlist; disabled while any of them is running."""
+        return (
+            self.delete_button, self.remove_unavailable_button, self.move_button,
+            self.add_button, self.import_button, self.reorder_button, self.sync_button,
+        )
+
     def _load_playlist_items(self) -> None:
-        """Fetch videos from YouTube and show them in the left table."""
-        try:
-            self.videos = self.youtube_client.list_playlist_items(self.playlist["id"])
+        """
+        Fetch videos from YouTube (in the background) and show them in the left table.
+        Rows are rendered page by page, so the first 50 show up after one round-trip.
+        """
+        playlist_id = self.playlist.id
+        client = self.youtube_client
+        expected = self.playlist.item_count or None
+
+        # a newer load replaces whatever an older one was still streaming in
+        if self._load_task is not None:
+            self._load_task.cancel()
+
+        self.videos = []
+        self._refresh_videos_tree()
+
+        def work(task):
+            loaded = 0
+            for page in client.iter_playlist_item_pages(playlist_id):
+                task.check_cancelled()
+                task.call_soon(self._append_video_page, page)
+                loaded += len(page)
+                task.report(loaded, expected, f"Loaded {loaded} video(s)...")
+            return loaded
+
+        self._load_task = self.tasks.submit(
+            work,
+            name="Loading playlist items",
+            on_done=lambda _loaded: self._load_video_details(),
+            on_error=lambda e: messagebox.showerror(
+                "Error", f"Failed to load playlist items:\n\n{e}", parent=self
+            ),
+            busy=self._write_buttons(),
+        )
+
+    def _append_video_page(self, page: List[PlaylistItem]) -> None:
+        self.videos.extend(page)
+        self.videos_tree.refresh()
+        self._update_filter_count()
+
+    def _load_video_details(self) -> None:
+        """
+        Duration / views / availability for the videos we don't have yet: cached ones
+        are free, the rest cost 1 unit per 50 videos (see YouTubeClient.video_details).
+        """
+        wanted = [v.video_id for v in self.videos if v.video_id and v.video_id not in self.video_info]
+        if not wanted:
+            return
+        client = self.youtube_client
+
+        def on_done(details: Dict[str, VideoInfo]) -> None:
+            self.video_info.update(details)
             self._refresh_videos_tree()
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to load playlist items:\n\n{e}")
+
+        self.tasks.submit(
+            lambda task: client.video_details(
+                wanted,
+                progress=lambda done, total: task.report(done, total, f"Video details {done}/{total}..."),
+                should_stop=lambda: task.cancelled,
+            ),
+            name="Loading video details",
+            # no on_error: these are extra columns, the playlist works without them
+            on_done=on_done,
+        )
+
+    def _availability(self, item: PlaylistItem) -> Optional[str]:
+        info = self.video_info.get(item.video_id) if item.video_id else None
+        return availability(info, self.region) if info else None
+
+    def _video_row_values(self, item: PlaylistItem) -> tuple:
+        title = item.title or "(no title)"
+        vid = item.video_id or ""
+        pos = item.position if item.position is not None else ""
+        info = self.video_info.get(vid)
+        if info is None:
+            return (title, vid, pos, item.channel_title or "", "", "", "")
+        duration = (
+            SortText(_format_duration(info.duration_seconds), info.duration_seconds)
+            if info.duration_seconds is not None else ""
+        )
+        views = SortText(f"{info.view_count:,}", info.view_count) if info.view_count is not None else ""
+        return (
+            title, vid, pos, item.channel_title or "", duration, views,
+            AVAILABILITY_LABELS[availability(info, self.region)],
+        )
 
     def _refresh_videos_tree(self) -> None:
-        for row in self.videos_tree.get_children():
-            self.videos_tree.delete(row)
-
-        for item in self.videos:
-            pid = item["playlist_item_id"]
-            title = item.get("title") or "(no title)"
-            vid = item.get("video_id") or ""
-            pos = item.get("position") if item.get("position") is not None else ""
-            self.videos_tree.insert(
-                "",
-                "end",
-                iid=pid,
-                values=(title, vid, pos),
+        # cost only depends on the viewport size, not on len(self.videos)
+        # (plus re-indexing the rows while a filter or sort is on)
+        self.videos_tree.set_rows(self.videos)
+        self._update_filter_count()
+
+    def _schedule_filter(self) -> None:
+        # debounce: a fast typist shouldn't filter 20k rows once per character
+        if self._filter_after is not None:
+            self.after_cancel(self._filter_after)
+        self._filter_after = self.after(FILTER_DELAY_MS, self._apply_filter)
+
+    def _apply_filter(self) -> None:
+        self._filter_after = None
+        self.videos_tree.set_filter(self.filter_var.get())
+        self._update_filter_count()
+
+    def _update_filter_count(self) -> None:
+        shown, total = len(self.videos_tree.rows), len(self.videos)
+        if self.filter_var.get().strip():
+            self.filter_count_var.set(f"{shown:,} of {total:,} videos")
+        else:
+            self.filter_count_var.set(f"{total:,} videos")
+
+    # ------------------------------------------------------------------
+    # Incremental updates (apply our own writes locally instead of re-paging)
+    # ------------------------------------------------------------------
+
+    def _renumber_from(self, start: int) -> None:
+        """Positions are 0..n-1 in playlist order; fix them from `start` on."""
+        for index in range(start, len(self.videos)):
+            self.videos[index].position = index
+
+    def _apply_deleted(self, playlist_item_ids) -> None:
+        gone = set(playlist_item_ids)
+        if not gone:
+            return
+
+        first = next(
+            (i for i, v in enumerate(self.videos) if v.playlist_item_id in gone),
+            len(self.videos),
+        )
+        self.videos = [v for v in self.videos if v.playlist_item_id not in gone]
+        self._renumber_from(first)
+        self._refresh_videos_tree()
+
+    def _apply_inserted(self, item: PlaylistItem) -> None:
+        # insert response carries the real position; new items normally land at the end
+        position = item.position
+        if position is None or not 0 <= position <= len(self.videos):
+            position = len(self.videos)
+
+        self.videos.insert(position, item)
+        self._renumber_from(position)
+        # the table redraws only the rows in view, whatever changed
+        self._refresh_videos_tree()
+
+    def _queue_if_over_budget(
+        self, kind: str, playlist_id: str, keys: List[str], label: str
+    ) -> bool:
+        """
+        If `keys` would cost more than today's remaining quota, offer to hand the work
+        to the job queue instead. Returns True when the caller should NOT run it now.
+        """
+        if self.job_queue is None:
+            return False
+
+        endpoint = "playlistItems.insert" if kind == "insert" else "playlistItems.delete"
+        cost = len(keys) * QUOTA_COST[endpoint]
+        remaining = self.youtube_client.ledger.remaining()
+        if cost <= remaining:
+            return False
+
+        if not messagebox.askyesno(
+            "Not enough quota today",
+            f"This needs about {cost:,} quota units but only about {remaining:,} are left today.\n\n"
+            "Queue it as a job instead? It will do as much as today's quota allows and "
+            "continue automatically after the daily reset (even after restarting the app).\n"
+            "Progress is shown in the Jobs tab of the main window.",
+            parent=self,
+        ):
+            return True
+
+        if kind == "insert":
+            self.job_queue.add_insert_job(playlist_id, keys, label)
+        else:
+            self.job_queue.add_delete_job(playlist_id, keys, label)
+        if self.on_jobs_queued:
+            self.on_jobs_queued()
+        return True
+
+    def _start_bulk(
+        self, kind: str, playlist_id: str, keys: List[str], label: str, verb: str
+    ) -> tuple:
+        """
+        (work, job) for a bulk insert/delete. With a job queue the operation becomes a
+        claimed job that runs right away but is journaled chunk by chunk, so after a
+        crash or lost connection HomePage resumes it without redoing finished work.
+        work(task) returns (results, deferred_units).
+        """
+        client = self.youtube_client
+        job_queue = self.job_queue
+
+        def progress(done: int, total: int, task) -> None:
+            task.report(done, total, f"{verb} {done}/{total}...")
+
+        if job_queue is None:
+            def work(task):
+                if kind == "insert":
+                    results = client.insert_playlist_items(
+                        playlist_id, keys,
+                        progress=lambda done, n: progress(done, n, task),
+                        should_stop=lambda: task.cancelled,
+                        skip_existing=True,
+                    )
+                else:
+                    results = client.delete_playlist_items(
+                        keys,
+                        progress=lambda done, n: progress(done, n, task),
+                        should_stop=lambda: task.cancelled,
+                    )
+                task.check_cancelled()
+                return results, 0
+
+            return work, None
+
+        if kind == "insert":
+            job = job_queue.add_insert_job(playlist_id, keys, label, claim=True)
+        else:
+            job = job_queue.add_delete_job(playlist_id, keys, label, claim=True)
+
+        def work(task):
+            summary = job_queue.run_job(
+                client,
+                job,
+                progress=lambda j: progress(j["done"], len(j["keys"]), task),
+                should_stop=lambda: task.cancelled,
             )
+            task.check_cancelled()
+            return summary["results"], summary["deferred_units"]
+
+        return work, job
+
+    def _bulk_cancelled(self, job: Optional[Dict[str, Any]]) -> None:
+        # cancelling means "stop", not "finish it later"
+        if job is not None and self.job_queue is not None:
+            self.job_queue.remove(job["id"])
+
+    def _bulk_deferred(self, deferred_units: int) -> None:
+        if not deferred_units:
+            return
+        messagebox.showinfo(
+            "Continuing later",
+            f"Today's quota ran out. The remaining work (about {deferred_units:,} units) "
+            "stays in the Jobs tab of the main window and continues after the daily reset.",
+            parent=self,
+        )
+        if self.on_jobs_queued:
+            self.on_jobs_queued()
+
+    def _after_local_write(self) -> None:
+        self._write_generation += 1
+        self._load_video_details()  # newly added videos
+        if self.reconcile_var.get():
+            self._reconcile_playlist_items()
+
+    def _reconcile_playlist_items(self) -> None:
+        """
+        Background check that the local model matches YouTube.
+        Only rebuilds the table if something actually differs.
+        """
+        playlist_id = self.playlist.id
+        client = self.youtube_client
+        generation = self._write_generation
+
+        def on_done(fresh: List[PlaylistItem]) -> None:
+            # another write landed meanwhile; its own re-check will follow
+            if generation != self._write_generation:
+                return
+            if fresh != self.videos:
+                self.videos = fresh
+                self._refresh_videos_tree()
+
+        self.tasks.submit(
+            lambda task: client.list_playlist_items(playlist_id),
+            name="Re-checking playlist",
+            on_done=on_done,
+        )
 
     # ------------------------------------------------------------------
     # Event handlers - playlist side
@@ -218,24 +645,106 @@ class PlaylistWindow(tk.Toplevel):
             f"Remove {len(selected)} selected video(s) from this playlist?",
         ):
             return
+        self._delete_items(list(selected))
 
-        failed = 0
-        for playlist_item_id in selected:
-            try:
-                self.youtube_client.delete_playlist_item(playlist_item_id)
-            except Exception:
-                failed += 1
+    def on_remove_unavailable_clicked(self) -> None:
+        """Delete every video nobody can watch (deleted, private, removed, region-blocked)."""
+        candidates = [v for v in self.videos if self._availability(v) in UNAVAILABLE]
+        if not candidates:
+            unknown = sum(1 for v in self.videos if v.video_id and v.video_id not in self.video_info)
+            messagebox.showinfo(
+                "Nothing to remove",
+                "No unavailable videos in this playlist."
+                + (f"\n\n({unknown:,} video(s) not checked yet, try again in a moment.)" if unknown else ""),
+                parent=self,
+            )
+            return
 
-        # Reload playlist after batch operation
-        self._load_playlist_items()
+        client = self.youtube_client
 
-        if failed == 0:
-            messagebox.showinfo("Deleted", f"Removed {len(selected)} video(s) from playlist.")
-        else:
-            messagebox.showwarning(
-                "Partial delete",
-                f"Removed {len(selected) - failed} video(s).\nFailed to remove {failed} video(s)."
-            )
+        def on_checked(details: Dict[str, VideoInfo]) -> None:
+            # the cache may be a few days old: only delete what is still unavailable now
+            self.video_info.update(details)
+            self._refresh_videos_tree()
+            gone = [
+                v for v in candidates
+                if v.video_id in details and self._availability(v) in UNAVAILABLE
+            ]
+            if not gone:
+                messagebox.showinfo("Nothing to remove", "Those videos are available again.", parent=self)
+                return
+            counts: Dict[str, int] = {}
+            for v in gone:
+                label = AVAILABILITY_LABELS[self._availability(v)]
+                counts[label] = counts.get(label, 0) + 1
+            breakdown = "\n".join(f"  {label}: {n:,}" for label, n in sorted(counts.items()))
+            cost = len(gone) * QUOTA_COST["playlistItems.delete"]
+            if not messagebox.askyesno(
+                "Remove unavailable videos",
+                f"Remove {len(gone):,} video(s) that can't be watched?\n\n{breakdown}\n\n"
+                f"About {cost:,} quota units.",
+                parent=self,
+            ):
+                return
+            self._delete_items([v.playlist_item_id for v in gone])
+
+        # re-check with YouTube first (1 unit per 50 videos, deleting costs 50 each)
+        self.tasks.submit(
+            lambda task: client.video_details(
+                [v.video_id for v in candidates], force_refresh=True, should_stop=lambda: task.cancelled
+            ),
+            name="Checking unavailable videos",
+            on_done=on_checked,
+            on_error=lambda e: messagebox.showerror("Error", f"Check failed:\n\n{e}", parent=self),
+            busy=self._write_buttons(),
+        )
+
+    def _delete_items(self, playlist_item_ids: List[str]) -> None:
+        """Delete confirmed items: batched, journaled as a job, or queued when over budget."""
+        count = len(playlist_item_ids)
+        title = self.playlist.title or "(no title)"
+        if self._queue_if_over_budget(
+            "delete", self.playlist.id, playlist_item_ids,
+            f"Delete {count} video(s) from {title}",
+        ):
+            return
+
+        # one batch HTTP call per BATCH_SIZE items instead of one call per item
+        work, job = self._start_bulk(
+            "delete", self.playlist.id, playlist_item_ids,
+            f"Delete {count} video(s) from {title}", "Deleted",
+        )
+
+        def on_done(result) -> None:
+            results, deferred_units = result
+            # drop the deleted rows locally instead of re-paging the playlist
+            self._apply_deleted(r["key"] for r in results if r["ok"])
+            self._after_local_write()
+
+            removed = sum(1 for r in results if r["ok"])
+            failed = len(results) - removed
+
+            if failed == 0:
+                messagebox.showinfo("Deleted", f"Removed {removed} video(s) from playlist.", parent=self)
+            else:
+                messagebox.showwarning(
+                    "Partial delete",
+                    f"Removed {removed} video(s).\nFailed to remove {failed} video(s).",
+                    parent=self,
+                )
+            self._bulk_deferred(deferred_units)
+
+        def on_cancel() -> None:
+            self._bulk_cancelled(job)
+            self._load_playlist_items()  # some may already be gone
+
+        self.tasks.submit(
+            work,
+            name="Deleting videos",
+            on_done=on_done,
+            on_cancel=on_cancel,
+            busy=self._write_buttons(),
+        )
 
     def on_move_clicked(self) -> None:
         """
@@ -266,36 +775,388 @@ class PlaylistWindow(tk.Toplevel):
             return
 
         # Build a quick lookup from playlist_item_id -> video_id/title
-        by_pid = {v["playlist_item_id"]: v for v in self.videos}
-
-        success = 0
-        failed = 0
+        by_pid = {v.playlist_item_id: v for v in self.videos}
+        video_ids = []
+        missing = 0
 
         for playlist_item_id in selected:
             item = by_pid.get(playlist_item_id)
-            if not item:
-                failed += 1
+            if not item or not item.video_id:
+                missing += 1
                 continue
+            video_ids.append(item.video_id)
 
-            video_id = item.get("video_id")
-            if not video_id:
-                failed += 1
-                continue
+        # videos the target already has (per the local index, no API call) are
+        # skipped, and don't count towards the quota check either
+        client = self.youtube_client
+        known_present = 0
+        library = client.library
+        if library and library.is_fresh(target_playlist_id):
+            to_insert, skipped = split_new_videos(
+                video_ids, library.present_in(target_playlist_id, video_ids)
+            )
+            known_present = len(skipped)
+            video_ids = to_insert
+        if not video_ids:
+            messagebox.showinfo(
+                "Nothing to copy",
+                f"All {known_present} video(s) are already in the target playlist "
+                f"(saved {known_present * QUOTA_COST['playlistItems.insert']:,} quota units).",
+                parent=self,
+            )
+            return
+
+        if self._queue_if_over_budget(
+            "insert", target_playlist_id, video_ids,
+            f"Copy {len(video_ids)} video(s) from {self.playlist.title or '(no title)'}",
+        ):
+            return
+
+        work, job = self._start_bulk(
+            "insert", target_playlist_id, video_ids,
+            f"Copy {len(video_ids)} video(s) from {self.playlist.title or '(no title)'}", "Copied",
+        )
+
+        def on_done(result) -> None:
+            results, deferred_units = result
+            skipped = known_present + sum(1 for r in results if r.get("skipped"))
+            success = sum(1 for r in results if r["ok"] and not r.get("skipped"))
+            failed = missing + sum(1 for r in results if not r["ok"])
+            message = f"Copied {success} video(s) to the target playlist."
+            if skipped:
+                saved = skipped * QUOTA_COST["playlistItems.insert"]
+                message += (
+                    f"\nSkipped {skipped} video(s) already in it "
+                    f"(saved {saved:,} quota units)."
+                )
+            if failed == 0:
+                messagebox.showinfo("Copied", message, parent=self)
+            else:
+                messagebox.showwarning(
+                    "Partial copy",
+                    f"{message}\nFailed to copy {failed} video(s).\n\n"
+                    "Tip: Some failures may be restricted or deleted videos.",
+                    parent=self,
+                )
+            self._bulk_deferred(deferred_units)
+
+        self.tasks.submit(
+            work,
+            name="Copying videos",
+            on_done=on_done,
+            on_cancel=lambda: self._bulk_cancelled(job),
+            busy=self._write_buttons(),
+        )
+
+    def on_export_clicked(self) -> None:
+        """Write this playlist to a .jsonl/.csv file, streamed page by page (1 unit per 50 items)."""
+        path = filedialog.asksaveasfilename(
+            parent=self,
+            title="Export playlist",
+            defaultextension=".jsonl",
+            initialfile=f"{self.playlist.title or self.playlist.id}.jsonl",
+            filetypes=[("JSON Lines", "*.jsonl"), ("CSV", "*.csv")],
+        )
+        if not path:
+            return
+
+        playlist_id = self.playlist.id
+        client = self.youtube_client
+        expected = self.playlist.item_count or None
+
+        def work(task):
+            rows = export_to_file(
+                client, [playlist_id], path,
+                progress=lambda n: task.report(n, expected, f"Exported {n} video(s)..."),
+                should_stop=lambda: task.cancelled,
+            )
+            task.check_cancelled()
+            return rows
+
+        self.tasks.submit(
+            work,
+            name="Exporting playlist",
+            on_done=lambda rows: messagebox.showinfo(
+                "Exported", f"Wrote {rows} video(s) to\n{path}", parent=self
+            ),
+            on_error=lambda e: messagebox.showerror("Error", f"Export failed:\n\n{e}", parent=self),
+        )
+
+    def on_import_clicked(self) -> None:
+        """Add the videos of an export file to this playlist (already present ones are skipped)."""
+        path = filedialog.askopenfilename(
+            parent=self,
+            title="Import into this playlist",
+            filetypes=[("Playlist exports", "*.jsonl *.csv"), ("All files", "*.*")],
+        )
+        if not path:
+            return
+
+        # first a quick streaming pass over the file, for the confirmation and progress
+        def count(task):
+            return sum(1 for row in read_rows(path) if row["video_id"])
+
+        self.tasks.submit(
+            count,
+            name="Reading file",
+            on_done=lambda total: self._start_import(path, total),
+            on_error=lambda e: messagebox.showerror("Error", f"Could not read file:\n\n{e}", parent=self),
+            busy=self._write_buttons(),
+        )
+
+    def _start_import(self, path: str, total: int) -> None:
+        if total == 0:
+            messagebox.showinfo("Import", "The file has no videos.", parent=self)
+            return
+        cost = total * QUOTA_COST["playlistItems.insert"]
+        if not messagebox.askyesno(
+            "Confirm import",
+            f"Add up to {total} video(s) to this playlist?\n\n"
+            f"At most about {cost:,} quota units (about "
+            f"{self.youtube_client.ledger.remaining():,} left today). "
+            "Videos already in the playlist are skipped for free.",
+            parent=self,
+        ):
+            return
+
+        playlist_id = self.playlist.id
+        client = self.youtube_client
+
+        def work(task):
+            def progress(summary: Dict[str, Any]) -> None:
+                done = summary["inserted"] + summary["skipped"] + summary["failed"]
+                task.report(done, total, f"Imported {done}/{total}...")
 
-            try:
-                self.youtube_client.insert_playlist_item(target_playlist_id, video_id)
-                success += 1
-            except Exception:
-                failed += 1
+            return import_file(
+                client, playlist_id, path,
+                progress=progress, should_stop=lambda: task.cancelled,
+            )
+
+        def on_done(summary: Dict[str, Any]) -> None:
+            # inserts can land anywhere in the batch order, just re-page the playlist
+            self._load_playlist_items()
+            message = (
+                f"Added {summary['inserted']} video(s), skipped {summary['skipped']} "
+                "already in the playlist."
+            )
+            if summary["stopped"]:
+                message += "\nStopped before the end of the file."
+            if summary["failed"]:
+                messagebox.showwarning(
+                    "Partial import",
+                    f"{message}\nFailed to add {summary['failed']} video(s).",
+                    parent=self,
+                )
+            else:
+                messagebox.showinfo("Imported", message, parent=self)
+
+        self.tasks.submit(
+            work,
+            name="Importing videos",
+            on_done=on_done,
+            on_cancel=self._load_playlist_items,  # some may already be in
+            on_error=lambda e: messagebox.showerror("Error", f"Import failed:\n\n{e}", parent=self),
+            busy=self._write_buttons(),
+        )
+
+    # ------------------------------------------------------------------
+    # Reordering
+    # ------------------------------------------------------------------
 
-        if failed == 0:
-            messagebox.showinfo("Copied", f"Copied {success} video(s) to the target playlist.")
+    def on_reorder_clicked(self) -> None:
+        if not self.videos:
+            return
+        label = self.reorder_var.get()
+        ordering = REORDER_CHOICES.get(label)
+        if ordering is None:
+            view = self.videos_tree.view
+            if view.sort_column is None or self.filter_var.get().strip():
+                messagebox.showinfo(
+                    "Reorder",
+                    "Sort the table by clicking a column heading first (with the filter empty).",
+                    parent=self,
+                )
+                return
+            desired = list(self.videos_tree.rows)
         else:
-            messagebox.showwarning(
-                "Partial copy",
-                f"Copied {success} video(s).\nFailed to copy {failed} video(s).\n\n"
-                "Tip: Some failures may be duplicates or restricted videos."
+            desired = ORDERINGS[ordering](self.videos)
+        self._start_reorder([it.playlist_item_id for it in desired], label)
+
+    def on_videos_dropped(self, keys: tuple, index: int) -> None:
+        """Selected rows dragged in the table: move them in front of row `index`."""
+        if self.videos_tree.view.active:
+            messagebox.showinfo(
+                "Reorder",
+                "Clear the filter and the column sort to drag videos into a new order.",
+                parent=self,
             )
+            return
+        moving = set(keys)
+        target = self.videos[index].playlist_item_id if index < len(self.videos) else None
+        if target in moving:
+            return
+        dragged = [v for v in self.videos if v.playlist_item_id in moving]
+        rest = [v for v in self.videos if v.playlist_item_id not in moving]
+        at = next((i for i, v in enumerate(rest) if v.playlist_item_id == target), len(rest))
+        desired = rest[:at] + dragged + rest[at:]
+        self._start_reorder([it.playlist_item_id for it in desired], "Drag and drop")
+
+    def _start_reorder(self, desired_ids: List[str], label: str) -> None:
+        client = self.youtube_client
+        playlist_id = self.playlist.id
+
+        def on_planned(plan) -> None:
+            current, moves = plan
+            if not moves:
+                messagebox.showinfo("Reorder", "The playlist is already in that order.", parent=self)
+                return
+            cost = len(moves) * QUOTA_COST["playlistItems.update"]
+            remaining = client.ledger.remaining()
+            message = (
+                f"{label}: {len(moves):,} of {len(current):,} videos need to move, "
+                f"the other {len(current) - len(moves):,} stay where they are.\n\n"
+                f"This costs about {cost:,} quota units ({QUOTA_COST['playlistItems.update']} per "
+                f"moved video); about {remaining:,} are left today."
+            )
+            if cost > remaining:
+                message += (
+                    "\n\nThat is more than is left: the moves stop when the quota runs out, and "
+                    "running the same reorder again after the daily reset finishes it."
+                )
+            if messagebox.askyesno("Reorder playlist", message + "\n\nReorder now?", parent=self):
+                self._run_reorder(current, moves)
+
+        self.tasks.submit(
+            lambda task: client.plan_reorder(playlist_id, desired_ids),
+            name="Planning reorder",
+            on_done=on_planned,
+            on_error=lambda e: messagebox.showerror("Error", f"Reorder failed:\n\n{e}", parent=self),
+            busy=self._write_buttons(),
+        )
+
+    def _run_reorder(self, current: List[PlaylistItem], moves: list) -> None:
+        client = self.youtube_client
+        playlist_id = self.playlist.id
+
+        def work(task):
+            return client.reorder_playlist_items(
+                playlist_id,
+                moves,
+                progress=lambda done, total: task.report(done, total, f"Moved {done}/{total}..."),
+                should_stop=lambda: task.cancelled,
+            )
+
+        def on_done(results: List[Dict[str, Any]]) -> None:
+            # replay the moves that went through on the order plan_reorder listed
+            order = [it.playlist_item_id for it in current]
+            for (item, position), res in zip(moves, results):
+                if res["ok"]:
+                    apply_move(order, item.playlist_item_id, position)
+            by_id = {it.playlist_item_id: it for it in current}
+            self.videos = [by_id[key] for key in order]
+            self._renumber_from(0)
+            self._refresh_videos_tree()
+            self._after_local_write()
+
+            failed = [res for res in results if not res["ok"]]
+            if failed:
+                messagebox.showerror(
+                    "Reorder stopped",
+                    f"Moved {len(results) - 1:,} of {len(moves):,} videos, then:\n\n{failed[0]['error']}\n\n"
+                    "Running the same reorder again continues from here.",
+                    parent=self,
+                )
+
+        self.tasks.submit(
+            work,
+            name="Reordering playlist",
+            on_done=on_done,
+            on_error=lambda e: messagebox.showerror("Error", f"Reorder failed:\n\n{e}", parent=self),
+            # some moves may have happened, show what YouTube has now
+            on_cancel=self._load_playlist_items,
+            busy=self._write_buttons(),
+        )
+
+    # ------------------------------------------------------------------
+    # Sync (mirror another playlist into this one)
+    # ------------------------------------------------------------------
+
+    def on_sync_clicked(self) -> None:
+        choice = self.sync_source_var.get()
+        if not choice:
+            messagebox.showwarning("No source", "Choose the playlist to mirror first.", parent=self)
+            return
+        # "Title (PLxxxx)" like the Copy to list
+        source_id = choice.rsplit("(", 1)[-1].rstrip(")")
+        source_title = choice.rsplit(" (", 1)[0]
+        client = self.youtube_client
+        playlist_id = self.playlist.id
+
+        def on_planned(plan: Dict[str, Any]) -> None:
+            if not plan["units"]:
+                messagebox.showinfo("Sync", f"Already in sync with '{source_title}'.", parent=self)
+                return
+            remaining = client.ledger.remaining()
+            message = (
+                f"Make this playlist a copy of '{source_title}':\n\n"
+                f"  remove {len(plan['delete']):,} video(s) it doesn't have\n"
+                f"  add {len(plan['insert']):,} video(s) missing here\n"
+                f"  move about {plan['moves']:,} video(s) into its order\n\n"
+                f"About {plan['units']:,} quota units; about {remaining:,} are left today."
+            )
+            if plan["units"] > remaining:
+                message += (
+                    "\n\nThat is more than is left: it stops when the quota runs out, and "
+                    "syncing again after the daily reset does the rest."
+                )
+            if messagebox.askyesno("Sync playlist", message + "\n\nSync now?", parent=self):
+                self._run_sync(plan)
+
+        self.tasks.submit(
+            lambda task: plan_sync(client, source_id, playlist_id),
+            name="Comparing playlists",
+            on_done=on_planned,
+            on_error=lambda e: messagebox.showerror("Error", f"Sync failed:\n\n{e}", parent=self),
+            busy=self._write_buttons(),
+        )
+
+    def _run_sync(self, plan: Dict[str, Any]) -> None:
+        client = self.youtube_client
+        verbs = {"delete": "Removed", "insert": "Added", "move": "Moved"}
+
+        def work(task):
+            return run_sync(
+                client,
+                plan,
+                progress=lambda step, done, total: task.report(
+                    done, total, f"{verbs[step]} {done}/{total}..."
+                ),
+                should_stop=lambda: task.cancelled,
+            )
+
+        def on_done(summary: Dict[str, Any]) -> None:
+            # inserts, deletes and moves all over the place: just load what YouTube has now
+            self._write_generation += 1
+            self._load_playlist_items()
+            if summary["failed"] or summary["stopped"]:
+                errors = [res["error"] for res in summary["results"] if not res["ok"]]
+                messagebox.showwarning(
+                    "Sync incomplete",
+                    f"Removed {summary['deleted']:,}, added {summary['inserted']:,}, "
+                    f"moved {summary['moved']:,}; {summary['failed']:,} failed."
+                    + (f"\n\nFirst error:\n{errors[0]}" if errors else "")
+                    + "\n\nSyncing again does only what is left.",
+                    parent=self,
+                )
+
+        self.tasks.submit(
+            work,
+            name="Syncing playlist",
+            on_done=on_done,
+            on_error=lambda e: messagebox.showerror("Error", f"Sync failed:\n\n{e}", parent=self),
+            on_cancel=self._load_playlist_items,
+            busy=self._write_buttons(),
+        )
 
     # ------------------------------------------------------------------
     # Event handlers - search side
@@ -311,6 +1172,25 @@ class PlaylistWindow(tk.Toplevel):
             messagebox.showwarning("Empty search", "Enter a search query first.")
             return
 
+        if self.search_mode_var.get() == "library":
+            self._search_library(query)
+            return
+
+        client = self.youtube_client
+
+        # cache hit: instant and free, no need to scare anyone with the quota warning
+        if not self.force_refresh_var.get():
+            cached = client.cached_search(query)
+            if cached is not None:
+                self.search_results = cached["results"]
+                self._refresh_search_tree()
+                minutes = int((time.time() - cached["fetched_at"]) // 60)
+                self.search_source_var.set(
+                    f"From cache (fetched {minutes} min ago, 0 units). "
+                    "Tick 'Force refresh' to search again."
+                )
+                return
+
         # Quota warning: search.list costs about 100 units per call
         proceed = messagebox.askyesno(
             "Quota Warning",
@@ -322,20 +1202,68 @@ class PlaylistWindow(tk.Toplevel):
         if not proceed:
             return
 
-        try:
-            self.search_results = self.youtube_client.search_videos(query)
+        def on_done(results: List[SearchResult]) -> None:
+            self.search_results = results
             self._refresh_search_tree()
-        except Exception as e:
-            messagebox.showerror("Error", f"Search failed:\n\n{e}")
+            self.search_source_var.set("Fresh results from YouTube (about 100 units).")
+
+        self.tasks.submit(
+            lambda task: client.search_videos(query, force_refresh=True),
+            name="Searching YouTube",
+            on_done=on_done,
+            on_error=lambda e: messagebox.showerror("Error", f"Search failed:\n\n{e}", parent=self),
+            busy=(self.search_button,),
+        )
+
+    def _search_library(self, query: str) -> None:
+        """Ranked title matches from the local index (milliseconds, 0 units)."""
+        library = self.youtube_client.library
+        if not library:
+            messagebox.showinfo("Library search", "The local library index is disabled.", parent=self)
+            return
+
+        start = time.perf_counter()
+        hits = library.search(query)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        titles = {pl.id: pl.title or "(no title)" for pl in self.all_playlists}
+        self.search_results = []
+        self.search_tree.heading("channel", text="In playlists")
+        for row in self.search_tree.get_children():
+            self.search_tree.delete(row)
+        for idx, hit in enumerate(hits):
+            where = ", ".join(
+                titles.get(playlist_id, playlist_id)
+                + (f" (x{len(item_ids)})" if len(item_ids) > 1 else "")
+                for playlist_id, item_ids in hit["locations"].items()
+            )
+            self.search_tree.insert(
+                "",
+                "end",
+                iid=f"lib_{idx}_{hit['video_id']}",
+                values=(hit["title"] or "(no title)", hit["video_id"], where),
+            )
+
+        indexed = library.indexed_playlists()
+        missing = sum(1 for pl in self.all_playlists if pl.id not in indexed)
+        note = f"{len(hits)} videos in your library ({elapsed_ms:.0f} ms, 0 units)."
+        if missing:
+            # playlists only get indexed once listed completely (opened, or scanned on the Duplicates tab)
+            note += (
+                f" {missing} of {len(self.all_playlists)} playlists not indexed yet - "
+                "scan the library on the Duplicates tab to include them."
+            )
+        self.search_source_var.set(note)
 
     def _refresh_search_tree(self) -> None:
+        self.search_tree.heading("channel", text="Channel")
         for row in self.search_tree.get_children():
             self.search_tree.delete(row)
 
         for idx, item in enumerate(self.search_results):
-            video_id = item["video_id"]
-            title = item.get("title") or "(no title)"
-            channel = item.get("channel_title") or ""
+            video_id = item.video_id
+            title = item.title or "(no title)"
+            channel = item.channel_title or ""
             iid = f"sr_{idx}_{video_id}"
             self.search_tree.insert(
                 "",
@@ -354,9 +1282,27 @@ class PlaylistWindow(tk.Toplevel):
         node = self.search_tree.item(item_id)
         _, video_id, _ = node["values"]
 
-        try:
-            self.youtube_client.insert_playlist_item(self.playlist["id"], video_id)
-            self._load_playlist_items()
-            messagebox.showinfo("Added", "Video added to playlist.")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to add video:\n\n{e}")
+        # self.videos is the whole playlist (once loaded), so this check is free
+        if any(v.video_id == video_id for v in self.videos) and not messagebox.askyesno(
+            "Already in playlist",
+            "This video is already in the playlist.\n\n"
+            f"Add it again anyway? ({QUOTA_COST['playlistItems.insert']} quota units)",
+            parent=self,
+        ):
+            return
+
+        playlist_id = self.playlist.id
+        client = self.youtube_client
+
+        def on_done(item: PlaylistItem) -> None:
+            self._apply_inserted(item)
+            self._after_local_write()
+            messagebox.showinfo("Added", "Video added to playlist.", parent=self)
+
+        self.tasks.submit(
+            lambda task: client.insert_playlist_item(playlist_id, video_id),
+            name="Adding video",
+            on_done=on_done,
+            on_error=lambda e: messagebox.showerror("Error", f"Failed to add video:\n\n{e}", parent=self),
+            busy=self._write_buttons(),
+        )
@@ -0,0 +1,85 @@
+# ui/status_bar.py
+# dependencies
+import tkinter as tk
+from tkinter import ttk
+from typing import Optional
+
+
+class TaskStatusBar(ttk.Frame):
+    """
+    Small status strip for background tasks:
+      - message of the most recent running task
+      - progress bar (determinate when the task reports a total)
+      - Cancel button that cancels everything running in the attached TaskRunner
+    """
+
+    def __init__(self, master: tk.Misc, idle_text: str = "Ready.", **kwargs):
+        super().__init__(master, **kwargs)
+
+        self.idle_text = idle_text
+        self._runner = None
+        self._tasks: list = []  # running tasks, most recent last
+
+        self.message_var = tk.StringVar(value=idle_text)
+
+        message_label = ttk.Label(self, textvariable=self.message_var)
+        message_label.pack(side="left", fill="x", expand=True)
+
+        self.cancel_button = ttk.Button(
+            self, text="Cancel", command=self.on_cancel_clicked, state="disabled"
+        )
+        self.cancel_button.pack(side="right")
+
+        self.progress = ttk.Progressbar(self, mode="determinate", length=240)
+        self.progress.pack(side="right", padx=(8, 8))
+
+    # ------------------------------------------------------------------
+    # Hooks called by TaskRunner (always on the Tk thread)
+    # ------------------------------------------------------------------
+
+    def task_started(self, runner, task) -> None:
+        self._runner = runner
+        self._tasks.append(task)
+        self.cancel_button.config(state="normal")
+        self.message_var.set(f"{task.name}..." if task.name else "Working...")
+        self._set_progress(0, None)
+
+    def task_progress(self, runner, task, done: int, total: Optional[int], message: str) -> None:
+        # only the latest task gets to drive the bar
+        if not self._tasks or task is not self._tasks[-1]:
+            return
+        if message:
+            self.message_var.set(message)
+        self._set_progress(done, total)
+
+    def task_finished(self, runner, task) -> None:
+        if task in self._tasks:
+            self._tasks.remove(task)
+        if self._tasks:
+            latest = self._tasks[-1]
+            self.message_var.set(f"{latest.name}..." if latest.name else "Working...")
+            return
+
+        self.progress.stop()
+        self.progress.config(mode="determinate", value=0)
+        self.cancel_button.config(state="disabled")
+        self.message_var.set("Cancelled." if task.cancelled else self.idle_text)
+
+    # ------------------------------------------------------------------
+    # Helpers / event handlers
+    # ------------------------------------------------------------------
+
+    def _set_progress(self, done: int, total: Optional[int]) -> None:
+        if total:
+            self.progress.stop()
+            self.progress.config(mode="determinate", maximum=total, value=min(done, total))
+        else:
+            # unknown total (e.g. paging through a playlist): just show activity
+            if str(self.progress.cget("mode")) != "indeterminate":
+                self.progress.config(mode="indeterminate")
+                self.progress.start(15)
+
+    def on_cancel_clicked(self) -> None:
+        if self._runner is not None:
+            self._runner.cancel_all()
+        self.message_var.set("Cancelling...")
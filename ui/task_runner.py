@@ -0,0 +1,264 @@
+# ui/task_runner.py
+# dependencies
+import queue
+import sys
+import threading
+import traceback
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Optional
+
+# how often the Tk thread checks for finished background work
+POLL_INTERVAL_MS = 50
+# a handful of workers is plenty, YouTube throttles us long before this matters
+MAX_WORKERS = 4
+
+
+class TaskCancelled(Exception):
+    """Raised inside a worker (via Task.check_cancelled) once its task was cancelled."""
+
+
+class Task:
+    """
+    Handle for one piece of background work.
+
+    The worker function receives this object and can use it to:
+      - report(done, total, message) progress back to the UI
+      - call_soon(fn, *args) to run something on the Tk thread (e.g. render a page)
+      - check_cancelled() between API calls so Cancel actually stops the loop
+    """
+
+    def __init__(self, runner: "TaskRunner", name: str) -> None:
+        self.name = name
+        self.future = None
+        self._runner = runner
+        self._cancel_event = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def cancel(self) -> None:
+        self._cancel_event.set()
+        # if it never started, the worker won't post anything, so we do it here
+        if self.future is not None and self.future.cancel():
+            self._runner._post(self, "cancelled", None)
+
+    def check_cancelled(self) -> None:
+        if self.cancelled:
+            raise TaskCancelled(self.name)
+
+    def report(self, done: int, total: Optional[int] = None, message: str = "") -> None:
+        self._runner._post(self, "progress", (done, total, message))
+
+    def call_soon(self, fn: Callable[..., Any], *args: Any) -> None:
+        self._runner._post(self, "call", (fn, args))
+
+
+class TaskRunner:
+    """
+    Runs blocking work (YouTubeClient calls) on a small thread pool and hands the
+    results back to the Tk main thread by polling a queue with after().
+
+    Tk is not thread-safe, so workers never touch widgets; every callback given to
+    submit() (on_done / on_error / on_progress / call_soon) runs on the Tk thread.
+    """
+
+    def __init__(
+        self,
+        widget: tk.Misc,
+        status_bar: Any = None,
+        max_workers: int = MAX_WORKERS,
+        poll_ms: int = POLL_INTERVAL_MS,
+    ) -> None:
+        self.widget = widget
+        self.status_bar = status_bar  # optional, see ui/status_bar.py
+        self.poll_ms = poll_ms
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="yt-worker"
+        )
+        self._messages: "queue.Queue[tuple]" = queue.Queue()
+        self._active: dict = {}  # Task -> callbacks
+        self._busy_counts: dict = {}  # widget -> (count, was_disabled)
+        self._poll_job = None
+        self._closed = False
+
+        # stop everything when the owning window goes away
+        widget.bind("<Destroy>", self._on_widget_destroyed, add="+")
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def submit(
+        self,
+        fn: Callable[[Task], Any],
+        name: str = "",
+        on_done: Optional[Callable[[Any], None]] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+        on_progress: Optional[Callable[[int, Optional[int], str], None]] = None,
+        on_cancel: Optional[Callable[[], None]] = None,
+        busy: Iterable[tk.Misc] = (),
+    ) -> Task:
+        """
+        Run fn(task) on a worker thread.
+        Widgets in `busy` are disabled until the task finishes (however it finishes).
+        """
+        if self._closed:
+            raise RuntimeError("TaskRunner is shut down.")
+
+        task = Task(self, name)
+        self._active[task] = {
+            "on_done": on_done,
+            "on_error": on_error,
+            "on_progress": on_progress,
+            "on_cancel": on_cancel,
+            "busy": tuple(busy),
+        }
+        self._set_busy(self._active[task]["busy"])
+        if self.status_bar is not None:
+            self.status_bar.task_started(self, task)
+
+        task.future = self._executor.submit(self._run, task, fn)
+        self._schedule_poll()
+        return task
+
+    def is_busy(self) -> bool:
+        return bool(self._active)
+
+    def active_tasks(self) -> list:
+        return list(self._active)
+
+    def cancel_all(self) -> None:
+        for task in list(self._active):
+            task.cancel()
+
+    def shutdown(self) -> None:
+        """Cancel outstanding work and stop polling; results are dropped."""
+        if self._closed:
+            return
+        self._closed = True
+        self.cancel_all()
+        self._active.clear()
+        if self._poll_job is not None:
+            try:
+                self.widget.after_cancel(self._poll_job)
+            except tk.TclError:
+                pass
+            self._poll_job = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # ------------------------------------------------------------------
+    # Worker side
+    # ------------------------------------------------------------------
+
+    def _post(self, task: Task, kind: str, payload: Any) -> None:
+        self._messages.put((task, kind, payload))
+
+    def _run(self, task: Task, fn: Callable[[Task], Any]) -> None:
+        if task.cancelled:
+            self._post(task, "cancelled", None)
+            return
+        try:
+            result = fn(task)
+        except TaskCancelled:
+            self._post(task, "cancelled", None)
+        except Exception as e:
+            # a cancelled task that blew up is still just cancelled
+            self._post(task, "cancelled" if task.cancelled else "error", e)
+        else:
+            self._post(task, "cancelled" if task.cancelled else "done", result)
+
+    # ------------------------------------------------------------------
+    # Tk side
+    # ------------------------------------------------------------------
+
+    def _schedule_poll(self) -> None:
+        if self._poll_job is None and not self._closed:
+            self._poll_job = self.widget.after(self.poll_ms, self._poll)
+
+    def _poll(self) -> None:
+        self._poll_job = None
+        if self._closed:
+            return
+
+        while True:
+            try:
+                task, kind, payload = self._messages.get_nowait()
+            except queue.Empty:
+                break
+            callbacks = self._active.get(task)
+            if callbacks is None:
+                continue  # already finished (e.g. cancelled before start)
+
+            if kind == "progress":
+                if not task.cancelled:
+                    if self.status_bar is not None:
+                        self._safely(self.status_bar.task_progress, self, task, *payload)
+                    if callbacks["on_progress"]:
+                        self._safely(callbacks["on_progress"], *payload)
+            elif kind == "call":
+                if not task.cancelled:
+                    fn, args = payload
+                    self._safely(fn, *args)
+            else:
+                self._finish(task, callbacks, kind, payload)
+
+            if self._closed:
+                return  # a callback closed the window
+
+        if self._active:
+            self._schedule_poll()
+
+    def _finish(self, task: Task, callbacks: dict, kind: str, payload: Any) -> None:
+        del self._active[task]
+        # release widgets before the callbacks run, so callbacks can set their own state
+        self._release_busy(callbacks["busy"])
+        if self.status_bar is not None:
+            self._safely(self.status_bar.task_finished, self, task)
+
+        if kind == "done" and callbacks["on_done"]:
+            self._safely(callbacks["on_done"], payload)
+        elif kind == "error" and callbacks["on_error"]:
+            self._safely(callbacks["on_error"], payload)
+        elif kind == "cancelled" and callbacks["on_cancel"]:
+            self._safely(callbacks["on_cancel"])
+
+    def _safely(self, fn: Callable[..., Any], *args: Any) -> None:
+        # one broken callback must not kill the poll loop: the tasks behind it would
+        # never finish and their busy buttons would stay disabled for good
+        try:
+            fn(*args)
+        except Exception:
+            report = getattr(self.widget, "report_callback_exception", None)
+            if report is not None:
+                report(*sys.exc_info())  # Tk's usual "Exception in Tkinter callback"
+            else:
+                traceback.print_exc()
+
+    def _set_busy(self, widgets: tuple) -> None:
+        for w in widgets:
+            count, was_disabled = self._busy_counts.get(w, (0, False))
+            if count == 0:
+                was_disabled = w.instate(["disabled"])
+                w.state(["disabled"])
+            self._busy_counts[w] = (count + 1, was_disabled)
+
+    def _release_busy(self, widgets: tuple) -> None:
+        for w in widgets:
+            count, was_disabled = self._busy_counts.get(w, (1, False))
+            if count <= 1:
+                self._busy_counts.pop(w, None)
+                if not was_disabled:
+                    try:
+                        w.state(["!disabled"])
+                    except tk.TclError:
+                        pass  # widget destroyed meanwhile
+            else:
+                self._busy_counts[w] = (count - 1, was_disabled)
+
+    def _on_widget_destroyed(self, event: tk.Event) -> None:
+        # <Destroy> bubbles up from children too; only react to the owner itself
+        if event.widget is self.widget:
+            self.shutdown()
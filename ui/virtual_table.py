@@ -0,0 +1,487 @@
+# ui/virtual_table.py
+# dependencies
+import tkinter as tk
+from tkinter import ttk
+from typing import Any, Callable, Iterable, Optional, Sequence
+
+# extra rows materialized below the viewport (covers a half-visible last row + small resizes)
+ROW_BUFFER = 5
+# fallback until the first row is drawn and we can measure the real one
+DEFAULT_ROW_HEIGHT = 20
+WHEEL_ROWS = 3
+SORT_ARROWS = {False: " \u25b2", True: " \u25bc"}
+
+
+class SortText(str):
+    """Cell text that sorts by `key` instead of alphabetically ("1:02:03" by seconds)."""
+
+    def __new__(cls, text: str, key: Any) -> "SortText":
+        self = super().__new__(cls, text)
+        self.key = key
+        return self
+
+
+def _sort_key(value: Any) -> tuple:
+    # numbers before text, so a column of ints with a few blanks ("") still sorts
+    if type(value) is str:
+        return (1, value.casefold())
+    if isinstance(value, SortText):
+        return (0, value.key)
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return (0, value)
+    return (1, str(value).casefold())
+
+
+class RowView:
+    """
+    The filtered and sorted view over a VirtualTable's backing rows (no Tk in here).
+
+    Rows are indexed on first use and only as far as needed: the case-folded text of
+    their string columns once something is typed into the filter, the sort keys of
+    a column once it is sorted. After that a keystroke is a substring test per row
+    and a sort is a single list.sort (cached per column and direction). Typing more
+    characters only re-tests the rows that matched before.
+
+    With no filter and no sort, `rows` is the backing sequence itself (no copy).
+    The index follows appends to the backing sequence (update()); any other change
+    needs set_source() again.
+    """
+
+    def __init__(self, columns: Sequence[str], values: Callable[[Any], tuple]) -> None:
+        self.columns = tuple(columns)
+        self.values = values
+        self.source: Sequence[Any] = []
+        self.rows: Sequence[Any] = []
+        self.filter_text = ""  # case-folded, as typed
+        self.sort_column: Optional[str] = None
+        self.descending = False
+        self._reset_index()
+
+    def _reset_index(self) -> None:
+        self._values: list = []  # per source row: values(row)
+        self._texts: list = []  # per source row: searchable text
+        self._keys: dict = {}  # column -> per source row sort key
+        self._orders: dict = {}  # (column, descending) -> source indexes in that order
+        self._matches: Optional[list] = None  # source indexes shown under the current filter
+
+    @property
+    def active(self) -> bool:
+        return bool(self.filter_text.strip()) or self.sort_column is not None
+
+    def set_source(self, source: Sequence[Any]) -> None:
+        self.source = source
+        self._reset_index()
+        self._compute()
+
+    def update(self) -> None:
+        """The backing sequence changed in place (e.g. a page was appended)."""
+        if len(self._values) > len(self.source):
+            self._reset_index()
+        self._orders = {}
+        self._compute()
+
+    def set_filter(self, text: str) -> None:
+        text = text.casefold()
+        # every row matching the longer query also matched the shorter one
+        narrow = bool(self.filter_text.strip()) and text.startswith(self.filter_text)
+        self.filter_text = text
+        self._compute(narrow=narrow)
+
+    def sort_by(self, column: Optional[str], descending: bool = False) -> None:
+        """column=None restores the backing order."""
+        self.sort_column = column
+        self.descending = descending
+        self._compute()
+
+    def _texts_for_all(self) -> list:
+        texts = self._texts
+        for values in self._values[len(texts):]:
+            texts.append("\n".join([v for v in values if type(v) is str]).casefold())
+        return texts
+
+    def _keys_for(self, column: str) -> list:
+        keys = self._keys.setdefault(column, [])
+        index = self.columns.index(column)
+        keys.extend(_sort_key(values[index]) for values in self._values[len(keys):])
+        return keys
+
+    def _order(self) -> Sequence[int]:
+        if self.sort_column is None:
+            return range(len(self.source))
+        cache_key = (self.sort_column, self.descending)
+        order = self._orders.get(cache_key)
+        if order is None:
+            keys = self._keys_for(self.sort_column)
+            # stable, so equal keys keep the backing (playlist) order either way
+            order = sorted(range(len(keys)), key=keys.__getitem__, reverse=self.descending)
+            self._orders[cache_key] = order
+        return order
+
+    def _compute(self, narrow: bool = False) -> None:
+        if not self.active:
+            self.rows = self.source
+            self._matches = None
+            return
+
+        values = self.values
+        self._values.extend(values(row) for row in self.source[len(self._values):])
+        words = self.filter_text.split()
+        if words:
+            texts = self._texts_for_all()
+            candidates = self._matches if narrow and self._matches is not None else self._order()
+            if len(words) == 1:
+                word = words[0]
+                matches = [i for i in candidates if word in texts[i]]
+            else:
+                matches = [i for i in candidates if all(w in texts[i] for w in words)]
+            self._matches = matches
+        else:
+            matches = self._order()
+            self._matches = None
+        source = self.source
+        self.rows = [source[i] for i in matches]
+
+
+class VirtualTable(ttk.Frame):
+    """
+    Treeview-looking table that only materializes the rows in the viewport.
+
+    The Treeview inside holds a fixed set of "slot" rows (visible rows + ROW_BUFFER)
+    whose values get rewritten when you scroll, so rendering costs the same for 100 or
+    100,000 backing rows. The data lives in `rows` (any sequence, e.g. PlaylistWindow.videos);
+    `key(row)` gives the stable id used for selection, `values(row)` the column values.
+
+    Selection is tracked by key (not by Treeview item), supports extended selection
+    with Shift/Ctrl, and keyboard navigation (arrows, PageUp/PageDown, Home/End, Ctrl+A).
+    Fires <<VirtualTableSelect>> when the selection changes.
+
+    set_filter() / sort_by() show a filtered, sorted view of the data (see RowView);
+    with sortable=True clicking a heading cycles ascending / descending / unsorted.
+    `rows` is always what is shown, `view.source` everything.
+
+    With on_drop set, the selected rows can be dragged: on_drop(keys, index) gets
+    the selected keys and the index (in `rows`) of the row they were dropped on,
+    len(rows) below the last one. The table itself doesn't move anything.
+    """
+
+    def __init__(
+        self,
+        master: tk.Misc,
+        columns: Sequence[str],
+        key: Callable[[Any], str],
+        values: Callable[[Any], tuple],
+        selectmode: str = "extended",
+        sortable: bool = False,
+        on_drop: Optional[Callable[[tuple, int], None]] = None,
+        **kwargs,
+    ):
+        super().__init__(master, **kwargs)
+
+        self.key = key
+        self.values = values
+        self.selectmode = selectmode
+        self.sortable = sortable
+        self.on_drop = on_drop
+        self._press_index: Optional[int] = None  # row the mouse went down on (drag start)
+        self._pending_click: Optional[int] = None  # click on a selected row, applied on release
+        self._dragging = False
+
+        self.view = RowView(columns, values)
+        self._heading_text: dict = {}
+        self.offset = 0  # index of the first visible row
+        self._visible = 1  # rows that fit in the viewport
+        self._row_height = DEFAULT_ROW_HEIGHT
+        self._header_height = DEFAULT_ROW_HEIGHT
+        self._measured = False
+
+        self._selected: set = set()
+        self._anchor: Optional[int] = None  # start of a Shift range
+        self._cursor: Optional[int] = None  # keyboard focus row
+
+        self.tree = ttk.Treeview(
+            self, columns=tuple(columns), show="headings", selectmode="none", height=1
+        )
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+        self.tree.pack(side="left", fill="both", expand=True)
+
+        style = ttk.Style(self)
+        self.tree.tag_configure(
+            "selected",
+            background=style.lookup("Treeview", "background", ["selected"]) or "#4a6984",
+            foreground=style.lookup("Treeview", "foreground", ["selected"]) or "#ffffff",
+        )
+
+        self.tree.bind("<Configure>", self._on_configure)
+        self.tree.bind("<Button-1>", self._on_click)
+        self.tree.bind("<B1-Motion>", self._on_drag)
+        self.tree.bind("<ButtonRelease-1>", self._on_release)
+        self.tree.bind("<MouseWheel>", self._on_mousewheel)
+        self.tree.bind("<Button-4>", lambda e: self._scroll_by(-WHEEL_ROWS))
+        self.tree.bind("<Button-5>", lambda e: self._scroll_by(WHEEL_ROWS))
+        for keysym, delta in (("Up", -1), ("Down", 1)):
+            self.tree.bind(f"<{keysym}>", lambda e, d=delta: self._move_cursor(d, False))
+            self.tree.bind(f"<Shift-{keysym}>", lambda e, d=delta: self._move_cursor(d, True))
+        for keysym, pages in (("Prior", -1), ("Next", 1)):
+            self.tree.bind(f"<{keysym}>", lambda e, p=pages: self._move_cursor(p * self._visible, False))
+            self.tree.bind(f"<Shift-{keysym}>", lambda e, p=pages: self._move_cursor(p * self._visible, True))
+        self.tree.bind("<Home>", lambda e: self._move_cursor(-len(self.rows), False))
+        self.tree.bind("<End>", lambda e: self._move_cursor(len(self.rows), False))
+        self.tree.bind("<Control-a>", self._on_select_all)
+
+    # ------------------------------------------------------------------
+    # Treeview-ish public API
+    # ------------------------------------------------------------------
+
+    @property
+    def rows(self) -> Sequence[Any]:
+        return self.view.rows
+
+    def heading(self, column: str, **kwargs) -> Any:
+        if "text" in kwargs:
+            self._heading_text[column] = kwargs["text"]
+            if column == self.view.sort_column:
+                kwargs["text"] += SORT_ARROWS[self.view.descending]
+        if kwargs and self.sortable and "command" not in kwargs:
+            kwargs["command"] = lambda c=column: self._on_heading_click(c)
+        return self.tree.heading(column, **kwargs)
+
+    def column(self, column: str, **kwargs) -> Any:
+        return self.tree.column(column, **kwargs)
+
+    def set_rows(self, rows: Sequence[Any]) -> None:
+        """Point the table at a (new or mutated) backing sequence and redraw the viewport."""
+        self.view.set_source(rows)
+        self._view_changed()
+
+    def refresh(self) -> None:
+        """Redraw the visible rows (after appending to the backing sequence or editing rows in place)."""
+        if self.view.active:
+            self.view.update()
+            self._view_changed()
+        else:
+            self._render()
+
+    def set_filter(self, text: str) -> None:
+        """Only show rows whose text columns contain every word of `text` (case-insensitive)."""
+        self.view.set_filter(text)
+        self.offset = 0
+        self._view_changed()
+
+    def sort_by(self, column: Optional[str], descending: bool = False) -> None:
+        """Sort the shown rows by a column (None = backing order)."""
+        self.view.sort_by(column, descending)
+        # row indexes mean something else now
+        self._anchor = self._cursor = None
+        self.offset = 0
+        for name, text in self._heading_text.items():
+            self.heading(name, text=text)
+        self._view_changed()
+
+    def _view_changed(self) -> None:
+        rows = self.rows
+        if self._selected:
+            # forget selected keys that are no longer shown (deleted or filtered out)
+            present = {self.key(r) for r in rows}
+            self._selected &= present
+        if self._cursor is not None and self._cursor >= len(rows):
+            self._cursor = len(rows) - 1 if rows else None
+        self._render()
+
+    def selection(self) -> tuple:
+        """Selected keys, in data order (like Treeview.selection() returning iids)."""
+        if not self._selected:
+            return ()
+        return tuple(k for k in map(self.key, self.rows) if k in self._selected)
+
+    def selection_set(self, keys: Iterable[str]) -> None:
+        self._selected = set(keys)
+        self._render()
+        self.event_generate("<<VirtualTableSelect>>")
+
+    def see(self, key: str) -> None:
+        """Scroll so the row with this key is visible."""
+        for index, row in enumerate(self.rows):
+            if self.key(row) == key:
+                self._see_index(index)
+                self._render()
+                return
+
+    def index_at(self, y: int) -> Optional[int]:
+        """Data index of the row under pixel y (widget coordinates), or None."""
+        slot = self.tree.identify_row(y)
+        if not slot:
+            return None
+        index = self.offset + int(slot[len("slot"):])
+        return index if index < len(self.rows) else None
+
+    # ------------------------------------------------------------------
+    # Rendering
+    # ------------------------------------------------------------------
+
+    def _render(self) -> None:
+        if not self._measured and self._measure_rows():
+            # first real measurement, the default guess may have been off
+            self._visible = self._fit_rows(self.tree.winfo_height())
+
+        total = len(self.rows)
+        self.offset = max(0, min(self.offset, total - self._visible))
+
+        wanted = min(self._visible + ROW_BUFFER, total - self.offset)
+        have = len(self.tree.get_children())
+        for slot in range(have, wanted):
+            self.tree.insert("", "end", iid=f"slot{slot}")
+        for slot in range(wanted, have):
+            self.tree.delete(f"slot{slot}")
+
+        for slot in range(wanted):
+            row = self.rows[self.offset + slot]
+            tags = ("selected",) if self.key(row) in self._selected else ()
+            self.tree.item(f"slot{slot}", values=self.values(row), tags=tags)
+
+        if total:
+            first = self.offset / total
+            last = min(1.0, (self.offset + self._visible) / total)
+        else:
+            first, last = 0.0, 1.0
+        self.scrollbar.set(first, last)
+
+    def _measure_rows(self) -> bool:
+        bbox = self.tree.bbox("slot0") if self.tree.exists("slot0") else None
+        if not bbox:
+            return False  # not drawn yet
+        _, y, _, height = bbox
+        self._header_height = y
+        self._row_height = max(1, height)
+        self._measured = True
+        return True
+
+    def _fit_rows(self, height_px: int) -> int:
+        return max(1, (height_px - self._header_height) // self._row_height)
+
+    def _scroll_by(self, rows: int) -> str:
+        self.offset += rows
+        self._render()
+        return "break"
+
+    def _see_index(self, index: int) -> None:
+        if index < self.offset:
+            self.offset = index
+        elif index >= self.offset + self._visible:
+            self.offset = index - self._visible + 1
+
+    # ------------------------------------------------------------------
+    # Event handlers
+    # ------------------------------------------------------------------
+
+    def _on_configure(self, event: tk.Event) -> None:
+        self._measure_rows()
+        visible = self._fit_rows(event.height)
+        if visible != self._visible:
+            self._visible = visible
+            self._render()
+
+    def _on_heading_click(self, column: str) -> None:
+        view = self.view
+        if view.sort_column != column:
+            self.sort_by(column)
+        elif not view.descending:
+            self.sort_by(column, descending=True)
+        else:
+            self.sort_by(None)
+
+    def _on_scrollbar(self, action: str, *args: str) -> None:
+        if action == "moveto":
+            self.offset = int(float(args[0]) * len(self.rows))
+        elif action == "scroll":
+            amount, unit = int(args[0]), args[1]
+            self.offset += amount * (self._visible if unit == "pages" else 1)
+        self._render()
+
+    def _on_mousewheel(self, event: tk.Event) -> str:
+        # Windows reports multiples of 120, macOS small deltas; only the sign matters here
+        direction = -1 if event.delta > 0 else 1
+        return self._scroll_by(direction * WHEEL_ROWS)
+
+    def _on_click(self, event: tk.Event) -> Optional[str]:
+        # let headings / column separators behave like a normal Treeview
+        if self.tree.identify_region(event.x, event.y) not in ("cell", "tree"):
+            return None
+
+        self.tree.focus_set()
+        index = self.index_at(event.y)
+        self._press_index = index
+        self._pending_click = None
+        if index is not None:
+            shift = bool(event.state & 0x0001)
+            ctrl = bool(event.state & 0x0004)
+            if self.on_drop and not (shift or ctrl) and self.key(self.rows[index]) in self._selected:
+                # might be the start of dragging the whole selection, decide on release
+                self._pending_click = index
+            else:
+                self._select_index(index, extend=shift, toggle=ctrl)
+        return "break"
+
+    def _drop_index(self, y: int) -> int:
+        if y < self._header_height:
+            return self.offset
+        index = self.index_at(y)
+        return len(self.rows) if index is None else index
+
+    def _on_drag(self, event: tk.Event) -> Optional[str]:
+        if not self.on_drop or self._press_index is None or not self._selected:
+            return None
+        if not self._dragging and self._drop_index(event.y) != self._press_index:
+            self._dragging = True
+            self.tree.configure(cursor="sb_v_double_arrow")
+        if self._dragging:
+            # dragging past the top/bottom edge scrolls
+            if event.y < self._header_height:
+                self._scroll_by(-1)
+            elif event.y > self.tree.winfo_height():
+                self._scroll_by(1)
+        return "break"
+
+    def _on_release(self, event: tk.Event) -> Optional[str]:
+        pending, self._pending_click = self._pending_click, None
+        self._press_index = None
+        if self._dragging:
+            self._dragging = False
+            self.tree.configure(cursor="")
+            self.on_drop(self.selection(), self._drop_index(event.y))
+            return "break"
+        if pending is not None and pending < len(self.rows):
+            self._select_index(pending, extend=False, toggle=False)
+        return None
+
+    def _move_cursor(self, delta: int, extend: bool) -> str:
+        if not self.rows:
+            return "break"
+        start = self._cursor if self._cursor is not None else self.offset
+        index = max(0, min(len(self.rows) - 1, start + delta))
+        self._select_index(index, extend=extend, toggle=False)
+        return "break"
+
+    def _on_select_all(self, event: tk.Event) -> str:
+        if self.selectmode == "extended":
+            self.selection_set(self.key(r) for r in self.rows)
+        return "break"
+
+    def _select_index(self, index: int, extend: bool, toggle: bool) -> None:
+        key = self.key(self.rows[index])
+
+        if self.selectmode != "extended" or not (extend or toggle):
+            self._selected = {key}
+            self._anchor = index
+        elif extend:
+            anchor = self._anchor if self._anchor is not None else index
+            lo, hi = sorted((anchor, index))
+            self._selected = {self.key(r) for r in self.rows[lo:hi + 1]}
+        else:
+            self._selected ^= {key}
+            self._anchor = index
+
+        self._cursor = index
+        self._see_index(index)
+        self._render()
+        self.event_generate("<<VirtualTableSelect>>")
@@ -0,0 +1,118 @@
+# video_cache.py
+# dependencies
+import json
+import locale
+import sqlite3
+import threading
+import time
+from typing import Optional, Dict, Iterable, List
+
+from models import VideoInfo
+
+VIDEO_CACHE_FILE = "video_cache.sqlite3"
+
+# durations never change, availability rarely does; a week old is fine for the table
+# (PlaylistWindow re-checks with force_refresh before removing anything)
+VIDEO_TTL_SECONDS = 7 * 24 * 60 * 60
+
+# region-blocked videos are judged for this country (ISO 3166 code, e.g. "DE");
+# None = take it from the system locale, like YouTube guesses it from your IP
+REGION_CODE: Optional[str] = None
+
+# SQLite caps host parameters per statement (999 on older builds)
+_LOOKUP_CHUNK = 500
+
+# availability() values that mean nobody can watch the video here; "private" is
+# left out on purpose: videos.list only returns private videos to their owner
+UNAVAILABLE = ("missing", "rejected", "blocked")
+
+
+def region_code() -> Optional[str]:
+    if REGION_CODE:
+        return REGION_CODE.upper()
+    # "en_US", "de_DE", sometimes None or just "C"
+    parts = (locale.getlocale()[0] or "").replace("-", "_").split("_")
+    if len(parts) >= 2 and len(parts[1]) == 2:
+        return parts[1].upper()
+    return None
+
+
+def availability(info: VideoInfo, region: Optional[str] = None) -> str:
+    """
+    "ok", "private" (yours, only you can watch it), or one of UNAVAILABLE:
+    "missing" (deleted, or someone else's private video), "rejected" (removed
+    by YouTube, failed upload) or "blocked" (not watchable in `region`).
+    """
+    if not info.found:
+        return "missing"
+    if info.upload_status in ("rejected", "failed", "deleted"):
+        return "rejected"
+    if region:
+        if info.blocked_regions and region in info.blocked_regions:
+            return "blocked"
+        if info.allowed_regions is not None and region not in info.allowed_regions:
+            return "blocked"
+    if info.privacy_status == "private":
+        return "private"
+    return "ok"
+
+
+class VideoCache:
+    """
+    videos.list results per video id in SQLite, so a playlist's details are only
+    downloaded once per `ttl` and a video in ten playlists only once at all.
+    Entries older than `ttl` seconds are treated as missing (and purged on write).
+
+    stats: hits, misses (per video id)
+    """
+
+    def __init__(self, path: str = VIDEO_CACHE_FILE, ttl: float = VIDEO_TTL_SECONDS) -> None:
+        self.path = path
+        self.ttl = ttl
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0}
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS videos (
+                video_id TEXT PRIMARY KEY,
+                info_json TEXT NOT NULL,
+                fetched_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    def get_many(self, video_ids: Iterable[str]) -> Dict[str, VideoInfo]:
+        """{video_id: VideoInfo} for the ids cached and not expired; the others are left out."""
+        ids = list(dict.fromkeys(video_ids))
+        oldest = time.time() - self.ttl
+        found: Dict[str, VideoInfo] = {}
+        with self._lock:
+            for start in range(0, len(ids), _LOOKUP_CHUNK):
+                chunk = ids[start:start + _LOOKUP_CHUNK]
+                rows = self._conn.execute(
+                    f"SELECT video_id, info_json FROM videos "
+                    f"WHERE video_id IN ({','.join('?' * len(chunk))}) AND fetched_at >= ?",
+                    (*chunk, oldest),
+                ).fetchall()
+                for video_id, info_json in rows:
+                    found[video_id] = VideoInfo.from_dict(json.loads(info_json))
+            self.stats["hits"] += len(found)
+            self.stats["misses"] += len(ids) - len(found)
+        return found
+
+    def put_many(self, infos: List[VideoInfo]) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO videos VALUES (?, ?, ?)",
+                [(info.video_id, json.dumps(info.to_dict()), now) for info in infos],
+            )
+            self._conn.execute("DELETE FROM videos WHERE fetched_at < ?", (now - self.ttl,))
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM videos")
+            self._conn.commit()
@@ -1,11 +1,38 @@
 # youtube_client.py
 # more dependencies yay...
+import dataclasses
+import json
 import os
 import pickle
-from typing import Optional, Dict, Any, List
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
-from google.auth.transport.requests import Request
+import threading
+import time
+from typing import Optional, Dict, Any, Callable, Iterator, List, Sequence, Tuple, Union
+# only the cheap error module up here; googleapiclient.discovery, google-auth,
+# oauthlib and httplib2 take ~0.3s to import, so they load on first use
+# (sign-in, which already runs on a worker thread), not at app startup
+from googleapiclient.errors import HttpError
+
+from library_index import LIBRARY_FILE, LibraryIndex, split_new_videos
+from metrics import Metrics
+from models import Playlist, PlaylistItem, SearchResult, VideoInfo
+from reorder import plan_moves
+from quota_ledger import QuotaLedger, project_id_from_client_secrets
+from search_cache import SEARCH_CACHE_FILE, SearchCache, search_key
+from video_cache import VIDEO_CACHE_FILE, VideoCache
+from request_policy import (
+    NON_IDEMPOTENT_ENDPOINTS,
+    REQUESTS_PER_SECOND,
+    RetryPolicy,
+    TokenBucket,
+    is_in_doubt,
+    is_retryable,
+)
+from playlist_cache import (
+    CACHE_FILE,
+    MY_PLAYLISTS_KEY,
+    PlaylistCache,
+    playlist_items_key,
+)
 
 # download from Google Cloud Console its gonna have some numbers and letters behind "secret" you can change that if you want or change this to match
 CLIENT_SECRET_FILE = "client_secrets.json"
@@ -16,36 +43,195 @@ SCOPES = ["https://www.googleapis.com/auth/youtube"]
 # Quota cost (from YouTube Data API docs)
 # this is subject to change, and usually they give 10,000 units per day
 QUOTA_COST = {
+    "channels.list": 1,
     "playlists.list": 1,
+    "playlists.insert": 50,
     "playlistItems.list": 1,
     "playlistItems.insert": 50,
     "playlistItems.update": 50,
     "playlistItems.delete": 50,
     "search.list": 100,
+    "videos.list": 1,
 }
 
+# list endpoints silently cap maxResults at 50, asking for more just looks misleading
+PAGE_SIZE = 50
+
+# videos.list takes up to 50 comma separated ids per request, still 1 unit
+VIDEOS_PER_REQUEST = 50
+
+# Sub-requests per batch HTTP call. Google accepts up to 1000, but every
+# sub-request still costs its full quota, so small chunks keep progress/cancel snappy.
+BATCH_SIZE = 50
+
+# Partial responses (fields=): only download what the models.*.from_resource builders read.
+# Without these every playlist item drags along descriptions and five thumbnail URLs.
+# List masks always keep etag + nextPageToken (see _list_fields), _iter_pages needs them.
+CHANNEL_FIELDS = "items(id,snippet/title)"
+PLAYLISTS_FIELDS = "items(id,snippet/title,contentDetails/itemCount,status/privacyStatus)"
+PLAYLIST_INSERT_FIELDS = "id,snippet/title,status/privacyStatus"
+PLAYLIST_ITEMS_FIELDS = "items(id,snippet(title,position,videoOwnerChannelTitle),contentDetails/videoId)"
+INSERT_FIELDS = "id,snippet(title,position,videoOwnerChannelTitle,resourceId/videoId)"
+SEARCH_FIELDS = "items(id/videoId,snippet(title,channelTitle))"
+VIDEOS_PARTS = "contentDetails,status,statistics"
+VIDEOS_FIELDS = (
+    "items(id,contentDetails(duration,regionRestriction),"
+    "status(privacyStatus,uploadStatus),statistics/viewCount)"
+)
+
+
+def _split_top_level(fields: str) -> List[str]:
+    """'a,b(c,d),e/f' -> ['a', 'b(c,d)', 'e/f']"""
+    parts, depth, current = [], 0, ""
+    for ch in fields:
+        if ch == "," and depth == 0:
+            parts.append(current.strip())
+            current = ""
+            continue
+        depth += {"(": 1, ")": -1}.get(ch, 0)
+        current += ch
+    if current.strip():
+        parts.append(current.strip())
+    return parts
+
+
+def _list_fields(fields: Optional[str]) -> Optional[str]:
+    """Make sure a list mask still has etag (304 revalidation) and nextPageToken (paging)."""
+    if not fields:
+        return None  # full response
+    parts = _split_top_level(fields)
+    for needed in ("nextPageToken", "etag"):
+        if needed not in parts:
+            parts.insert(0, needed)
+    return ",".join(parts)
+
+
+def _cached_fields_current(items: List[Dict[str, Any]], record) -> bool:
+    # a page cached before `record` gained a field would keep answering 304 with
+    # that field missing forever; download it again instead
+    return not items or all(f.name in items[0] for f in dataclasses.fields(record))
+
+
+_discovery_lock = threading.Lock()
+_discovery_doc: Optional[Dict[str, Any]] = None
+
+
+def discovery_document() -> Optional[Dict[str, Any]]:
+    """
+    The youtube v3 discovery document shipped inside google-api-python-client,
+    parsed once per process (None if this version of the library has no static copy).
+    """
+    global _discovery_doc
+    with _discovery_lock:
+        if _discovery_doc is None:
+            from googleapiclient import discovery_cache
+
+            raw = discovery_cache.get_static_doc("youtube", "v3")
+            if raw:
+                _discovery_doc = json.loads(raw)
+        return _discovery_doc
+
+
+def build_service(credentials) -> Any:
+    """build("youtube", "v3") without fetching or re-parsing the discovery document."""
+    from googleapiclient.discovery import build, build_from_document
+
+    document = discovery_document()
+    if document is None:
+        return build("youtube", "v3", credentials=credentials)
+    # googleapiclient fixes up method descriptions in place, which is idempotent,
+    # so building again from the same dict (re-login) gives the same service
+    with _discovery_lock:
+        return build_from_document(document, credentials=credentials)
+
+
+class _CountingHttp:
+    """
+    A thread's transport, counting bytes sent (URL + body) and received (decoded
+    response body) for Metrics. Everything else is passed through to the real one.
+    """
+
+    def __init__(self, http: Any) -> None:
+        self._http = http
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    def request(self, uri, method="GET", *args, **kwargs):
+        body = kwargs.get("body", args[0] if args else None)
+        self.bytes_out += len(uri) + (len(body) if body else 0)
+        resp, content = self._http.request(uri, method, *args, **kwargs)
+        self.bytes_in += len(content or b"")
+        return resp, content
+
+    def __getattr__(self, name: str) -> Any:
+        # googleapiclient also reads e.g. .credentials off the transport
+        return getattr(self._http, name)
+
 
 class YouTubeClient:
     """
     Wraps OAuth + YouTube Data API calls.
 
-    Tracks approximate quota usage *in this session* based on known costs.
+    Tracks approximate quota usage based on known costs, charged per HTTP request
+    actually sent: quota_used_units for this session, self.ledger for today
+    (persisted per Cloud project, see quota_ledger.py).
     This is NOT the real "remaining quota" from Google (they don't expose it :\ ).
+
+    Safe to call from worker threads: every thread executes requests on its own
+    httplib2 transport (see _http), only the discovery-built service is shared.
+
+    Every round-trip is also recorded in self.metrics (latency, bytes, retries,
+    units per endpoint, see metrics.py).
     """
     # SECURITY NOTE: this implementation stores OAuth tokens in a pickle file, which is not secure for shared environments. Use at your own risk and add to gitignore
-    def __init__(self, token_file: str = "token.pickle") -> None:
+    def __init__(
+        self,
+        token_file: str = "token.pickle",
+        cache_file: Optional[str] = CACHE_FILE,
+        ledger: Optional[QuotaLedger] = None,
+        search_cache_file: Optional[str] = SEARCH_CACHE_FILE,
+        retry_policy: Optional[RetryPolicy] = None,
+        requests_per_second: Optional[float] = REQUESTS_PER_SECOND,
+        library_file: Optional[str] = LIBRARY_FILE,
+        metrics: Optional[Metrics] = None,
+        video_cache_file: Optional[str] = VIDEO_CACHE_FILE,
+    ) -> None:
         self.token_file = token_file
         self.creds = None
         self.service = None
         self.quota_used_units: int = 0  # session-only estimate
+        self._local = threading.local()  # per-thread http transports
+        self._quota_lock = threading.Lock()
+        # ETag-aware list cache on disk; pass cache_file=None to always download
+        self.cache: Optional[PlaylistCache] = PlaylistCache(cache_file) if cache_file else None
+        self.ledger = ledger or QuotaLedger(project_id_from_client_secrets(CLIENT_SECRET_FILE))
+        # search.list memoization (memory LRU + disk TTL); not per account, kept on logout
+        self.search_cache: Optional[SearchCache] = (
+            SearchCache(search_cache_file) if search_cache_file else None
+        )
+        # videos.list details (duration, availability) with a TTL, see video_details
+        self.video_cache: Optional[VideoCache] = (
+            VideoCache(video_cache_file) if video_cache_file else None
+        )
+        # video_id -> playlists index over everything we've listed (duplicates, skip on copy)
+        self.library: Optional[LibraryIndex] = LibraryIndex(library_file) if library_file else None
+        # transient errors are retried with backoff; requests_per_second=None disables the limiter
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.rate_limiter: Optional[TokenBucket] = (
+            TokenBucket(requests_per_second) if requests_per_second else None
+        )
+        # pass one in to keep counting across re-logins (HomePage does)
+        self.metrics = metrics or Metrics()
 
     # ------------------------------------------------------------------
     # Authentication
     # ------------------------------------------------------------------
 
-    def authenticate(self) -> None:
+    def authenticate(self, interactive: bool = True) -> bool:
         """
         Run (or reuse) OAuth flow and build the YouTube client.
+        With interactive=False only a saved (refreshable) token is used, no browser;
+        returns False if that isn't enough to sign in.
         """
         creds = None
 
@@ -59,6 +245,8 @@ class YouTubeClient:
 
         # Refresh if needed
         if creds and creds.expired and creds.refresh_token:
+            from google.auth.transport.requests import Request
+
             try:
                 creds.refresh(Request())
             except Exception:
@@ -66,12 +254,16 @@ class YouTubeClient:
 
         # If still no valid creds, start new OAuth flow
         if not creds or not creds.valid:
+            if not interactive:
+                return False
             if not os.path.exists(CLIENT_SECRET_FILE):
                 raise FileNotFoundError(
                     f"Missing {CLIENT_SECRET_FILE}. "
                     "Download it from the Google Cloud Console."
                 )
 
+            from google_auth_oauthlib.flow import InstalledAppFlow
+
             flow = InstalledAppFlow.from_client_secrets_file(
                 CLIENT_SECRET_FILE, SCOPES
             )
@@ -86,7 +278,8 @@ class YouTubeClient:
                 pass
 
         self.creds = creds
-        self.service = build("youtube", "v3", credentials=creds)
+        self.service = build_service(creds)
+        return True
 
     def is_authenticated(self) -> bool:
         return self.service is not None
@@ -95,8 +288,158 @@ class YouTubeClient:
     # Helper: track quota
     # ------------------------------------------------------------------
 
-    def _add_quota_usage(self, endpoint: str) -> None:
-        self.quota_used_units += QUOTA_COST.get(endpoint, 0)
+    def _add_quota_usage(self, endpoint: str, count: int = 1) -> None:
+        units = QUOTA_COST.get(endpoint, 0) * count
+        with self._quota_lock:
+            self.quota_used_units += units
+        self.ledger.charge(endpoint, units)
+        self.metrics.record_units(endpoint, units)
+
+    @staticmethod
+    def _endpoint_of(request) -> Optional[str]:
+        # googleapiclient requests carry e.g. methodId="youtube.playlistItems.list"
+        method_id = getattr(request, "methodId", None)
+        if not method_id:
+            return None
+        return method_id.split(".", 1)[-1]
+
+    # ------------------------------------------------------------------
+    # Helper: per-thread HTTP transport
+    # ------------------------------------------------------------------
+
+    def _http(self) -> Any:
+        """
+        Return an authorized transport (AuthorizedHttp) owned by the calling thread.
+        httplib2.Http is not thread-safe, so the one baked into self.service
+        must never be shared between the UI thread and background workers.
+        """
+        local = self._local
+        if getattr(local, "http", None) is None or local.creds is not self.creds:
+            import httplib2
+            from google_auth_httplib2 import AuthorizedHttp
+
+            local.http = _CountingHttp(AuthorizedHttp(self.creds, http=httplib2.Http()))
+            local.creds = self.creds
+        return local.http
+
+    def _execute(self, request) -> Any:
+        """
+        Execute a googleapiclient request on this thread's transport.
+        Every single request is charged here (so each page of a list counts);
+        batch sub-requests are charged by _execute_batch instead.
+        """
+        endpoint = self._endpoint_of(request)
+        if endpoint:
+            # charged once, however many retries _send needs
+            self._add_quota_usage(endpoint)
+        return self._send(request, endpoint=endpoint)
+
+    def _send(
+        self,
+        request,
+        tokens: int = 1,
+        endpoint: Optional[str] = None,
+        idempotent: Optional[bool] = None,
+    ) -> Any:
+        """
+        The actual HTTP round-trip: wait for the rate limiter, then retry transient
+        failures (5xx, rateLimitExceeded, backendError, dropped connections) with
+        exponential backoff + jitter (or the server's Retry-After). Anything else is
+        raised straight away. Inserts (NON_IDEMPOTENT_ENDPOINTS, or idempotent=False)
+        are only retried when the error proves nothing was added, see is_retryable.
+        tokens = API requests in it (batch size), endpoint = what metrics file it under.
+        """
+        endpoint = endpoint or self._endpoint_of(request) or "other"
+        if idempotent is None:
+            idempotent = endpoint not in NON_IDEMPOTENT_ENDPOINTS
+        metrics = self.metrics
+        attempt = 0
+        while True:
+            if self.rate_limiter:
+                metrics.record_throttle(endpoint, self.rate_limiter.acquire(tokens))
+            http = self._http()
+            bytes_in = getattr(http, "bytes_in", 0)
+            bytes_out = getattr(http, "bytes_out", 0)
+            start = time.perf_counter()
+            outcome = "ok"
+            try:
+                return request.execute(http=http)
+            except Exception as e:
+                not_modified = isinstance(e, HttpError) and e.resp.status == 304
+                outcome = "not_modified" if not_modified else "error"
+                if attempt >= self.retry_policy.max_retries or not is_retryable(e, idempotent):
+                    raise
+                metrics.record_retry(endpoint)
+                self.retry_policy.sleep(attempt, e)
+                attempt += 1
+            finally:
+                metrics.record_call(
+                    endpoint,
+                    time.perf_counter() - start,
+                    requests=tokens,
+                    outcome=outcome,
+                    bytes_in=getattr(http, "bytes_in", 0) - bytes_in,
+                    bytes_out=getattr(http, "bytes_out", 0) - bytes_out,
+                )
+
+    # ------------------------------------------------------------------
+    # Helper: paged lists with ETag revalidation
+    # ------------------------------------------------------------------
+
+    def _iter_pages(self, list_key: str, request, list_next, record):
+        """
+        Yield each page of a list request as a list of `record`s (models.py types).
+
+        If the page is in self.cache, its ETag is sent as If-None-Match and a 304
+        answer is served from disk (pages are revalidated one by one, since each
+        page has its own ETag).
+        """
+        cache = self.cache
+        page_index = 0
+        page_token = None
+
+        while request is not None:
+            # list_next() shallow-copies the previous request, headers dict included
+            request.headers = dict(request.headers)
+            request.headers.pop("If-None-Match", None)
+
+            cached = cache.get_page(list_key, page_index) if cache else None
+            if (
+                cached and cached["etag"] and cached["page_token"] == page_token
+                and _cached_fields_current(cached["items"], record)
+            ):
+                request.headers["If-None-Match"] = cached["etag"]
+            else:
+                cached = None
+
+            try:
+                resp = self._execute(request)
+            except HttpError as e:
+                if cached is None or e.resp.status != 304:
+                    raise
+                cache.record("not_modified")
+                cache.record("hits")
+                items = [record.from_dict(d) for d in cached["items"]]
+                next_page_token = cached["next_page_token"]
+            else:
+                items = [record.from_resource(it) for it in resp.get("items", [])]
+                next_page_token = resp.get("nextPageToken")
+                if cache:
+                    cache.record("misses")
+                    cache.put_page(
+                        list_key, page_index, page_token, next_page_token,
+                        resp.get("etag"), [it.to_dict() for it in items],
+                    )
+
+            yield items
+
+            page_index += 1
+            page_token = next_page_token
+            # list_next only needs nextPageToken from the previous response
+            request = list_next(request, {"nextPageToken": next_page_token})
+
+        if cache:
+            cache.trim(list_key, page_index)
 
     # ------------------------------------------------------------------
     # Basic info (channel)
@@ -110,13 +453,8 @@ class YouTubeClient:
         if not self.service:
             raise RuntimeError("YouTube client is not authenticated.")
 
-        self._add_quota_usage("playlists.list")  # close enough; channels.list also cost 1 quota
-
-        resp = (
-            self.service.channels()
-            .list(part="snippet", mine=True)
-            .execute()
-        )
+        request = self.service.channels().list(part="snippet", mine=True, fields=CHANNEL_FIELDS)
+        resp = self._execute(request)
         items = resp.get("items", [])
         if not items:
             return {"channel_id": None, "title": None}
@@ -129,81 +467,121 @@ class YouTubeClient:
     # ------------------------------------------------------------------
     # Playlists
     # ------------------------------------------------------------------
-    # change max_result as needed, but more than 50 playlist is crazy
-    def list_playlists(self, max_results: int = 50) -> List[Dict[str, Any]]:
+    # max_results is the page size (API max 50), every page is fetched either way
+    def list_playlists(
+        self, max_results: int = PAGE_SIZE, fields: Optional[str] = PLAYLISTS_FIELDS
+    ) -> List[Playlist]:
         """
-        Return a list of playlists the user owns.
-        Each item is a dict with keys: id, title, item_count, privacy_status.
+        Return a list of playlists the user owns (models.Playlist:
+        id, title, item_count, privacy_status).
+        fields is the partial-response mask (None = everything).
         """
         if not self.service:
             raise RuntimeError("YouTube client is not authenticated.")
 
-        self._add_quota_usage("playlists.list")
-
         playlists = []
         request = self.service.playlists().list(
             part="snippet,contentDetails,status",
             mine=True,
-            maxResults=max_results,
+            maxResults=min(max_results, PAGE_SIZE),
+            fields=_list_fields(fields),
         )
 
-        while request is not None:
-            resp = request.execute()
-            for item in resp.get("items", []):
-                playlists.append(
-                    {
-                        "id": item.get("id"),
-                        "title": item.get("snippet", {}).get("title"),
-                        "item_count": item.get("contentDetails", {}).get("itemCount"),
-                        "privacy_status": item.get("status", {}).get("privacyStatus"),
-                    }
-                )
-
-            request = self.service.playlists().list_next(request, resp)
+        for page in self._iter_pages(
+            MY_PLAYLISTS_KEY,
+            request,
+            self.service.playlists().list_next,
+            Playlist,
+        ):
+            playlists.extend(page)
 
         return playlists
 
+    def create_playlist(
+        self, title: str, privacy_status: str = "private", description: str = ""
+    ) -> Playlist:
+        """Create an (empty) playlist on the user's channel. Costs 50 units."""
+        if not self.service:
+            raise RuntimeError("YouTube client is not authenticated.")
+
+        body = {
+            "snippet": {"title": title, "description": description},
+            "status": {"privacyStatus": privacy_status},
+        }
+        request = self.service.playlists().insert(
+            part="snippet,status", body=body, fields=PLAYLIST_INSERT_FIELDS
+        )
+        playlist = Playlist.from_resource(self._execute(request))
+        playlist.item_count = 0
+        if self.cache:
+            self.cache.invalidate(MY_PLAYLISTS_KEY)
+        if self.library:
+            # known to be empty, later skip_existing checks need no listing
+            self.library.replace_playlist(playlist.id, [])
+        return playlist
+
     # ------------------------------------------------------------------
     # Playlist items (videos in a playlist)
     # ------------------------------------------------------------------
 
     def list_playlist_items(
-        self, playlist_id: str, max_results: int = 500 # pulls 500 songs per playlist, increase if needed
-    ) -> List[Dict[str, Any]]:
+        self, playlist_id: str, max_results: int = PAGE_SIZE, limit: Optional[int] = None
+    ) -> List[PlaylistItem]:
         """
-        Return playlist items (videos) in a playlist.
-        Each item has id (playlistItemId), video_id, title, position.
+        Return playlist items (videos) in a playlist, as models.PlaylistItem
+        (playlist_item_id, video_id, title, position).
+        max_results is the page size (API max 50); limit stops after that many items.
         """
-        if not self.service:
-            raise RuntimeError("YouTube client is not authenticated.")
+        return list(self.iter_playlist_items(playlist_id, max_results, limit))
 
-        self._add_quota_usage("playlistItems.list")
+    def iter_playlist_items(
+        self, playlist_id: str, max_results: int = PAGE_SIZE, limit: Optional[int] = None
+    ) -> Iterator[PlaylistItem]:
+        """Like list_playlist_items, but yields items as pages arrive."""
+        count = 0
+        if limit is not None and limit <= 0:
+            return
+        for page in self.iter_playlist_item_pages(playlist_id, max_results):
+            for item in page:
+                yield item
+                count += 1
+                if limit is not None and count >= limit:
+                    return
 
-        items: List[Dict[str, Any]] = []
+    def iter_playlist_item_pages(
+        self,
+        playlist_id: str,
+        max_results: int = PAGE_SIZE,
+        fields: Optional[str] = PLAYLIST_ITEMS_FIELDS,
+    ) -> Iterator[List[PlaylistItem]]:
+        """
+        Yield playlist items one page (one HTTP request) at a time, so callers can
+        show the first videos after a single round-trip. Stop iterating to stop paging.
+        fields is the partial-response mask (None = everything).
+        """
+        if not self.service:
+            raise RuntimeError("YouTube client is not authenticated.")
 
         request = self.service.playlistItems().list(
             part = "snippet,contentDetails",
             playlistId = playlist_id,
-            maxResults = max_results,
+            maxResults = min(max_results, PAGE_SIZE),
+            fields = _list_fields(fields),
         )
 
-        while request is not None:
-            resp = request.execute()
-            for it in resp.get("items", []):
-                snippet = it.get("snippet", {})
-                content = it.get("contentDetails", {})
-                items.append(
-                    {
-                        "playlist_item_id": it.get("id"),
-                        "video_id": content.get("videoId"),
-                        "title": snippet.get("title"),
-                        "position": snippet.get("position"),
-                    }
-                )
-
-            request = self.service.playlistItems().list_next(request, resp)
+        listed: List[PlaylistItem] = []
+        for page in self._iter_pages(
+            playlist_items_key(playlist_id),
+            request,
+            self.service.playlistItems().list_next,
+            PlaylistItem,
+        ):
+            listed.extend(page)
+            yield page
 
-        return items
+        # only reached if the caller read every page: now we know the whole playlist
+        if self.library:
+            self.library.replace_playlist(playlist_id, listed)
 
     # ------------------------------------------------------------------
     # CRUD on playlist items
@@ -213,14 +591,40 @@ class YouTubeClient:
         if not self.service:
             raise RuntimeError("YouTube client is not authenticated.")
 
-        self._add_quota_usage("playlistItems.delete")
-        self.service.playlistItems().delete(id=playlist_item_id).execute()
+        self._execute(self.service.playlistItems().delete(id=playlist_item_id))
+        if self.cache:
+            self.cache.invalidate_item(playlist_item_id)
+        if self.library:
+            self.library.remove_items([playlist_item_id])
 
-    def insert_playlist_item(self, playlist_id: str, video_id: str) -> None:
+    def insert_playlist_item(self, playlist_id: str, video_id: str) -> PlaylistItem:
+        """
+        Add a video to a playlist.
+        Returns the new models.PlaylistItem, built from the insert response.
+        """
         if not self.service:
             raise RuntimeError("YouTube client is not authenticated.")
 
-        self._add_quota_usage("playlistItems.insert")
+        try:
+            resp = self._execute(self._insert_request(playlist_id, video_id))
+        except Exception as e:
+            if not is_in_doubt(e):
+                raise
+            res = {"key": video_id, "ok": False, "response": None, "error": e}
+            self._settle_in_doubt_inserts(playlist_id, [res])
+            if not res["ok"]:
+                raise res["error"]
+            resp = res["response"]
+            if res.get("recovered"):
+                return res["item"]  # the listing just put it in the cache and library
+        if self.cache:
+            self.cache.invalidate_playlist(playlist_id)
+        item = PlaylistItem.from_resource(resp)
+        if self.library:
+            self.library.add_items(playlist_id, [item])
+        return item
+
+    def _insert_request(self, playlist_id: str, video_id: str) -> Any:
         body = {
             "snippet": {
                 "playlistId": playlist_id,
@@ -230,7 +634,352 @@ class YouTubeClient:
                 },
             }
         }
-        self.service.playlistItems().insert(part="snippet", body=body).execute()
+        return self.service.playlistItems().insert(part="snippet", body=body, fields=INSERT_FIELDS)
+
+    # ------------------------------------------------------------------
+    # Bulk CRUD (batch HTTP requests)
+    # ------------------------------------------------------------------
+
+    def delete_playlist_items(
+        self,
+        playlist_item_ids: Sequence[str],
+        progress: Optional[Callable[[int, int], None]] = None,
+        should_stop: Optional[Callable[[], bool]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Delete many playlist items using batch requests (BATCH_SIZE per HTTP call).
+        Returns one result per *attempted* id, see _execute_batch.
+        """
+        if not self.service:
+            raise RuntimeError("YouTube client is not authenticated.")
+
+        requests = [
+            (pid, self.service.playlistItems().delete(id=pid))
+            for pid in playlist_item_ids
+        ]
+        results = self._execute_batch(
+            requests, progress=progress, should_stop=should_stop
+        )
+        if self.cache:
+            for res in results:
+                self.cache.invalidate_item(res["key"])
+        if self.library:
+            self.library.remove_items(res["key"] for res in results if res["ok"])
+        return results
+
+    def insert_playlist_items(
+        self,
+        playlist_id: str,
+        video_ids: Sequence[str],
+        progress: Optional[Callable[[int, int], None]] = None,
+        should_stop: Optional[Callable[[], bool]] = None,
+        skip_existing: bool = False,
+        recheck: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Add many videos to a playlist using batch requests.
+        Successful results also get an "item" key (a models.PlaylistItem).
+        Note: Google may run the sub-requests of one batch in any order, so the
+        new items are not guaranteed to end up in the same order as video_ids.
+
+        skip_existing: don't insert videos that are already in the target (see
+        existing_videos) or repeated in video_ids. Those get a result with ok=True,
+        skipped=True and cost no API call (50 units saved each). recheck=True always
+        re-lists the target instead of trusting the index (replaying a crashed chunk).
+        Results still come back in video_ids order, as a prefix if stopped early.
+        """
+        if not self.service:
+            raise RuntimeError("YouTube client is not authenticated.")
+
+        skipped: List[str] = []
+        to_insert = list(video_ids)
+        if skip_existing:
+            present = self.existing_videos(playlist_id, video_ids, recheck=recheck)
+            to_insert, skipped = split_new_videos(video_ids, present)
+
+        requests = [(vid, self._insert_request(playlist_id, vid)) for vid in to_insert]
+        results = self._execute_batch(
+            requests, progress=progress, should_stop=should_stop
+        )
+        in_doubt = [res for res in results if not res["ok"] and is_in_doubt(res["error"])]
+        if in_doubt:
+            self._settle_in_doubt_inserts(playlist_id, in_doubt)
+        for res in results:
+            if res["ok"] and "item" not in res:
+                res["item"] = PlaylistItem.from_resource(res["response"])
+        if self.cache and results:
+            self.cache.invalidate_playlist(playlist_id)
+        if self.library:
+            self.library.add_items(playlist_id, (res["item"] for res in results if res["ok"]))
+
+        if not skipped:
+            return results
+        return self._merge_skipped(video_ids, to_insert, results)
+
+    def existing_videos(
+        self, playlist_id: str, video_ids: Sequence[str], recheck: bool = False
+    ) -> set:
+        """
+        Which of video_ids are already in the playlist. Answered from self.library
+        when it listed the playlist recently, otherwise the playlist is re-listed
+        first (1 unit per 50 items, mostly 304s) - still far cheaper than a 50 unit
+        insert that only creates a duplicate.
+        """
+        if recheck or not self.library or not self.library.is_fresh(playlist_id):
+            present = {it.video_id for it in self.iter_playlist_items(playlist_id)}
+            if not self.library:
+                return present & set(video_ids)
+        return self.library.present_in(playlist_id, video_ids)
+
+    def index_library(
+        self,
+        playlists: Sequence[Playlist],
+        progress: Optional[Callable[[int, int], None]] = None,
+        should_stop: Optional[Callable[[], bool]] = None,
+    ) -> Dict[str, int]:
+        """
+        Bring self.library up to date for all of `playlists` (the user's full list).
+        Playlists whose indexed item count still matches item_count are not re-listed.
+        Returns {"listed", "unchanged"}.
+        """
+        if not self.library:
+            raise RuntimeError("Library index is disabled.")
+
+        indexed = self.library.indexed_playlists()
+        # playlists deleted since the last scan
+        for playlist_id in set(indexed) - {p.id for p in playlists}:
+            self.library.forget_playlist(playlist_id)
+
+        summary = {"listed": 0, "unchanged": 0}
+        for done, pl in enumerate(playlists, start=1):
+            if should_stop and should_stop():
+                break
+            if pl.id in indexed and indexed[pl.id] == pl.item_count:
+                summary["unchanged"] += 1
+            else:
+                self.list_playlist_items(pl.id)  # replaces its rows in self.library
+                summary["listed"] += 1
+            if progress:
+                progress(done, len(playlists))
+        return summary
+
+    @staticmethod
+    def _merge_skipped(
+        video_ids: Sequence[str], to_insert: List[str], results: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        # walk video_ids in order; the first one that was neither skipped nor attempted
+        # ends the list, so len(results) stays a valid checkpoint for JobQueue
+        attempted = iter(results)
+        pending = iter(to_insert)
+        next_insert = next(pending, None)
+        merged: List[Dict[str, Any]] = []
+        for vid in video_ids:
+            if vid == next_insert:
+                res = next(attempted, None)
+                if res is None:
+                    break
+                merged.append(res)
+                next_insert = next(pending, None)
+            else:
+                merged.append({"key": vid, "ok": True, "skipped": True, "response": None, "error": None})
+        return merged
+
+    def _settle_in_doubt_inserts(self, playlist_id: str, results: List[Dict[str, Any]]) -> None:
+        """
+        Inserts that failed with a 5xx / dropped connection may have happened anyway.
+        Re-list the playlist (1 unit per 50 items, mostly 304s): the videos that are
+        there now count as inserted (ok, item = what the listing shows, recovered=True),
+        the others are safe to send again. Repeats with backoff, like a normal retry.
+        Updates `results` (_execute_batch dicts with key = video_id) in place.
+
+        A video that was already in the playlist before counts as inserted too: in
+        doubt we'd rather skip one duplicate than risk adding two.
+        """
+        pending = results
+        for attempt in range(self.retry_policy.max_retries):
+            self.metrics.record_retry("playlistItems.insert", len(pending))
+            self.retry_policy.sleep(attempt, *(res["error"] for res in pending))
+            if self.cache:
+                self.cache.invalidate_playlist(playlist_id)
+            listed: Dict[str, PlaylistItem] = {}
+            for item in self.iter_playlist_items(playlist_id):
+                listed[item.video_id] = item
+            resend = []
+            for res in pending:
+                item = listed.get(res["key"])
+                if item is not None:
+                    res.update(ok=True, error=None, response=None, item=item, recovered=True)
+                else:
+                    resend.append(res)
+            if not resend:
+                return
+            retried = self._execute_batch(
+                [(res["key"], self._insert_request(playlist_id, res["key"])) for res in resend]
+            )
+            for res, new in zip(resend, retried):
+                res.update(new)
+            pending = [res for res in resend if not res["ok"] and is_in_doubt(res["error"])]
+            if not pending:
+                return
+
+    def _execute_batch(
+        self,
+        requests: List[Tuple[str, Any]],
+        progress: Optional[Callable[[int, int], None]] = None,
+        should_stop: Optional[Callable[[], bool]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Run (key, request) pairs as batch HTTP calls, chunked by BATCH_SIZE.
+
+        Returns a list (input order) of dicts with keys:
+          key, ok (bool), response (dict or None), error (Exception or None)
+        Stops between chunks if should_stop() returns True, so the list can be
+        shorter than `requests`. Quota is counted per sub-request, like Google does.
+        Sub-requests that fail with a retryable error are re-sent in a follow-up batch;
+        inserts only when the error proves they weren't carried out (the others are
+        left to insert_playlist_items, see _settle_in_doubt_inserts).
+        """
+        results: List[Dict[str, Any]] = []
+        total = len(requests)
+
+        for start in range(0, total, BATCH_SIZE):
+            if should_stop and should_stop():
+                break
+
+            chunk = requests[start:start + BATCH_SIZE]
+            chunk_results = [
+                {"key": key, "ok": False, "response": None, "error": None}
+                for key, _ in chunk
+            ]
+
+            def callback(request_id, response, exception, chunk_results=chunk_results):
+                res = chunk_results[int(request_id)]
+                res["ok"] = exception is None
+                res["response"] = response
+                res["error"] = exception
+
+            # one batch HTTP call, but Google bills every sub-request (once, retries aside)
+            charges: Dict[str, int] = {}
+            for _, request in chunk:
+                endpoint = self._endpoint_of(request)
+                charges[endpoint] = charges.get(endpoint, 0) + 1
+            for endpoint, count in charges.items():
+                self._add_quota_usage(endpoint, count)
+            # chunks are all inserts or all deletes in practice
+            batch_endpoint = next(iter(charges)) if len(charges) == 1 else "batch"
+            idempotent = len(charges) == 1 and batch_endpoint not in NON_IDEMPOTENT_ENDPOINTS
+
+            pending = list(range(len(chunk)))
+            attempt = 0
+            while pending:
+                batch = self.service.new_batch_http_request(callback=callback)
+                for i in pending:
+                    batch.add(chunk[i][1], request_id=str(i))
+
+                try:
+                    # sub-requests count against rate limits one by one
+                    self._send(
+                        batch, tokens=len(pending), endpoint=batch_endpoint, idempotent=idempotent
+                    )
+                except Exception as e:
+                    # the whole HTTP call failed (network etc.), blame every item in it
+                    for i in pending:
+                        if not chunk_results[i]["ok"]:
+                            chunk_results[i]["error"] = e
+                    break
+
+                # only the sub-requests that failed transiently go into the next round
+                pending = [
+                    i for i in pending
+                    if not chunk_results[i]["ok"]
+                    and is_retryable(chunk_results[i]["error"], idempotent)
+                ]
+                if not pending or attempt >= self.retry_policy.max_retries:
+                    break
+                self.metrics.record_retry(batch_endpoint, len(pending))
+                self.retry_policy.sleep(attempt, *(chunk_results[i]["error"] for i in pending))
+                attempt += 1
+
+            results.extend(chunk_results)
+            if progress:
+                progress(len(results), total)
+
+        return results
+
+    # ------------------------------------------------------------------
+    # Reordering (playlistItems.update)
+    # ------------------------------------------------------------------
+
+    def plan_reorder(
+        self,
+        playlist_id: str,
+        desired_ids: Union[Sequence[str], Callable[[List[PlaylistItem]], Sequence[str]]],
+    ) -> Tuple[List[PlaylistItem], List[Tuple[PlaylistItem, int]]]:
+        """
+        (current items, moves) to put the playlist in desired_ids order (playlist
+        item ids, or a function of the current items returning them). The current
+        order is re-listed first (1 unit per 50 items, mostly 304s) rather than
+        trusted, since every move position depends on it.
+        moves are (item, position) pairs, see reorder.plan_moves; each costs
+        QUOTA_COST["playlistItems.update"].
+        """
+        current = self.list_playlist_items(playlist_id)
+        by_id = {it.playlist_item_id: it for it in current}
+        if callable(desired_ids):
+            desired_ids = desired_ids(current)
+        try:
+            moves = plan_moves(list(by_id), list(desired_ids))
+        except ValueError:
+            raise ValueError(
+                "The playlist changed on YouTube since it was loaded. Reload it and try again."
+            ) from None
+        return current, [(by_id[key], position) for key, position in moves]
+
+    def reorder_playlist_items(
+        self,
+        playlist_id: str,
+        moves: Sequence[Tuple[PlaylistItem, int]],
+        progress: Optional[Callable[[int, int], None]] = None,
+        should_stop: Optional[Callable[[], bool]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Apply plan_reorder moves, one playlistItems.update each.
+
+        Not batched: Google may run the sub-requests of a batch in any order, and each
+        position only holds after the moves before it. Stops at the first failure
+        (the rest would land in the wrong place) or when should_stop() says so, so
+        the results, {key, ok, response, error} like _execute_batch, may be a prefix.
+        Running plan_reorder again later picks up from wherever it stopped.
+        """
+        if not self.service:
+            raise RuntimeError("YouTube client is not authenticated.")
+
+        results: List[Dict[str, Any]] = []
+        for item, position in moves:
+            if should_stop and should_stop():
+                break
+            body = {
+                "id": item.playlist_item_id,
+                "snippet": {
+                    "playlistId": playlist_id,
+                    "position": position,
+                    "resourceId": {"kind": "youtube#video", "videoId": item.video_id},
+                },
+            }
+            request = self.service.playlistItems().update(part="snippet", body=body, fields="id")
+            try:
+                response = self._execute(request)
+            except Exception as e:
+                results.append({"key": item.playlist_item_id, "ok": False, "response": None, "error": e})
+                break
+            results.append({"key": item.playlist_item_id, "ok": True, "response": response, "error": None})
+            if progress:
+                progress(len(results), len(moves))
+
+        # (the library index only goes by video, its positions catch up on the next listing)
+        if results and self.cache:
+            self.cache.invalidate_playlist(playlist_id)
+        return results
 
     # deprecated: not used as it deletes video from original playlist
     def move_playlist_item(
@@ -248,45 +997,126 @@ class YouTubeClient:
         # Delete from source
         self.delete_playlist_item(source_playlist_item_id)
 
+    # ------------------------------------------------------------------
+    # Video details (videos.list)
+    # ------------------------------------------------------------------
+
+    def video_details(
+        self,
+        video_ids: Sequence[str],
+        progress: Optional[Callable[[int, int], None]] = None,
+        should_stop: Optional[Callable[[], bool]] = None,
+        force_refresh: bool = False,
+    ) -> Dict[str, VideoInfo]:
+        """
+        {video_id: models.VideoInfo} (duration, availability, view count) for video_ids.
+        Ids in self.video_cache come from there for free (unless force_refresh); the
+        rest are looked up VIDEOS_PER_REQUEST per videos.list request (1 unit each),
+        as batch sub-requests, so 2,500 ids per HTTP round-trip.
+        Ids videos.list doesn't return get VideoInfo(found=False). Ids whose request
+        failed (or that weren't reached before should_stop) are left out.
+        progress(done, total) counts ids to look up.
+        """
+        if not self.service:
+            raise RuntimeError("YouTube client is not authenticated.")
+
+        wanted = list(dict.fromkeys(vid for vid in video_ids if vid))
+        found: Dict[str, VideoInfo] = {}
+        if self.video_cache and not force_refresh:
+            found = self.video_cache.get_many(wanted)
+        missing = [vid for vid in wanted if vid not in found]
+        if not missing:
+            return found
+
+        chunks = [
+            missing[start:start + VIDEOS_PER_REQUEST]
+            for start in range(0, len(missing), VIDEOS_PER_REQUEST)
+        ]
+        requests = [
+            (str(index), self.service.videos().list(
+                part=VIDEOS_PARTS, id=",".join(chunk), fields=VIDEOS_FIELDS
+            ))
+            for index, chunk in enumerate(chunks)
+        ]
+        results = self._execute_batch(
+            requests,
+            progress=(
+                (lambda done, total: progress(min(done * VIDEOS_PER_REQUEST, len(missing)), len(missing)))
+                if progress else None
+            ),
+            should_stop=should_stop,
+        )
+
+        fetched: List[VideoInfo] = []
+        for res in results:
+            if not res["ok"]:
+                continue
+            returned = {
+                info.video_id: info
+                for info in map(VideoInfo.from_resource, res["response"].get("items", []))
+            }
+            for vid in chunks[int(res["key"])]:
+                fetched.append(returned.get(vid) or VideoInfo(video_id=vid, found=False))
+        if self.video_cache and fetched:
+            self.video_cache.put_many(fetched)
+        found.update((info.video_id, info) for info in fetched)
+        return found
+
     # ------------------------------------------------------------------
     # Search videos (global YouTube search)
     # ------------------------------------------------------------------
 
-    def search_videos(self, query: str, max_results: int = 10) -> List[Dict[str, Any]]:
+    def search_videos(
+        self, query: str, max_results: int = 10, force_refresh: bool = False
+    ) -> List[SearchResult]:
         """
         Search YouTube (global) for videos by keyword.
-        Each item has: video_id, title, channel_title.
+        Returns models.SearchResult (video_id, title, channel_title).
+        Repeats of a recent search come from self.search_cache for free,
+        unless force_refresh is set.
         """
         if not self.service:
             raise RuntimeError("YouTube client is not authenticated.")
 
-        self._add_quota_usage("search.list")
+        if not force_refresh:
+            cached = self.cached_search(query, max_results)
+            if cached is not None:
+                return cached["results"]
 
-        resp = (
-            self.service.search()
-            .list(
-                part="snippet",
-                type="video",
-                q=query,
-                maxResults=max_results,
-            )
-            .execute()
+        request = self.service.search().list(
+            part="snippet",
+            type="video",
+            q=query,
+            maxResults=max_results,
+            fields=SEARCH_FIELDS,
         )
-        results: List[Dict[str, Any]] = []
-        for item in resp.get("items", []):
-            snippet = item.get("snippet", {})
-            video_id = item.get("id", {}).get("videoId")
-            if not video_id:
-                continue
-            results.append(
-                {
-                    "video_id": video_id,
-                    "title": snippet.get("title"),
-                    "channel_title": snippet.get("channelTitle"),
-                }
+        resp = self._execute(request)
+        results = [SearchResult.from_resource(item) for item in resp.get("items", [])]
+        results = [r for r in results if r is not None]
+
+        if self.search_cache:
+            self.search_cache.put(
+                self._search_cache_key(query, max_results), [r.to_dict() for r in results]
             )
         return results
-    
+
+    def cached_search(self, query: str, max_results: int = 10) -> Optional[Dict[str, Any]]:
+        """
+        Cached results for this search, if any: {"results": [SearchResult], "fetched_at": epoch}.
+        No API call, safe to use from the UI thread.
+        """
+        if not self.search_cache:
+            return None
+        cached = self.search_cache.get(self._search_cache_key(query, max_results))
+        if cached is not None:
+            cached["results"] = [SearchResult.from_dict(d) for d in cached["results"]]
+        return cached
+
+    @staticmethod
+    def _search_cache_key(query: str, max_results: int) -> str:
+        # everything that changes the response has to be part of the key
+        return search_key(query, {"part": "snippet", "type": "video", "maxResults": max_results})
+
     # ------------------------------------------------------------------
     # Logout helper
     # ------------------------------------------------------------------
@@ -298,7 +1128,15 @@ class YouTubeClient:
         # Clear in-memory state
         self.creds = None
         self.service = None
-        self.quota_used_units = 0
+        self._local = threading.local()
+        # cached lists belong to this account
+        if self.cache:
+            self.cache.clear()
+        if self.library:
+            self.library.clear()
+        # another account sees other private videos
+        if self.video_cache:
+            self.video_cache.clear()
         # Delete cached token so OAuth is required next time
         try:
             if os.path.exists(self.token_file):